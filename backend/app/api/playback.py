@@ -1,11 +1,17 @@
 import re
-from datetime import timedelta
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from ..database import get_db
-from ..models import MeetingReport, PlaybackRuntimeSetting
+from ..database import get_db, get_read_db, is_read_only_session
+from ..models import (
+    MeetingReport,
+    MeetingReportTranscriptSegment,
+    PlaybackRuntimeSetting,
+)
 from ..schemas import (
     FeishuLiveRecordItem,
     FeishuLiveRecordsResponse,
@@ -24,6 +30,14 @@ ALLOWED_MODES = {
 }
 ALLOWED_CAROUSEL_SCOPES = {"single", "loop"}
 
+# 实时总结行缓存：key = (report_id, updated_at, limit)。
+# 所有播放屏轮询 live-records，同一版本的新闻只做一次全文正则切分。
+_LIVE_LINES_CACHE_MAX = 256
+_live_lines_cache_lock = threading.Lock()
+_live_lines_cache: "OrderedDict[tuple[int, datetime | None, int], list[str]]" = (
+    OrderedDict()
+)
+
 
 def _split_summary_lines(text: str) -> list[str]:
     if not text.strip():
@@ -156,6 +170,84 @@ def _build_live_summary_lines(report: MeetingReport, limit: int) -> list[str]:
     return merged
 
 
+def _load_transcript_records(
+    db: Session, report: MeetingReport, since_seq: int | None, limit: int
+) -> tuple[list[FeishuLiveRecordItem], int] | None:
+    """从结构化逐字稿读取实时记录与下次拉取游标；该新闻没有逐字稿段落时返回 None。
+
+    since_seq 为空或小于 0 时返回最近 limit 段；否则只返回 seq 大于游标的段落。
+    会议进行中最后一段可能仍在增长（同步时原地刷新），因此返回的最后一段若是
+    逐字稿末尾，游标停在它之前，下次拉取会再次带回该段，客户端按 seq 覆盖。
+    """
+    query = db.query(MeetingReportTranscriptSegment).filter(
+        MeetingReportTranscriptSegment.report_id == report.id
+    )
+    if since_seq is None or since_seq < 0:
+        rows = (
+            query.order_by(MeetingReportTranscriptSegment.seq.desc())
+            .limit(limit)
+            .all()
+        )
+        if not rows:
+            return None
+        rows.reverse()
+        has_more = False
+    else:
+        rows = (
+            query.filter(MeetingReportTranscriptSegment.seq > since_seq)
+            .order_by(MeetingReportTranscriptSegment.seq.asc())
+            .limit(limit + 1)
+            .all()
+        )
+        if not rows and query.first() is None:
+            return None
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+    if not rows:
+        next_seq = since_seq if since_seq is not None else -1
+    elif has_more:
+        next_seq = rows[-1].seq
+    else:
+        next_seq = rows[-1].seq - 1
+
+    base_time = report.meeting_time or now_local_naive()
+    records = [
+        FeishuLiveRecordItem(
+            timestamp=base_time + timedelta(milliseconds=row.start_ms),
+            speaker=(row.speaker or "会议记录").strip() or "会议记录",
+            content=row.text,
+            seq=row.seq,
+        )
+        for row in rows
+    ]
+    return records, next_seq
+
+
+def _get_live_summary_lines(report: MeetingReport, limit: int) -> list[str]:
+    key = (report.id, report.updated_at, limit)
+    with _live_lines_cache_lock:
+        cached = _live_lines_cache.get(key)
+        if cached is not None:
+            _live_lines_cache.move_to_end(key)
+            return list(cached)
+
+    lines = _build_live_summary_lines(report, limit=limit)
+    with _live_lines_cache_lock:
+        _live_lines_cache[key] = lines
+        _live_lines_cache.move_to_end(key)
+        while len(_live_lines_cache) > _LIVE_LINES_CACHE_MAX:
+            _live_lines_cache.popitem(last=False)
+    return list(lines)
+
+
+def invalidate_live_summary_cache(report_id: int) -> None:
+    """新闻内容变更后清理该新闻所有版本的实时总结行缓存。"""
+    with _live_lines_cache_lock:
+        for key in [k for k in _live_lines_cache if k[0] == report_id]:
+            _live_lines_cache.pop(key, None)
+
+
 def _get_or_create_runtime_setting(db: Session) -> PlaybackRuntimeSetting:
     row = (
         db.query(PlaybackRuntimeSetting)
@@ -171,6 +263,9 @@ def _get_or_create_runtime_setting(db: Session) -> PlaybackRuntimeSetting:
         selected_report_id=None,
         updated_at=now_local_naive(),
     )
+    if is_read_only_session(db):
+        # 只读副本上尚无配置行时返回默认值，不在副本上写入。
+        return row
     db.add(row)
     db.commit()
     db.refresh(row)
@@ -187,7 +282,7 @@ def _to_mode_response(row: PlaybackRuntimeSetting) -> PlaybackModeResponse:
 
 
 @router.get("/mode", response_model=PlaybackModeResponse)
-def get_playback_mode(db: Session = Depends(get_db)):
+def get_playback_mode(db: Session = Depends(get_read_db)):
     row = _get_or_create_runtime_setting(db)
     return _to_mode_response(row)
 
@@ -228,8 +323,10 @@ def update_playback_mode(
 def get_live_records(
     limit: int = Query(12, ge=1, le=100),
     report_id: int | None = Query(None),
-    db: Session = Depends(get_db),
+    since_seq: int | None = Query(None, ge=-1),
+    db: Session = Depends(get_read_db),
 ):
+    runtime = None
     report = None
     if report_id is not None:
         report = db.get(MeetingReport, report_id)
@@ -246,7 +343,22 @@ def get_live_records(
     if report is None:
         return FeishuLiveRecordsResponse(source="feishu_pending", records=[])
 
-    lines = _build_live_summary_lines(report, limit=limit)
+    # meeting_live 模式或显式传入游标时，走真实逐字稿段落（带真实时间与增量游标）。
+    if since_seq is None and runtime is None:
+        runtime = _get_or_create_runtime_setting(db)
+    if since_seq is not None or (runtime and runtime.mode == "meeting_live"):
+        transcript = _load_transcript_records(
+            db, report, since_seq=since_seq, limit=limit
+        )
+        if transcript is not None:
+            transcript_records, next_seq = transcript
+            return FeishuLiveRecordsResponse(
+                source="feishu_transcript",
+                records=transcript_records,
+                next_seq=next_seq,
+            )
+
+    lines = _get_live_summary_lines(report, limit=limit)
 
     now = now_local_naive()
     records: list[FeishuLiveRecordItem] = []
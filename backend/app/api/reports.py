@@ -1,9 +1,16 @@
+import base64
 import csv
 import hashlib
 import io
 import json
+import shutil
+import tempfile
 import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from pathlib import Path
 from uuid import uuid4
 
 from fastapi import (
@@ -13,20 +20,30 @@ from fastapi import (
     File,
     HTTPException,
     Query,
+    Request,
+    Response,
     UploadFile,
 )
-from openpyxl import load_workbook
-from sqlalchemy import desc, func
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, delete, desc, func, insert, or_, select, update
+from sqlalchemy.orm import Session, undefer
 from sqlalchemy.exc import OperationalError
 
-from ..database import SessionLocal, get_db
+from ..carousel_warmer import (
+    note_carousel_activity,
+    record_warm_result,
+    warm_backoff_active,
+)
+from ..database import get_db, get_read_db
+from ..write_queue import background_session, run_background_write
+from ..responses import FastJSONResponse
+from .playback import invalidate_live_summary_cache
 from ..models import (
     MeetingReport,
     MeetingReportHighlight,
     MeetingReportQuestion,
     MeetingReportReflection,
     MeetingReportReflectionAudio,
+    MeetingReportTranscriptSegment,
     MeetingReportTranslation,
 )
 from ..config import settings
@@ -50,11 +67,14 @@ from ..schemas import (
     GeneratePreviewRequest,
     GeneratePreviewResponse,
     GenerateResponse,
+    ImportJobItemStatus,
+    ImportJobStatusResponse,
     ImportResponse,
     PlaybackModeResponse,
     PlaybackModeUpdateRequest,
     PlaybackQueueItem,
     PlaybackQueueResponse,
+    AudioRefItem,
     QuestionItem,
     QuestionResponse,
     ReflectionResponse,
@@ -64,10 +84,16 @@ from ..schemas import (
     ReportDetail,
     ReportListItem,
     ReportListResponse,
+    ReportSearchItem,
+    ReportSearchResponse,
     ReportTranslationsResponse,
     SynthesizeAudioRequest,
     SynthesizeAudioResponse,
+    TranscriptSegmentItem,
+    TranscriptSegmentsResponse,
+    TranscriptSyncResponse,
     ReportUpdate,
+    SourceImportItem,
     SourceImportRequest,
     SourceImportResponse,
     TranslationPrepareResponse,
@@ -80,17 +106,28 @@ from ..schemas import (
 )
 from ..services.generator import (
     QUESTION_PERSONA_PROMPTS,
+    AudioVariants,
+    audio_digest,
+    compressed_audio_format,
     generate_meeting_chapters_from_transcript,
     generate_sharp_questions,
     generate_script_and_highlights,
     normalize_question_persona,
-    synthesize_script_audio_pcm_base64,
+    synthesize_script_audio_variants,
     translate_report_package,
     translate_script,
 )
+from ..services.playback_changes import (
+    changed_reports_since,
+    current_change_version,
+    record_report_changes,
+)
+from ..services.search import index_reports, search_reports
+from ..services.tts_store import synthesize_audio_shared
 from ..services.feishu_import import (
     FeishuApiClient,
     FeishuMeetingImportItem as FeishuRawItem,
+    FeishuTranscriptSegment,
 )
 from ..utils.timezone import now_local_naive
 
@@ -109,6 +146,23 @@ LANGUAGE_TARGETS = {
 TEXT_RENDER_LANGUAGE_KEYS = {"zh", "en"}
 QUESTION_PERSONA_KEYS = set(QUESTION_PERSONA_PROMPTS.keys())
 
+# 文件批量导入每批 INSERT 的行数。
+_IMPORT_BATCH_SIZE = 500
+
+# 批量导入任务：进程内任务状态 + 按来源分组的线程池（飞书接口 / 文件解析各自排队，互不占用）；
+# 导入后的译文刷新与反思音频走单独的后续任务线程池，不阻塞排队中的导入。
+IMPORT_SOURCE_TYPES = {"feishu_meeting", "feishu_minutes", "feishu_docx"}
+_IMPORT_JOB_HISTORY_MAX = 200
+_import_job_lock = threading.Lock()
+_import_job_state: dict[str, dict] = {}
+_import_executors: dict[str, ThreadPoolExecutor] = {}
+_import_followup_executor: ThreadPoolExecutor | None = None
+
+# 游标分页的近似总数缓存：key = status 过滤条件。
+_REPORT_COUNT_TTL_SEC = 30.0
+_report_count_lock = threading.Lock()
+_report_count_cache: dict[str | None, tuple[float, int]] = {}
+
 _translation_job_lock = threading.Lock()
 _translation_job_state: dict[tuple[int, str], dict] = {}
 
@@ -117,6 +171,91 @@ def _resolve_render_mode(language_key: str) -> str:
     return "text" if language_key in TEXT_RENDER_LANGUAGE_KEYS else "audio"
 
 
+AUDIO_FORMATS = ("pcm", "opus", "mp3")
+
+
+def _parse_audio_formats(audio_format: str | None) -> list[str]:
+    # 客户端按优先级传入可接受的格式，如 "opus,mp3,pcm"；未传时保持 PCM，兼容数字人驱动。
+    formats = [
+        x.strip().lower()
+        for x in (audio_format if isinstance(audio_format, str) else "").split(",")
+    ]
+    formats = [x for x in formats if x in AUDIO_FORMATS]
+    return formats or ["pcm"]
+
+
+AUDIO_MEDIA_TYPES = {"pcm": "audio/pcm", "opus": "audio/ogg", "mp3": "audio/mpeg"}
+
+
+def _has_audio(row) -> bool:
+    # 以字节数判断，不触发音频大字段加载。
+    return bool(row.audio_pcm_bytes or row.audio_compressed_bytes)
+
+
+def _pick_audio_digest(row, audio_formats: list[str]) -> tuple[str, int, str]:
+    """按客户端偏好挑选可用变体的 (格式, 字节数, SHA-256)，只读元数据列。"""
+    for audio_format in audio_formats:
+        if audio_format == "pcm" and row.audio_pcm_bytes:
+            return "pcm", row.audio_pcm_bytes, row.audio_pcm_sha256
+        if (
+            audio_format == row.audio_compressed_format
+            and row.audio_compressed_bytes
+        ):
+            return audio_format, row.audio_compressed_bytes, row.audio_compressed_sha256
+    return "", 0, ""
+
+
+def _audio_ref(report_id: int, row, audio_formats: list[str]) -> dict | None:
+    audio_format, size, sha256 = _pick_audio_digest(row, audio_formats)
+    if not audio_format:
+        return None
+    return {
+        "report_id": report_id,
+        "language_key": row.language_key,
+        "audio_format": audio_format,
+        # v 为内容哈希前缀，音频变化时 URL 随之变化，客户端可长期缓存。
+        "url": (
+            f"{router.prefix}/{report_id}/audio/{row.language_key}"
+            f"?audio_format={audio_format}&v={sha256[:16]}"
+        ),
+        "bytes": size,
+        "sha256": sha256,
+    }
+
+
+def _pick_audio_variant(row, audio_formats: list[str]) -> tuple[str, str]:
+    """按客户端偏好挑选已落库的音频变体，返回 (格式, base64)；都不可用时返回空串。"""
+    for audio_format in audio_formats:
+        if audio_format == "pcm":
+            audio = (row.audio_pcm_base64 or "").strip()
+        elif audio_format == row.audio_compressed_format:
+            audio = (row.audio_compressed_base64 or "").strip()
+        else:
+            audio = ""
+        if audio:
+            return audio_format, audio
+    return "", ""
+
+
+def _audio_fields(audio_format: str, audio: str) -> dict[str, str]:
+    # PCM 沿用 audio_pcm_base64 字段；压缩格式放在 audio_base64，避免同一音频重复下发。
+    if audio_format == "pcm":
+        return {"audio_format": "pcm", "audio_pcm_base64": audio, "audio_base64": ""}
+    return {"audio_format": audio_format, "audio_pcm_base64": "", "audio_base64": audio}
+
+
+def _store_audio_variants(row, audio: AudioVariants | None) -> None:
+    audio = audio or AudioVariants()
+    row.audio_pcm_base64 = audio.pcm_base64.strip()
+    row.audio_compressed_base64 = audio.compressed_base64.strip()
+    row.audio_compressed_format = audio.compressed_format
+    row.audio_pcm_bytes, row.audio_pcm_sha256 = audio_digest(row.audio_pcm_base64)
+    (
+        row.audio_compressed_bytes,
+        row.audio_compressed_sha256,
+    ) = audio_digest(row.audio_compressed_base64)
+
+
 def _normalize_source_language(language_key: str | None) -> str:
     key = (language_key or "").strip().lower()
     if key in LANGUAGE_TARGETS:
@@ -180,9 +319,9 @@ def _get_translation_job_state(report_id: int, language_key: str) -> dict | None
 
 def _run_prepare_translation_job(report_id: int, language_key: str) -> None:
     _set_translation_job_state(report_id, language_key, "translating")
-    db = SessionLocal()
+    db = background_session()
     try:
-        report = db.get(MeetingReport, report_id)
+        report = _get_report_with_content(db, report_id)
         if report is None:
             _set_translation_job_state(report_id, language_key, "failed", "记录不存在")
             return
@@ -201,6 +340,95 @@ def _run_prepare_translation_job(report_id: int, language_key: str) -> None:
         db.close()
 
 
+def warm_report_language(report_id: int, language_key: str) -> str:
+    """确保新闻在该语种可直接播报（供轮播预热调用），返回执行的动作。
+
+    缺译文时走与手动准备相同的翻译任务（含音频），只缺音频时仅补合成音频。
+    以相同内容失败过的条目在退避期内不再重试。
+    返回值：ready / translated / audio / pending / failed / backoff / skipped。
+    """
+    if language_key not in LANGUAGE_TARGETS:
+        return "skipped"
+    state = _get_translation_job_state(report_id, language_key)
+    if state and state["status"] == "translating":
+        return "pending"
+    render_mode = _resolve_render_mode(language_key)
+    db = background_session()
+    try:
+        report = _get_report_with_content(db, report_id)
+        if report is None or not (report.script_final or "").strip():
+            return "skipped"
+        source_lang = _normalize_source_language(
+            report.source_language
+        ) or _detect_source_language(report.title, report.summary_raw, report.script_final)
+        if language_key == source_lang and render_mode == "text":
+            return "ready"
+        row = (
+            db.query(MeetingReportTranslation)
+            .filter(
+                MeetingReportTranslation.report_id == report_id,
+                MeetingReportTranslation.language_key == language_key,
+            )
+            .first()
+        )
+        script_text = (row.script_text or "").strip() if row else ""
+        if script_text and (render_mode == "text" or _has_audio(row)):
+            return "ready"
+        # 缺译文时以原文口播稿为准，只缺音频时以译文为准；内容变化后不再沿用退避。
+        digest = hashlib.sha256(
+            (script_text or report.script_final).encode("utf-8")
+        ).hexdigest()
+    finally:
+        db.close()
+
+    if warm_backoff_active(report_id, language_key, digest):
+        return "backoff"
+
+    if not script_text:
+        _run_prepare_translation_job(report_id, language_key)
+        state = _get_translation_job_state(report_id, language_key) or {}
+        failed = state.get("status") != "ready"
+        record_warm_result(report_id, language_key, digest, failed)
+        return "failed" if failed else "translated"
+
+    # 译文已有、音频缺失（如此前合成失败）：只补合成音频，合成期间不占用会话。
+    try:
+        audio = synthesize_script_audio_variants(
+            script_text, language_key, LANGUAGE_TARGETS[language_key]
+        )
+    except Exception:
+        record_warm_result(report_id, language_key, digest, True)
+        return "failed"
+    record_warm_result(report_id, language_key, digest, False)
+
+    def _save(db: Session) -> None:
+        target = (
+            db.query(MeetingReportTranslation)
+            .filter(
+                MeetingReportTranslation.report_id == report_id,
+                MeetingReportTranslation.language_key == language_key,
+            )
+            .first()
+        )
+        if target is not None and (target.script_text or "").strip() == script_text:
+            _store_audio_variants(target, audio)
+
+    run_background_write(_save)
+    return "audio"
+
+
+# summary_raw / 口播稿为延迟加载列，需要正文的路径通过以下选项一次性取回。
+_REPORT_CONTENT_OPTIONS = (
+    undefer(MeetingReport.summary_raw),
+    undefer(MeetingReport.script_draft),
+    undefer(MeetingReport.script_final),
+)
+
+
+def _get_report_with_content(db: Session, report_id: int) -> MeetingReport | None:
+    return db.get(MeetingReport, report_id, options=_REPORT_CONTENT_OPTIONS)
+
+
 def _serialize_report_detail(report: MeetingReport) -> ReportDetail:
     draft = sorted(
         [h for h in report.highlights if h.kind == "draft"], key=lambda x: x.seq
@@ -232,34 +460,87 @@ def _serialize_report_detail(report: MeetingReport) -> ReportDetail:
     )
 
 
-def _set_highlights(db: Session, report_id: int, kind: str, values: list[str]) -> None:
-    db.query(MeetingReportHighlight).filter(
-        MeetingReportHighlight.report_id == report_id,
-        MeetingReportHighlight.kind == kind,
-    ).delete()
-    for idx, text in enumerate(values):
-        db.add(
-            MeetingReportHighlight(
-                report_id=report_id,
-                kind=kind,
-                highlight_text=text.strip(),
-                seq=idx,
+def _sync_child_rows(
+    db: Session,
+    model,
+    relationship_name: str,
+    report_id: int,
+    values: list[dict],
+    scope: dict | None = None,
+) -> None:
+    """按 seq 差量写入新闻子表（亮点/反思/提问）。
+
+    与现有行逐 seq 比较：内容不变的跳过，变动的原地批量 UPDATE，
+    新增的批量 INSERT，多出的尾部一条 DELETE 删除；不经过 identity map。
+    scope 为除 report_id 外的附加分区列（如亮点的 kind）。
+    """
+    scope = scope or {}
+    conditions = [model.report_id == report_id] + [
+        getattr(model, key) == value for key, value in scope.items()
+    ]
+    value_keys = sorted({key for row in values for key in row})
+    existing_rows = db.execute(
+        select(
+            model.id, model.seq, *[getattr(model, key) for key in value_keys]
+        ).where(*conditions)
+    ).all()
+
+    existing_by_seq: dict[int, object] = {}
+    stale_ids: list[int] = []
+    for row in existing_rows:
+        if row.seq in existing_by_seq or row.seq >= len(values):
+            stale_ids.append(row.id)
+        else:
+            existing_by_seq[row.seq] = row
+
+    to_update: list[dict] = []
+    to_insert: list[dict] = []
+    for seq, row_values in enumerate(values):
+        current = existing_by_seq.get(seq)
+        if current is None:
+            to_insert.append(
+                {"report_id": report_id, "seq": seq, **scope, **row_values}
             )
-        )
+        elif any(getattr(current, key) != value for key, value in row_values.items()):
+            to_update.append({"id": current.id, **row_values})
+
+    if stale_ids:
+        db.execute(delete(model).where(model.id.in_(stale_ids)))
+    if to_update:
+        db.execute(update(model), to_update)
+    if to_insert:
+        db.execute(insert(model), to_insert)
+
+    if stale_ids or to_update or to_insert:
+        record_report_changes(db, [report_id])
+        # Core 写入不会同步会话中已加载的对象，这里让父对象的集合与子对象失效重载。
+        report = db.identity_map.get(db.identity_key(MeetingReport, report_id))
+        if report is not None:
+            db.expire(report, [relationship_name])
+        for obj in list(db.identity_map.values()):
+            if isinstance(obj, model) and obj.report_id == report_id:
+                db.expire(obj)
+
+
+def _set_highlights(db: Session, report_id: int, kind: str, values: list[str]) -> None:
+    _sync_child_rows(
+        db,
+        MeetingReportHighlight,
+        "highlights",
+        report_id,
+        [{"highlight_text": text.strip()} for text in values],
+        scope={"kind": kind},
+    )
 
 
 def _set_reflections(db: Session, report_id: int, values: list[str]) -> None:
-    db.query(MeetingReportReflection).filter(
-        MeetingReportReflection.report_id == report_id
-    ).delete()
-    for idx, text in enumerate(values):
-        db.add(
-            MeetingReportReflection(
-                report_id=report_id,
-                reflection_text=text.strip(),
-                seq=idx,
-            )
-        )
+    _sync_child_rows(
+        db,
+        MeetingReportReflection,
+        "reflections",
+        report_id,
+        [{"reflection_text": text.strip()} for text in values],
+    )
 
 
 def _set_questions(
@@ -269,18 +550,101 @@ def _set_questions(
     persona_key: str,
 ) -> None:
     normalized_persona = _normalize_question_persona_key(persona_key)
-    db.query(MeetingReportQuestion).filter(
-        MeetingReportQuestion.report_id == report_id
+    _sync_child_rows(
+        db,
+        MeetingReportQuestion,
+        "questions",
+        report_id,
+        [
+            {"question_text": text.strip(), "persona_key": normalized_persona}
+            for text in values[:3]
+        ],
+    )
+
+
+def _set_transcript_segments(
+    db: Session, report_id: int, segments: list[FeishuTranscriptSegment]
+) -> None:
+    db.query(MeetingReportTranscriptSegment).filter(
+        MeetingReportTranscriptSegment.report_id == report_id
     ).delete()
-    for idx, text in enumerate(values[:3]):
-        db.add(
-            MeetingReportQuestion(
-                report_id=report_id,
-                question_text=text.strip(),
-                persona_key=normalized_persona,
-                seq=idx,
-            )
+    if not segments:
+        return
+    # 长会议可能有上千段，使用单条批量 INSERT，避免逐行 ORM add。
+    db.execute(
+        insert(MeetingReportTranscriptSegment),
+        [
+            {
+                "report_id": report_id,
+                "seq": seg.seq,
+                "speaker": seg.speaker[:120],
+                "start_ms": seg.start_ms,
+                "end_ms": seg.end_ms,
+                "text": seg.text,
+            }
+            for seg in segments
+        ],
+    )
+
+
+def _sync_transcript_segments(
+    db: Session, report_id: int, segments: list[FeishuTranscriptSegment]
+) -> int:
+    """增量同步逐字稿段落，返回新增段数。
+
+    会议进行中重复拉取到的是完整逐字稿：已存储段落是新结果的前缀时，
+    仅刷新最后一段（发言可能仍在继续）并追加新段；否则整体替换。
+    """
+    existing = (
+        db.query(
+            MeetingReportTranscriptSegment.id,
+            MeetingReportTranscriptSegment.seq,
+            MeetingReportTranscriptSegment.speaker,
+            MeetingReportTranscriptSegment.start_ms,
+        )
+        .filter(MeetingReportTranscriptSegment.report_id == report_id)
+        .order_by(MeetingReportTranscriptSegment.seq.asc())
+        .all()
+    )
+    stored = len(existing)
+    is_prefix = stored <= len(segments) and all(
+        row.seq == seg.seq
+        and row.speaker == seg.speaker[:120]
+        and row.start_ms == seg.start_ms
+        for row, seg in zip(existing, segments)
+    )
+    if not is_prefix:
+        _set_transcript_segments(db, report_id, segments)
+        return len(segments)
+
+    if stored:
+        last = segments[stored - 1]
+        db.query(MeetingReportTranscriptSegment).filter(
+            MeetingReportTranscriptSegment.id == existing[-1].id
+        ).update(
+            {
+                MeetingReportTranscriptSegment.end_ms: last.end_ms,
+                MeetingReportTranscriptSegment.text: last.text,
+            },
+            synchronize_session=False,
+        )
+    tail = segments[stored:]
+    if tail:
+        db.execute(
+            insert(MeetingReportTranscriptSegment),
+            [
+                {
+                    "report_id": report_id,
+                    "seq": seg.seq,
+                    "speaker": seg.speaker[:120],
+                    "start_ms": seg.start_ms,
+                    "end_ms": seg.end_ms,
+                    "text": seg.text,
+                }
+                for seg in tail
+            ],
         )
+    return len(tail)
 
 
 def _reflection_text_hash(text: str) -> str:
@@ -297,7 +661,7 @@ def _synthesize_reflection_audios_job(
     传入指定列表时只合成那几种语言。
     zh / en 是文字渲染模式，无需 TTS，跳过。
     """
-    from ..services.generator import synthesize_script_audio_pcm_base64
+    from ..services.generator import synthesize_script_audio_variants
 
     target_keys = [
         k
@@ -307,59 +671,74 @@ def _synthesize_reflection_audios_job(
     if not target_keys:
         return
 
-    db = SessionLocal()
+    # 读取反思与已有音频的 hash 后立即释放会话，合成期间不占用连接与写锁。
+    db = background_session()
     try:
-        report = db.get(MeetingReport, report_id)
-        if report is None:
-            return
-        reflections = sorted(report.reflections, key=lambda x: x.seq)
-        if not reflections:
-            return
-
-        for lang_key in target_keys:
-            lang_label = LANGUAGE_TARGETS.get(lang_key, lang_key)
-            for row in reflections:
-                text = str(row.reflection_text).strip()
-                if not text:
-                    continue
-                t_hash = _reflection_text_hash(text)
-                # 检查是否已有最新缓存（hash 未变则跳过）
-                existing = (
-                    db.query(MeetingReportReflectionAudio)
-                    .filter(
-                        MeetingReportReflectionAudio.report_id == report_id,
-                        MeetingReportReflectionAudio.seq == row.seq,
-                        MeetingReportReflectionAudio.language_key == lang_key,
-                    )
-                    .first()
-                )
-                if existing and existing.text_hash == t_hash:
-                    continue  # Stage 4: text_hash 一致，缓存有效，跳过
-                try:
-                    audio = synthesize_script_audio_pcm_base64(
-                        text, lang_key, lang_label
-                    )
-                except Exception:
-                    continue  # 单条失败不影响其他条
-                if existing:
-                    existing.text_hash = t_hash
-                    existing.audio_pcm_base64 = audio
-                    existing.updated_at = now_local_naive()
-                else:
-                    db.add(
-                        MeetingReportReflectionAudio(
-                            report_id=report_id,
-                            seq=row.seq,
-                            language_key=lang_key,
-                            text_hash=t_hash,
-                            audio_pcm_base64=audio,
-                        )
-                    )
-                db.commit()
-    except Exception:
-        db.rollback()
+        reflections = [
+            (row.seq, str(row.reflection_text).strip())
+            for row in db.query(
+                MeetingReportReflection.seq, MeetingReportReflection.reflection_text
+            )
+            .filter(MeetingReportReflection.report_id == report_id)
+            .order_by(MeetingReportReflection.seq)
+        ]
+        existing_hashes = {
+            (row.seq, row.language_key): row.text_hash
+            for row in db.query(
+                MeetingReportReflectionAudio.seq,
+                MeetingReportReflectionAudio.language_key,
+                MeetingReportReflectionAudio.text_hash,
+            ).filter(MeetingReportReflectionAudio.report_id == report_id)
+        }
     finally:
         db.close()
+    if not reflections:
+        return
+
+    def _save_audio(seq: int, lang_key: str, t_hash: str, audio: AudioVariants):
+        def _write(db: Session) -> None:
+            existing = (
+                db.query(MeetingReportReflectionAudio)
+                .filter(
+                    MeetingReportReflectionAudio.report_id == report_id,
+                    MeetingReportReflectionAudio.seq == seq,
+                    MeetingReportReflectionAudio.language_key == lang_key,
+                )
+                .first()
+            )
+            if existing:
+                existing.text_hash = t_hash
+                _store_audio_variants(existing, audio)
+                existing.updated_at = now_local_naive()
+            elif db.get(MeetingReport, report_id) is not None:
+                row = MeetingReportReflectionAudio(
+                    report_id=report_id,
+                    seq=seq,
+                    language_key=lang_key,
+                    text_hash=t_hash,
+                )
+                _store_audio_variants(row, audio)
+                db.add(row)
+
+        return _write
+
+    for lang_key in target_keys:
+        lang_label = LANGUAGE_TARGETS.get(lang_key, lang_key)
+        for seq, text in reflections:
+            if not text:
+                continue
+            t_hash = _reflection_text_hash(text)
+            if existing_hashes.get((seq, lang_key)) == t_hash:
+                continue  # Stage 4: text_hash 一致，缓存有效，跳过
+            try:
+                audio = synthesize_script_audio_variants(text, lang_key, lang_label)
+            except Exception:
+                continue  # 单条失败不影响其他条
+            # 写入交给写线程批量提交，编辑保存优先获得写锁。
+            try:
+                run_background_write(_save_audio(seq, lang_key, t_hash, audio))
+            except Exception:
+                continue
 
 
 def _upsert_translation(
@@ -372,7 +751,7 @@ def _upsert_translation(
     reflections: list[str],
     questions: list[str],
     question_persona: str,
-    audio_pcm_base64: str = "",
+    audio: AudioVariants | None = None,
 ) -> None:
     row = (
         db.query(MeetingReportTranslation)
@@ -392,9 +771,9 @@ def _upsert_translation(
             reflections_json=json.dumps(reflections[:5], ensure_ascii=False),
             questions_json=json.dumps(questions[:3], ensure_ascii=False),
             question_persona=_normalize_question_persona_key(question_persona),
-            audio_pcm_base64=audio_pcm_base64.strip(),
             updated_at=now_local_naive(),
         )
+        _store_audio_variants(row, audio)
         db.add(row)
         return
 
@@ -404,7 +783,7 @@ def _upsert_translation(
     row.reflections_json = json.dumps(reflections[:5], ensure_ascii=False)
     row.questions_json = json.dumps(questions[:3], ensure_ascii=False)
     row.question_persona = _normalize_question_persona_key(question_persona)
-    row.audio_pcm_base64 = audio_pcm_base64.strip()
+    _store_audio_variants(row, audio)
     row.updated_at = now_local_naive()
 
 
@@ -435,7 +814,8 @@ def _refresh_report_translations(
         report.source_language
     ) or _detect_source_language(report.title, report.summary_raw, script_text)
     translated_payloads: dict[
-        str, tuple[str, str, list[str], list[str], list[str], str, str]
+        str,
+        tuple[str, str, list[str], list[str], list[str], str, AudioVariants | None],
     ] = {
         source_lang: (
             title_text,
@@ -444,7 +824,7 @@ def _refresh_report_translations(
             source_reflections,
             source_questions,
             source_persona,
-            "",
+            None,
         ),
     }
 
@@ -472,17 +852,17 @@ def _refresh_report_translations(
                     questions_out.append(translate_script(question, target_language))
                 except Exception:
                     questions_out.append(question)
-            audio_pcm_base64 = ""
+            audio = None
             if _resolve_render_mode(language_key) == "audio":
                 try:
-                    audio_pcm_base64 = synthesize_script_audio_pcm_base64(
+                    audio = synthesize_script_audio_variants(
                         script_text=script_out,
                         language_key=language_key,
                         language_label=target_language,
                     )
                 except Exception:
                     # 音频失败时先写入翻译文本，后续异步任务可重试。
-                    audio_pcm_base64 = ""
+                    audio = None
             translated_payloads[language_key] = (
                 title_out,
                 script_out,
@@ -490,7 +870,7 @@ def _refresh_report_translations(
                 reflections_out[:5],
                 questions_out[:3],
                 source_persona,
-                audio_pcm_base64,
+                audio,
             )
         except Exception:
             # 单语种失败不影响保存；保留已有翻译或后续重试。
@@ -504,7 +884,7 @@ def _refresh_report_translations(
             reflections_out,
             questions_out,
             question_persona,
-            audio_pcm_base64,
+            audio,
         ) = payload
         _upsert_translation(
             db=db,
@@ -516,14 +896,14 @@ def _refresh_report_translations(
             reflections=reflections_out,
             questions=questions_out,
             question_persona=question_persona,
-            audio_pcm_base64=audio_pcm_base64,
+            audio=audio,
         )
 
 
 def _refresh_report_translations_job(report_id: int) -> None:
-    db = SessionLocal()
+    db = background_session()
     try:
-        report = db.get(MeetingReport, report_id)
+        report = _get_report_with_content(db, report_id)
         if report is None:
             return
         if not (report.script_final or "").strip():
@@ -655,7 +1035,9 @@ def _ensure_report_script(report: MeetingReport, db: Session) -> tuple[str, list
         _normalize_question_persona_key(report.question_persona),
     )
     report.updated_at = now_local_naive()
-    db.flush()
+    # 先提交生成结果、释放写闸门，调用方随后的翻译与合成音频不再占用写锁。
+    db.commit()
+    db.expire(report, ["highlights", "reflections", "questions"])
     return generated_script, generated_highlights[:2]
 
 
@@ -690,16 +1072,16 @@ def _prepare_translation_row(
         reflections_out = base_reflections
         questions_out = base_questions
         question_persona = base_persona
-        audio_pcm_base64 = ""
+        audio = None
         if _resolve_render_mode(language_key) == "audio" and script_out.strip():
             try:
-                audio_pcm_base64 = synthesize_script_audio_pcm_base64(
+                audio = synthesize_script_audio_variants(
                     script_text=script_out,
                     language_key=language_key,
                     language_label=target_language,
                 )
             except Exception:
-                audio_pcm_base64 = ""
+                audio = None
     else:
         title_out, script_out, highlights_out = translate_report_package(
             title_text=base_title,
@@ -720,9 +1102,9 @@ def _prepare_translation_row(
             except Exception:
                 questions_out.append(question)
         question_persona = base_persona
-        audio_pcm_base64 = ""
+        audio = None
         if _resolve_render_mode(language_key) == "audio":
-            audio_pcm_base64 = synthesize_script_audio_pcm_base64(
+            audio = synthesize_script_audio_variants(
                 script_text=script_out,
                 language_key=language_key,
                 language_label=target_language,
@@ -746,11 +1128,11 @@ def _prepare_translation_row(
             reflections_json=json.dumps(reflections_out[:5], ensure_ascii=False),
             questions_json=json.dumps(questions_out[:3], ensure_ascii=False),
             question_persona=question_persona,
-            audio_pcm_base64=audio_pcm_base64,
             reviewed=False,
             reviewed_at=None,
             updated_at=now_local_naive(),
         )
+        _store_audio_variants(row, audio)
         db.add(row)
         db.flush()
         return row
@@ -761,7 +1143,7 @@ def _prepare_translation_row(
     row.reflections_json = json.dumps(reflections_out[:5], ensure_ascii=False)
     row.questions_json = json.dumps(questions_out[:3], ensure_ascii=False)
     row.question_persona = question_persona
-    row.audio_pcm_base64 = audio_pcm_base64
+    _store_audio_variants(row, audio)
     row.reviewed = False
     row.reviewed_at = None
     row.updated_at = now_local_naive()
@@ -790,9 +1172,7 @@ def _translation_response_item(
         questions_final=questions,
         question_persona=_normalize_question_persona_key(row.question_persona),
         render_mode=render_mode,
-        audio_ready=True
-        if render_mode == "text"
-        else bool((row.audio_pcm_base64 or "").strip()),
+        audio_ready=True if render_mode == "text" else _has_audio(row),
     )
 
 
@@ -804,36 +1184,45 @@ def _build_localized_payload(
     questions_final: list[str],
     include_audio: bool = False,
     audio_languages: set[str] | None = None,
+    audio_formats: list[str] | None = None,
+    audio_refs: bool = False,
 ) -> dict[str, dict]:
     audio_langs = audio_languages or set()
+    audio_formats = audio_formats or ["pcm"]
+    # 引用模式只返回音频 URL、字节数与哈希，客户端按需单独拉取正在播报的语种。
+    inline_audio = include_audio and not audio_refs
     include_all_audio = not audio_langs
     source_lang = _normalize_source_language(
         report.source_language
     ) or _detect_source_language(report.title, report.summary_raw, report.script_final)
     payload: dict[str, dict] = {}
-    rows = (
-        db.query(MeetingReportTranslation)
-        .filter(MeetingReportTranslation.report_id == report.id)
-        .all()
+    query = db.query(MeetingReportTranslation).filter(
+        MeetingReportTranslation.report_id == report.id
     )
+    if inline_audio:
+        query = query.options(
+            undefer(MeetingReportTranslation.audio_pcm_base64),
+            undefer(MeetingReportTranslation.audio_compressed_base64),
+        )
+    rows = query.all()
     row_by_lang = {row.language_key: row for row in rows}
     source_render_mode = _resolve_render_mode(source_lang)
     source_row = row_by_lang.get(source_lang)
     source_audio_ready = (
         True
         if source_render_mode == "text"
-        else bool((source_row.audio_pcm_base64 or "").strip())
+        else _has_audio(source_row)
         if source_row
         else False
     )
-    source_audio_pcm = ""
+    source_audio = ("", "")
     if (
         source_row
         and source_render_mode == "audio"
-        and include_audio
+        and inline_audio
         and (include_all_audio or source_lang in audio_langs)
     ):
-        source_audio_pcm = (source_row.audio_pcm_base64 or "").strip()
+        source_audio = _pick_audio_variant(source_row, audio_formats)
     payload[source_lang] = {
         "title": report.title,
         "script_final": report.script_final,
@@ -843,8 +1232,14 @@ def _build_localized_payload(
         "question_persona": _normalize_question_persona_key(report.question_persona),
         "render_mode": source_render_mode,
         "audio_ready": source_audio_ready,
-        "audio_pcm_base64": source_audio_pcm,
+        **_audio_fields(*source_audio),
     }
+    if audio_refs:
+        payload[source_lang]["audio_ref"] = (
+            _audio_ref(report.id, source_row, audio_formats)
+            if source_row and source_render_mode == "audio"
+            else None
+        )
     for row in rows:
         try:
             highlights = json.loads(row.highlights_json) if row.highlights_json else []
@@ -855,12 +1250,12 @@ def _build_localized_payload(
         reflections = _parse_translation_reflections(row)
         questions = _parse_translation_questions(row)
         render_mode = _resolve_render_mode(row.language_key)
-        audio_pcm_base64 = ""
+        audio = ("", "")
         audio_ready = True
         if render_mode == "audio":
-            if include_audio and (include_all_audio or row.language_key in audio_langs):
-                audio_pcm_base64 = (row.audio_pcm_base64 or "").strip()
-            audio_ready = bool((row.audio_pcm_base64 or "").strip())
+            if inline_audio and (include_all_audio or row.language_key in audio_langs):
+                audio = _pick_audio_variant(row, audio_formats)
+            audio_ready = _has_audio(row)
         payload[row.language_key] = {
             "title": row.title_text or report.title,
             "script_final": row.script_text or report.script_final,
@@ -872,29 +1267,99 @@ def _build_localized_payload(
             "question_persona": _normalize_question_persona_key(row.question_persona),
             "render_mode": render_mode,
             "audio_ready": audio_ready,
-            "audio_pcm_base64": audio_pcm_base64,
+            **_audio_fields(*audio),
         }
+        if audio_refs:
+            payload[row.language_key]["audio_ref"] = (
+                _audio_ref(report.id, row, audio_formats)
+                if render_mode == "audio"
+                else None
+            )
     return payload
 
 
+def _encode_list_cursor(meeting_time: datetime, report_id: int) -> str:
+    raw = f"{meeting_time.isoformat()}|{report_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_list_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        raw = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8")
+        time_text, id_text = raw.rsplit("|", 1)
+        return datetime.fromisoformat(time_text), int(id_text)
+    except Exception as exc:
+        raise HTTPException(status_code=400, detail="cursor 无效") from exc
+
+
+def _cached_report_count(db: Session, status: str | None) -> int:
+    # 游标模式只需要近似总数，短时间缓存避免每次翻页都全表 count。
+    now = time.monotonic()
+    with _report_count_lock:
+        cached = _report_count_cache.get(status)
+        if cached and now - cached[0] < _REPORT_COUNT_TTL_SEC:
+            return cached[1]
+    query = db.query(func.count(MeetingReport.id))
+    if status:
+        query = query.filter(MeetingReport.status == status)
+    total = query.scalar() or 0
+    with _report_count_lock:
+        _report_count_cache[status] = (now, total)
+    return total
+
+
 @router.get("", response_model=ReportListResponse)
 def list_reports(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     status: str | None = Query(None),
+    cursor: str | None = Query(None),
     db: Session = Depends(get_db),
 ):
-    query = db.query(MeetingReport)
+    # 列表只查询 ReportListItem 需要的列，不加载 summary_raw / 口播稿等大字段。
+    query = db.query(
+        MeetingReport.id,
+        MeetingReport.title,
+        MeetingReport.speaker,
+        MeetingReport.source_language,
+        MeetingReport.meeting_time,
+        MeetingReport.status,
+        MeetingReport.auto_play_enabled,
+    )
     if status:
         query = query.filter(MeetingReport.status == status)
-
-    total = query.with_entities(func.count(MeetingReport.id)).scalar() or 0
-    items = (
-        query.order_by(desc(MeetingReport.meeting_time), desc(MeetingReport.id))
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
-    )
+    query = query.order_by(desc(MeetingReport.meeting_time), desc(MeetingReport.id))
+
+    if cursor is not None:
+        # 游标模式：按 (meeting_time, id) 键集翻页，深页耗时不随页码增长。
+        if cursor:
+            cursor_time, cursor_id = _decode_list_cursor(cursor)
+            query = query.filter(
+                or_(
+                    MeetingReport.meeting_time < cursor_time,
+                    and_(
+                        MeetingReport.meeting_time == cursor_time,
+                        MeetingReport.id < cursor_id,
+                    ),
+                )
+            )
+        rows = query.limit(page_size + 1).all()
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        next_cursor = (
+            _encode_list_cursor(rows[-1].meeting_time, rows[-1].id)
+            if has_more and rows
+            else None
+        )
+        total = _cached_report_count(db, status)
+    else:
+        count_query = db.query(func.count(MeetingReport.id))
+        if status:
+            count_query = count_query.filter(MeetingReport.status == status)
+        total = count_query.scalar() or 0
+        rows = query.offset((page - 1) * page_size).limit(page_size).all()
+        next_cursor = None
 
     return ReportListResponse(
         items=[
@@ -907,14 +1372,55 @@ def list_reports(
                 status=item.status,
                 auto_play_enabled=item.auto_play_enabled,
             )
-            for item in items
+            for item in rows
         ],
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
     )
 
 
+@router.get("/search", response_model=ReportSearchResponse)
+def search_reports_fulltext(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    language_key: str | None = Query(None),
+    db: Session = Depends(get_db),
+):
+    # 检索覆盖标题、主讲人、纪要、口播稿及各语种译文，按相关度排序。
+    hits = search_reports(db, q, limit=limit, language_key=language_key)
+    reports = {}
+    if hits:
+        rows = db.query(
+            MeetingReport.id,
+            MeetingReport.title,
+            MeetingReport.speaker,
+            MeetingReport.meeting_time,
+            MeetingReport.status,
+        ).filter(MeetingReport.id.in_([hit.report_id for hit in hits]))
+        reports = {row.id: row for row in rows}
+
+    items = []
+    for hit in hits:
+        row = reports.get(hit.report_id)
+        if row is None:
+            continue
+        items.append(
+            ReportSearchItem(
+                id=row.id,
+                title=row.title,
+                speaker=row.speaker,
+                meeting_time=row.meeting_time,
+                status=row.status,
+                language_key=hit.language_key,
+                snippet=hit.snippet,
+                score=round(hit.score, 4),
+            )
+        )
+    return ReportSearchResponse(query=q, total=len(items), items=items)
+
+
 @router.post("", response_model=ReportDetail)
 def create_report(
     payload: ReportCreate,
@@ -976,6 +1482,7 @@ def create_report(
 def get_latest_published(db: Session = Depends(get_db)):
     report = (
         db.query(MeetingReport)
+        .options(*_REPORT_CONTENT_OPTIONS)
         .filter(MeetingReport.status == "published")
         .order_by(desc(MeetingReport.published_at), desc(MeetingReport.id))
         .first()
@@ -987,15 +1494,15 @@ def get_latest_published(db: Session = Depends(get_db)):
 
 @router.get("/{report_id}", response_model=ReportDetail)
 def get_report(report_id: int, db: Session = Depends(get_db)):
-    report = db.get(MeetingReport, report_id)
+    report = _get_report_with_content(db, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="记录不存在")
     return _serialize_report_detail(report)
 
 
 @router.get("/{report_id}/translations", response_model=ReportTranslationsResponse)
-def get_report_translations(report_id: int, db: Session = Depends(get_db)):
-    report = db.get(MeetingReport, report_id)
+def get_report_translations(report_id: int, db: Session = Depends(get_read_db)):
+    report = _get_report_with_content(db, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="记录不存在")
 
@@ -1089,9 +1596,7 @@ def get_report_translations(report_id: int, db: Session = Depends(get_db)):
                     row.question_persona
                 ),
                 "render_mode": render_mode,
-                "audio_ready": True
-                if render_mode == "text"
-                else bool((row.audio_pcm_base64 or "").strip()),
+                "audio_ready": True if render_mode == "text" else _has_audio(row),
             }
         )
 
@@ -1210,7 +1715,7 @@ def retranslate_single_language(
 def prepare_report_translation(
     report_id: int, language_key: str, db: Session = Depends(get_db)
 ):
-    report = db.get(MeetingReport, report_id)
+    report = _get_report_with_content(db, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="记录不存在")
 
@@ -1276,13 +1781,14 @@ def update_report_translation(
         row.script_text = data["script_final"].strip()
         if _resolve_render_mode(language_key) == "audio":
             try:
-                row.audio_pcm_base64 = synthesize_script_audio_pcm_base64(
+                audio = synthesize_script_audio_variants(
                     script_text=row.script_text,
                     language_key=language_key,
                     language_label=LANGUAGE_TARGETS[language_key],
                 )
             except Exception:
-                row.audio_pcm_base64 = ""
+                audio = None
+            _store_audio_variants(row, audio)
     if "highlights_final" in data and data["highlights_final"] is not None:
         row.highlights_json = json.dumps(
             _normalize_highlights(data["highlights_final"]), ensure_ascii=False
@@ -1315,7 +1821,7 @@ def update_report(
     background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
 ):
-    report = db.get(MeetingReport, report_id)
+    report = _get_report_with_content(db, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="记录不存在")
 
@@ -1426,6 +1932,7 @@ def update_report(
                 status_code=503, detail="数据库忙，请稍后重试（建议 1-2 秒后再次保存）"
             ) from exc
         raise
+    invalidate_live_summary_cache(report.id)
     db.refresh(report)
     if should_refresh_translation and (report.script_final or "").strip():
         background_tasks.add_task(_refresh_report_translations_job, report.id)
@@ -1441,6 +1948,7 @@ def delete_report(report_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="记录不存在")
     db.delete(report)
     db.commit()
+    invalidate_live_summary_cache(report_id)
     return {"ok": True, "deleted_id": report_id}
 
 
@@ -1448,7 +1956,7 @@ def delete_report(report_id: int, db: Session = Depends(get_db)):
 def generate_report_content(
     report_id: int, background_tasks: BackgroundTasks, db: Session = Depends(get_db)
 ):
-    report = db.get(MeetingReport, report_id)
+    report = _get_report_with_content(db, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="记录不存在")
     if not report.summary_raw.strip():
@@ -1480,6 +1988,7 @@ def generate_report_content(
         _normalize_question_persona_key(report.question_persona),
     )
     db.commit()
+    invalidate_live_summary_cache(report.id)
     background_tasks.add_task(_refresh_report_translations_job, report.id)
     background_tasks.add_task(_synthesize_reflection_audios_job, report.id)
 
@@ -1494,7 +2003,7 @@ def generate_report_content(
 
 @router.post("/{report_id}/generate-pack", response_model=GenerateResponse)
 def generate_report_pack(report_id: int, db: Session = Depends(get_db)):
-    report = db.get(MeetingReport, report_id)
+    report = _get_report_with_content(db, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="记录不存在")
     if not report.summary_raw.strip():
@@ -1526,11 +2035,14 @@ def generate_report_pack(report_id: int, db: Session = Depends(get_db)):
         _normalize_questions(questions),
         _normalize_question_persona_key(report.question_persona),
     )
-    db.flush()
+    # 先提交口播稿：多语言准备会逐语种调用翻译与 TTS，不能在持有写闸门期间进行。
+    db.commit()
 
     # 统一生成入口：同步准备多语言（包含反思），避免前端看到“已生成但未准备”。
+    # 翻译与音频在 _refresh_report_translations 内先全部完成，再一次性写入。
     _refresh_report_translations(db, report, highlights[:2])
     db.commit()
+    invalidate_live_summary_cache(report.id)
 
     return GenerateResponse(
         report_id=report.id,
@@ -1575,37 +2087,106 @@ def translate_report_script(payload: TranslateScriptRequest):
 
 
 @router.post("/synthesize-audio", response_model=SynthesizeAudioResponse)
-def synthesize_report_audio(payload: SynthesizeAudioRequest):
+def synthesize_report_audio(
+    payload: SynthesizeAudioRequest, request: Request, response: Response
+):
     script_text = (payload.script_text or "").strip()
     language_key = (payload.language_key or "").strip().lower()
     if not script_text:
         raise HTTPException(status_code=400, detail="script_text 不能为空")
     if language_key not in LANGUAGE_TARGETS:
         raise HTTPException(status_code=400, detail="不支持的 language_key")
+    # 播放屏临时合成说明该语种在用，轮播预热会为后续条目提前准备。
+    note_carousel_activity([language_key])
 
+    # 按客户端偏好选第一个可合成的格式：配置了压缩格式才合成 opus / mp3。
+    audio_format = next(
+        (
+            x
+            for x in _parse_audio_formats(payload.audio_format)
+            if x == "pcm" or x == compressed_audio_format()
+        ),
+        "pcm",
+    )
+    # 同一文本与语种的并发请求合并为一次上游合成，结果持久化后各 worker 复用。
     try:
-        audio_pcm_base64 = synthesize_script_audio_pcm_base64(
-            script_text=script_text,
-            language_key=language_key,
-            language_label=LANGUAGE_TARGETS[language_key],
+        stored = synthesize_audio_shared(
+            script_text, language_key, LANGUAGE_TARGETS[language_key], audio_format
         )
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=f"AI 语音合成失败: {exc}") from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"语音合成失败: {exc}") from exc
 
+    etag = f'"{stored.audio_sha256}"'
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return SynthesizeAudioResponse(
         language_key=language_key,
-        audio_pcm_base64=audio_pcm_base64,
+        **_audio_fields(stored.audio_format, stored.audio_base64),
+    )
+
+
+@router.get("/{report_id}/audio/{language_key}")
+def get_report_audio(
+    report_id: int,
+    language_key: str,
+    request: Request,
+    audio_format: str | None = Query(None),
+    v: str | None = Query(None),
+    db: Session = Depends(get_read_db),
+):
+    """按语种拉取单条新闻的预合成音频（原始字节），支持 ETag / If-None-Match。"""
+    if language_key not in LANGUAGE_TARGETS:
+        raise HTTPException(status_code=400, detail="不支持的 language_key")
+    note_carousel_activity([language_key])
+    row = (
+        db.query(MeetingReportTranslation)
+        .filter(
+            MeetingReportTranslation.report_id == report_id,
+            MeetingReportTranslation.language_key == language_key,
+        )
+        .first()
+    )
+    picked_format, _, sha256 = (
+        _pick_audio_digest(row, _parse_audio_formats(audio_format))
+        if row
+        else ("", 0, "")
+    )
+    if not picked_format:
+        raise HTTPException(status_code=404, detail="音频不存在")
+
+    etag = f'"{sha256}"'
+    headers = {
+        "ETag": etag,
+        # URL 携带的内容版本与当前音频一致时可长期缓存，否则每次协商。
+        "Cache-Control": "public, max-age=31536000, immutable"
+        if v and sha256.startswith(v)
+        else "no-cache",
+    }
+    if etag in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+    _, audio = _pick_audio_variant(row, [picked_format])
+    return Response(
+        content=base64.b64decode(audio),
+        media_type=AUDIO_MEDIA_TYPES[picked_format],
+        headers=headers,
     )
 
 
-@router.get("/{report_id}/reflection", response_model=ReflectionResponse)
+@router.get(
+    "/{report_id}/reflection",
+    response_model=ReflectionResponse,
+    response_class=FastJSONResponse,
+)
 def get_report_reflection(
     report_id: int,
     lang: str = Query(default="zh"),
-    db: Session = Depends(get_db),
+    audio_format: str | None = Query(None),
+    db: Session = Depends(get_read_db),
 ):
+    audio_formats = _parse_audio_formats(audio_format)
     report = db.get(MeetingReport, report_id)
     if not report:
         raise HTTPException(status_code=404, detail="记录不存在")
@@ -1630,64 +2211,187 @@ def get_report_reflection(
         t_hash = _reflection_text_hash(text)
         audio_row = audio_by_seq.get(row.seq)
         # Stage 4: text_hash 不一致说明文字已变动，缓存失效
-        audio_pcm = (
-            audio_row.audio_pcm_base64
-            if audio_row and audio_row.text_hash == t_hash
-            else None
-        )
-        items.append(ReflectionItem(text=text, audio_pcm_base64=audio_pcm))
+        if audio_row and audio_row.text_hash == t_hash:
+            picked_format, audio = _pick_audio_variant(audio_row, audio_formats)
+        else:
+            picked_format, audio = "", ""
+        if audio:
+            items.append(ReflectionItem(text=text, **_audio_fields(picked_format, audio)))
+        else:
+            items.append(ReflectionItem(text=text))
 
     return ReflectionResponse(report_id=report.id, reflections=items)
 
 
-@router.get("/{report_id}/questions", response_model=QuestionResponse)
-def get_report_questions(
+@router.get("/{report_id}/transcript", response_model=TranscriptSegmentsResponse)
+def get_report_transcript(
     report_id: int,
-    lang: str = Query(default="zh"),
-    persona: str | None = Query(default=None),
+    start_seq: int = Query(0, ge=0),
+    limit: int = Query(200, ge=1, le=1000),
     db: Session = Depends(get_db),
 ):
-    report = db.get(MeetingReport, report_id)
-    if not report:
+    if db.get(MeetingReport, report_id) is None:
         raise HTTPException(status_code=404, detail="记录不存在")
 
-    target_persona = _normalize_question_persona_key(persona or report.question_persona)
-    source_persona = _normalize_question_persona_key(report.question_persona)
-    report_questions = sorted(report.questions, key=lambda x: x.seq)
-    base_questions = [
-        str(x.question_text).strip()
-        for x in report_questions
-        if str(x.question_text).strip()
-    ][:3]
+    base_query = db.query(MeetingReportTranscriptSegment).filter(
+        MeetingReportTranscriptSegment.report_id == report_id
+    )
+    total = (
+        base_query.with_entities(func.count(MeetingReportTranscriptSegment.id)).scalar()
+        or 0
+    )
+    rows = (
+        base_query.filter(MeetingReportTranscriptSegment.seq >= start_seq)
+        .order_by(MeetingReportTranscriptSegment.seq.asc())
+        .limit(limit)
+        .all()
+    )
+    return TranscriptSegmentsResponse(
+        report_id=report_id,
+        total=total,
+        items=[
+            TranscriptSegmentItem(
+                seq=row.seq,
+                speaker=row.speaker,
+                start_ms=row.start_ms,
+                end_ms=row.end_ms,
+                text=row.text,
+            )
+            for row in rows
+        ],
+    )
 
-    if not base_questions:
-        base_questions = generate_sharp_questions(
-            title_text=report.title,
-            summary_text=report.summary_raw,
-            script_text=report.script_final,
-            persona_key=target_persona,
-        )
-        _set_questions(
-            db, report.id, _normalize_questions(base_questions), target_persona
-        )
-        report.question_persona = target_persona
-        report.updated_at = now_local_naive()
-        db.commit()
-        db.refresh(report)
-        source_persona = target_persona
 
-    if target_persona != source_persona:
-        generated = generate_sharp_questions(
-            title_text=report.title,
-            summary_text=report.summary_raw,
-            script_text=report.script_final,
-            persona_key=target_persona,
-        )
-        return QuestionResponse(
-            report_id=report.id,
-            persona=target_persona,
-            questions=[QuestionItem(text=x) for x in _normalize_questions(generated)],
-        )
+def _fetch_feishu_transcript(minute_token: str) -> tuple[str, str, str]:
+    client = FeishuApiClient(
+        app_id=settings.feishu_app_id,
+        app_secret=settings.feishu_app_secret,
+        api_base=settings.feishu_api_base,
+        timeout_sec=settings.feishu_timeout_sec,
+        verify_ssl=settings.feishu_verify_ssl,
+    )
+    return client.get_transcript(minute_token=minute_token)
+
+
+def sync_live_transcript(report_id: int) -> int | None:
+    """供逐字稿轮询调用：拉取飞书逐字稿并追加新段落，返回新增段数。
+
+    新闻不存在或未绑定妙记时返回 None。拉取在写闸门外进行，写入经写线程提交。
+    """
+    db = background_session()
+    try:
+        report = db.get(MeetingReport, report_id)
+        minute_token = (report.source_minute_token or "").strip() if report else ""
+    finally:
+        db.close()
+    if not minute_token:
+        return None
+    transcript_status, transcript_text, _ = _fetch_feishu_transcript(minute_token)
+    if transcript_status != "ready" or not transcript_text.strip():
+        return 0
+    segments = FeishuApiClient.parse_transcript_segments(transcript_text)
+    return run_background_write(
+        lambda db: _sync_transcript_segments(db, report_id, segments)
+    )
+
+
+@router.post(
+    "/{report_id}/transcript/sync", response_model=TranscriptSyncResponse
+)
+def sync_report_transcript(report_id: int, db: Session = Depends(get_db)):
+    """手动触发一次飞书逐字稿同步；会议进行中由后台逐字稿轮询自动追加。"""
+    if not settings.feishu_app_id or not settings.feishu_app_secret:
+        raise HTTPException(
+            status_code=400, detail="后端未配置 FEISHU_APP_ID / FEISHU_APP_SECRET"
+        )
+    report = db.get(MeetingReport, report_id)
+    if not report:
+        raise HTTPException(status_code=404, detail="记录不存在")
+    minute_token = (report.source_minute_token or "").strip()
+    if not minute_token:
+        raise HTTPException(status_code=400, detail="该新闻未绑定飞书妙记")
+
+    try:
+        transcript_status, transcript_text, transcript_error = (
+            _fetch_feishu_transcript(minute_token)
+        )
+    except Exception as exc:
+        raise HTTPException(
+            status_code=500, detail=f"飞书逐字稿拉取失败: {exc}"
+        ) from exc
+
+    appended_count = 0
+    if transcript_status == "ready" and transcript_text.strip():
+        appended_count = _sync_transcript_segments(
+            db,
+            report.id,
+            FeishuApiClient.parse_transcript_segments(transcript_text),
+        )
+        db.commit()
+
+    total = (
+        db.query(func.count(MeetingReportTranscriptSegment.id))
+        .filter(MeetingReportTranscriptSegment.report_id == report.id)
+        .scalar()
+        or 0
+    )
+    return TranscriptSyncResponse(
+        report_id=report.id,
+        transcript_status=transcript_status,
+        transcript_error=transcript_error,
+        appended_count=appended_count,
+        total=total,
+    )
+
+
+@router.get("/{report_id}/questions", response_model=QuestionResponse)
+def get_report_questions(
+    report_id: int,
+    lang: str = Query(default="zh"),
+    persona: str | None = Query(default=None),
+    db: Session = Depends(get_db),
+):
+    report = db.get(MeetingReport, report_id)
+    if not report:
+        raise HTTPException(status_code=404, detail="记录不存在")
+
+    target_persona = _normalize_question_persona_key(persona or report.question_persona)
+    source_persona = _normalize_question_persona_key(report.question_persona)
+    report_questions = sorted(report.questions, key=lambda x: x.seq)
+    base_questions = [
+        str(x.question_text).strip()
+        for x in report_questions
+        if str(x.question_text).strip()
+    ][:3]
+
+    if not base_questions:
+        base_questions = generate_sharp_questions(
+            title_text=report.title,
+            summary_text=report.summary_raw,
+            script_text=report.script_final,
+            persona_key=target_persona,
+        )
+        _set_questions(
+            db, report.id, _normalize_questions(base_questions), target_persona
+        )
+        report.question_persona = target_persona
+        report.updated_at = now_local_naive()
+        db.commit()
+        db.refresh(report)
+        source_persona = target_persona
+
+    if target_persona != source_persona:
+        generated = generate_sharp_questions(
+            title_text=report.title,
+            summary_text=report.summary_raw,
+            script_text=report.script_final,
+            persona_key=target_persona,
+        )
+        return QuestionResponse(
+            report_id=report.id,
+            persona=target_persona,
+            questions=[QuestionItem(text=x) for x in _normalize_questions(generated)],
+        )
 
     if lang.strip().lower() != _normalize_source_language(report.source_language):
         row = (
@@ -1716,7 +2420,9 @@ def get_report_questions(
 
 @router.post("/{report_id}/publish", response_model=PublishResponse)
 def publish_report(report_id: int, db: Session = Depends(get_db)):
-    report = db.get(MeetingReport, report_id)
+    report = db.get(
+        MeetingReport, report_id, options=[undefer(MeetingReport.script_final)]
+    )
     if not report:
         raise HTTPException(status_code=404, detail="记录不存在")
 
@@ -1742,88 +2448,490 @@ def publish_report(report_id: int, db: Session = Depends(get_db)):
     )
 
 
-@router.post("/import/file", response_model=ImportResponse)
-async def import_reports_from_file(
-    file: UploadFile = File(...), db: Session = Depends(get_db)
-):
-    filename = (file.filename or "").lower()
-    content = await file.read()
-    rows: list[dict] = []
+def _iter_csv_import_rows(stream) -> Iterator[dict]:
+    text_stream = io.TextIOWrapper(
+        stream, encoding="utf-8-sig", errors="ignore", newline=""
+    )
+    try:
+        for row in csv.DictReader(text_stream):
+            yield dict(row)
+    finally:
+        # 避免 TextIOWrapper 回收时关闭底层上传文件。
+        text_stream.detach()
 
-    if filename.endswith(".csv"):
-        decoded = content.decode("utf-8-sig", errors="ignore")
-        reader = csv.DictReader(io.StringIO(decoded))
-        rows = [dict(r) for r in reader]
-    elif filename.endswith(".xlsx"):
-        wb = load_workbook(io.BytesIO(content), read_only=True)
+
+def _iter_xlsx_import_rows(stream) -> Iterator[dict]:
+    # openpyxl 仅 XLSX 导入使用，按需导入。
+    from openpyxl import load_workbook
+
+    wb = load_workbook(stream, read_only=True, data_only=True)
+    try:
         ws = wb.active
         if ws is None:
             raise HTTPException(status_code=400, detail="XLSX 工作表为空")
-        headers = [
-            str(c.value).strip() if c.value else ""
-            for c in next(ws.iter_rows(min_row=1, max_row=1))
-        ]
-        for row in ws.iter_rows(min_row=2):
+        rows = ws.iter_rows(values_only=True)
+        header_row = next(rows, None) or ()
+        headers = [str(v).strip() if v else "" for v in header_row]
+        for values in rows:
             item = {}
-            for idx, cell in enumerate(row):
+            for idx, value in enumerate(values):
                 key = headers[idx] if idx < len(headers) else f"col_{idx}"
-                item[key] = "" if cell.value is None else str(cell.value)
-            rows.append(item)
-    else:
-        raise HTTPException(status_code=400, detail="仅支持 CSV 或 XLSX 文件")
+                item[key] = "" if value is None else str(value)
+            yield item
+    finally:
+        wb.close()
+
+
+def _parse_import_row(row: dict) -> dict:
+    title = (row.get("title") or row.get("标题") or "").strip()
+    speaker = (row.get("speaker") or row.get("发言人") or "").strip()
+    summary_raw = (row.get("summary_raw") or row.get("总结原文") or "").strip()
+    meeting_time_str = (row.get("meeting_time") or row.get("时间") or "").strip()
+
+    if not title or not speaker or not summary_raw or not meeting_time_str:
+        raise ValueError("缺少必填字段")
+
+    try:
+        meeting_time = datetime.fromisoformat(meeting_time_str)
+    except ValueError:
+        meeting_time = datetime.strptime(meeting_time_str, "%Y-%m-%d")
+
+    now = now_local_naive()
+    return {
+        "title": title,
+        "speaker": speaker,
+        "summary_raw": summary_raw,
+        "source_language": _detect_source_language(title, summary_raw, ""),
+        "meeting_time": meeting_time,
+        "auto_play_enabled": False,
+        "status": "draft",
+        "created_at": now,
+        "updated_at": now,
+    }
+
 
+def _import_rows_in_batches(
+    db: Session, rows: Iterator[dict]
+) -> tuple[int, int, list[str]]:
+    """逐行校验并分批写入新闻，返回 (成功数, 失败数, 逐行错误)。"""
     success_count = 0
     failed_count = 0
     errors: list[str] = []
+    batch: list[dict] = []
+
+    def _flush_batch() -> None:
+        nonlocal success_count
+        if not batch:
+            return
+        # 只索引本批写入的行：新 id 取自本批的 RETURNING / 自增主键，
+        # 不按 id 区间回查，避免把其他进程同时写入的新闻算进来。
+        if db.get_bind().dialect.insert_executemany_returning:
+            new_ids = list(
+                db.execute(
+                    insert(MeetingReport).returning(MeetingReport.id), batch
+                ).scalars()
+            )
+        else:
+            # 不支持批量 RETURNING 的方言（MySQL）在同一事务内逐行写入取自增主键。
+            new_ids = [
+                db.execute(insert(MeetingReport).values(**row)).inserted_primary_key[0]
+                for row in batch
+            ]
+        # Core 批量写入不触发会话事件，需手动同步检索表。
+        index_reports(db, new_ids)
+        # 分批提交，避免 SQLite 在整个导入期间持有写锁。
+        db.commit()
+        success_count += len(batch)
+        batch.clear()
 
     for idx, row in enumerate(rows, start=2):
         try:
-            title = (row.get("title") or row.get("标题") or "").strip()
-            speaker = (row.get("speaker") or row.get("发言人") or "").strip()
-            summary_raw = (row.get("summary_raw") or row.get("总结原文") or "").strip()
-            meeting_time_str = (
-                row.get("meeting_time") or row.get("时间") or ""
-            ).strip()
-
-            if not title or not speaker or not summary_raw or not meeting_time_str:
-                raise ValueError("缺少必填字段")
-
-            try:
-                meeting_time = datetime.fromisoformat(meeting_time_str)
-            except ValueError:
-                meeting_time = datetime.strptime(meeting_time_str, "%Y-%m-%d")
-
-            db.add(
-                MeetingReport(
-                    title=title,
-                    speaker=speaker,
-                    summary_raw=summary_raw,
-                    source_language=_detect_source_language(title, summary_raw, ""),
-                    meeting_time=meeting_time,
-                    auto_play_enabled=False,
-                    status="draft",
-                    created_at=now_local_naive(),
-                    updated_at=now_local_naive(),
-                )
-            )
-            success_count += 1
+            batch.append(_parse_import_row(row))
         except Exception as exc:
             failed_count += 1
             errors.append(f"第 {idx} 行导入失败: {exc}")
+            continue
+        if len(batch) >= _IMPORT_BATCH_SIZE:
+            _flush_batch()
+    _flush_batch()
 
-    db.commit()
+    return success_count, failed_count, errors
+
+
+@router.post("/import/file", response_model=ImportResponse)
+def import_reports_from_file(
+    file: UploadFile = File(...), db: Session = Depends(get_db)
+):
+    # 同步路由由 FastAPI 放到线程池执行，大文件解析与入库不阻塞事件循环。
+    # 上传内容由 Starlette 溢写到临时文件，这里按行流式读取，不整体载入内存。
+    filename = (file.filename or "").lower()
+    if filename.endswith(".csv"):
+        rows = _iter_csv_import_rows(file.file)
+    elif filename.endswith(".xlsx"):
+        rows = _iter_xlsx_import_rows(file.file)
+    else:
+        raise HTTPException(status_code=400, detail="仅支持 CSV 或 XLSX 文件")
+
+    success_count, failed_count, errors = _import_rows_in_batches(db, rows)
     return ImportResponse(
         success_count=success_count, failed_count=failed_count, errors=errors
     )
 
 
+def _build_feishu_client() -> FeishuApiClient:
+    return FeishuApiClient(
+        app_id=settings.feishu_app_id or "",
+        app_secret=settings.feishu_app_secret or "",
+        api_base=settings.feishu_api_base,
+        timeout_sec=settings.feishu_timeout_sec,
+        verify_ssl=settings.feishu_verify_ssl,
+    )
+
+
+def _get_import_executor(source_type: str) -> ThreadPoolExecutor:
+    """按来源分组的导入线程池，线程数即该组的并发上限。"""
+    group = "file" if source_type == "file" else "feishu"
+    with _import_job_lock:
+        executor = _import_executors.get(group)
+        if executor is None:
+            limit = (
+                settings.import_file_concurrency
+                if group == "file"
+                else settings.import_feishu_concurrency
+            )
+            executor = ThreadPoolExecutor(
+                max_workers=max(1, int(limit)),
+                thread_name_prefix=f"report-import-{group}",
+            )
+            _import_executors[group] = executor
+        return executor
+
+
+def _get_import_followup_executor() -> ThreadPoolExecutor:
+    global _import_followup_executor
+    with _import_job_lock:
+        if _import_followup_executor is None:
+            _import_followup_executor = ThreadPoolExecutor(
+                max_workers=max(1, int(settings.import_job_max_workers)),
+                thread_name_prefix="report-import-followup",
+            )
+        return _import_followup_executor
+
+
+def _resolve_import_source_type(source_type: str, source_url: str) -> str:
+    key = (source_type or "").strip().lower()
+    if key in {"", "auto", "feishu"}:
+        if FeishuApiClient.parse_docx_token(source_url):
+            return "feishu_docx"
+        if FeishuApiClient.parse_minutes_token(source_url):
+            return "feishu_minutes"
+        return "feishu_meeting"
+    if key not in IMPORT_SOURCE_TYPES:
+        raise HTTPException(status_code=400, detail=f"不支持的导入来源: {source_type}")
+    return key
+
+
+def _update_import_job_item(task_id: str, index: int, **fields) -> None:
+    with _import_job_lock:
+        job = _import_job_state.get(task_id)
+        if not job:
+            return
+        job["items"][index].update(fields)
+        job["updated_at"] = now_local_naive()
+
+
+def _create_import_job(items: list[dict]) -> str:
+    task_id = uuid4().hex
+    now = now_local_naive()
+    with _import_job_lock:
+        # 只保留最近的任务状态，优先淘汰已结束的旧任务。
+        while len(_import_job_state) >= _IMPORT_JOB_HISTORY_MAX:
+            finished = [
+                key
+                for key, job in _import_job_state.items()
+                if all(x["status"] in {"succeeded", "failed"} for x in job["items"])
+            ]
+            _import_job_state.pop(
+                finished[0] if finished else next(iter(_import_job_state))
+            )
+        _import_job_state[task_id] = {
+            "created_at": now,
+            "updated_at": now,
+            "items": [
+                {
+                    "index": idx,
+                    "status": "queued",
+                    "report_ids": [],
+                    "imported_count": 0,
+                    "updated_count": 0,
+                    "failed_count": 0,
+                    "message": "",
+                    "started_at": None,
+                    "finished_at": None,
+                    **item,
+                }
+                for idx, item in enumerate(items)
+            ],
+        }
+    for idx, item in enumerate(items):
+        _get_import_executor(item["source_type"]).submit(
+            _run_import_job_item, task_id, idx
+        )
+    return task_id
+
+
+def _run_import_job_item(task_id: str, index: int) -> None:
+    with _import_job_lock:
+        job = _import_job_state.get(task_id)
+        if not job:
+            return
+        item = dict(job["items"][index])
+
+    _update_import_job_item(
+        task_id, index, status="running", started_at=now_local_naive()
+    )
+    db = background_session()
+    refresh_ids: set[int] = set()
+    try:
+        result = _import_single_source(db, item)
+        refresh_ids = result.pop("refresh_ids", set())
+        _update_import_job_item(
+            task_id,
+            index,
+            status="failed"
+            if result.get("failed_count")
+            and not (result.get("report_ids") or result.get("imported_count"))
+            else "succeeded",
+            finished_at=now_local_naive(),
+            **result,
+        )
+    except Exception as exc:
+        db.rollback()
+        _update_import_job_item(
+            task_id,
+            index,
+            status="failed",
+            failed_count=1,
+            message=f"导入失败: {exc}",
+            finished_at=now_local_naive(),
+        )
+    finally:
+        db.close()
+        temp_path = item.get("temp_path")
+        if temp_path:
+            Path(temp_path).unlink(missing_ok=True)
+
+    # 翻译与反思音频耗时较长，交给后续任务线程池，不占用导入进度与导入线程。
+    executor = _get_import_followup_executor()
+    for report_id in refresh_ids:
+        executor.submit(_refresh_report_translations_job, report_id)
+        executor.submit(_synthesize_reflection_audios_job, report_id)
+
+
+def _import_single_source(db: Session, item: dict) -> dict:
+    source_type = item["source_type"]
+    source_url = item["source_url"]
+
+    if source_type == "file":
+        with open(item["temp_path"], "rb") as stream:
+            if source_url.lower().endswith(".csv"):
+                rows = _iter_csv_import_rows(stream)
+            else:
+                rows = _iter_xlsx_import_rows(stream)
+            success_count, failed_count, errors = _import_rows_in_batches(db, rows)
+        return {
+            "imported_count": success_count,
+            "failed_count": failed_count,
+            "message": "；".join(errors[:20]),
+        }
+
+    client = _build_feishu_client()
+    if source_type == "feishu_docx":
+        document_id = client.parse_docx_token(source_url)
+        if not document_id:
+            raise ValueError("文档链接解析失败")
+        result = client.get_docx_raw_content(document_id)
+        if result.get("code") != 0:
+            raise RuntimeError(
+                f"飞书API错误: {result.get('msg') or 'unknown'} (code: {result.get('code')})"
+            )
+        text_content = FeishuApiClient.extract_docx_text(result.get("content") or {})
+        if not text_content.strip():
+            raise ValueError("提取的文本内容为空，请检查文档是否有内容")
+        report, generated = _create_report_from_docx(
+            db,
+            document_id=document_id,
+            text_content=text_content,
+            docx_url=source_url,
+            auto_generate=item["auto_generate"],
+            auto_enable_playback=item["auto_enable_playback"],
+        )
+        return {
+            "report_ids": [report.id],
+            "imported_count": 1,
+            "message": "已自动生成口播稿" if generated else "",
+            "refresh_ids": {report.id} if generated else set(),
+        }
+
+    if source_type == "feishu_minutes":
+        source_items = client.fetch_items_from_minutes_url(source_url)
+    else:
+        source_items = client.fetch_items_from_meeting_url(
+            meeting_url=source_url, lookback_days=item["lookback_days"]
+        )
+    (
+        imported_count,
+        updated_count,
+        failed_count,
+        response_items,
+        translation_refresh_ids,
+    ) = _import_feishu_source_items(
+        db,
+        source_items,
+        meeting_url=source_url,
+        auto_generate=item["auto_generate"],
+        auto_enable_playback=item["auto_enable_playback"],
+    )
+    db.commit()
+    report_ids = [x.report_id for x in response_items if x.report_id is not None]
+    for report_id in report_ids:
+        invalidate_live_summary_cache(report_id)
+    return {
+        "report_ids": report_ids,
+        "imported_count": imported_count,
+        "updated_count": updated_count,
+        "failed_count": failed_count,
+        "message": "；".join(x.note for x in response_items if x.note),
+        "refresh_ids": translation_refresh_ids,
+    }
+
+
 @router.post("/import/source", response_model=SourceImportResponse)
 def import_reports_from_source(payload: SourceImportRequest):
-    # 预留第三方 API 导入能力，后续接异步任务队列。
+    sources = list(payload.sources)
+    if not sources and payload.source_url.strip():
+        sources = [
+            SourceImportItem(
+                source_type=payload.source_type or "auto",
+                source_url=payload.source_url,
+            )
+        ]
+    sources = [x for x in sources if x.source_url.strip()]
+    if not sources:
+        raise HTTPException(status_code=400, detail="未提供导入来源")
+    if not settings.feishu_app_id or not settings.feishu_app_secret:
+        raise HTTPException(
+            status_code=400, detail="后端未配置 FEISHU_APP_ID / FEISHU_APP_SECRET"
+        )
+
+    items = [
+        {
+            "source_type": _resolve_import_source_type(
+                x.source_type, x.source_url.strip()
+            ),
+            "source_url": x.source_url.strip(),
+            "lookback_days": x.lookback_days,
+            "auto_generate": payload.auto_generate,
+            "auto_enable_playback": payload.auto_enable_playback,
+        }
+        for x in sources
+    ]
+    task_id = _create_import_job(items)
     return SourceImportResponse(
-        task_id=f"pending-{uuid4().hex}",
-        accepted_count=0,
-        message="已接收导入请求，当前为预留接口，后续版本接入实际拉取逻辑。",
+        task_id=task_id,
+        accepted_count=len(items),
+        message=f"已受理 {len(items)} 个导入来源，可通过 /api/reports/import/jobs/{task_id} 查询进度",
+    )
+
+
+@router.post("/import/source/files", response_model=SourceImportResponse)
+def import_reports_from_source_files(files: list[UploadFile] = File(...)):
+    # 先校验全部文件名，再落盘，避免校验失败时遗留已写入的临时文件。
+    for upload in files:
+        filename = upload.filename or ""
+        if Path(filename.lower()).suffix not in {".csv", ".xlsx"}:
+            raise HTTPException(
+                status_code=400, detail=f"仅支持 CSV 或 XLSX 文件: {filename}"
+            )
+
+    items: list[dict] = []
+    try:
+        for upload in files:
+            filename = upload.filename or ""
+            suffix = Path(filename.lower()).suffix
+            # 请求结束后上传文件会被关闭，先落盘到临时文件交给后台任务读取。
+            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+                items.append(
+                    {
+                        "source_type": "file",
+                        "source_url": filename,
+                        "temp_path": tmp.name,
+                        "lookback_days": 0,
+                        "auto_generate": False,
+                        "auto_enable_playback": False,
+                    }
+                )
+                shutil.copyfileobj(upload.file, tmp)
+    except Exception:
+        for item in items:
+            Path(item["temp_path"]).unlink(missing_ok=True)
+        raise
+    if not items:
+        raise HTTPException(status_code=400, detail="未提供导入文件")
+
+    task_id = _create_import_job(items)
+    return SourceImportResponse(
+        task_id=task_id,
+        accepted_count=len(items),
+        message=f"已受理 {len(items)} 个导入文件，可通过 /api/reports/import/jobs/{task_id} 查询进度",
+    )
+
+
+@router.get("/import/jobs/{task_id}", response_model=ImportJobStatusResponse)
+def get_import_job(task_id: str):
+    with _import_job_lock:
+        job = _import_job_state.get(task_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="导入任务不存在或已过期")
+        items = [dict(x) for x in job["items"]]
+        created_at = job["created_at"]
+        updated_at = job["updated_at"]
+
+    completed = sum(1 for x in items if x["status"] in {"succeeded", "failed"})
+    failed = sum(1 for x in items if x["status"] == "failed")
+    if completed < len(items):
+        status = "running" if any(x["status"] != "queued" for x in items) else "queued"
+    elif failed == len(items):
+        status = "failed"
+    elif failed:
+        status = "completed_with_errors"
+    else:
+        status = "completed"
+
+    return ImportJobStatusResponse(
+        task_id=task_id,
+        status=status,
+        total=len(items),
+        completed=completed,
+        failed=failed,
+        created_at=created_at,
+        updated_at=updated_at,
+        items=[
+            ImportJobItemStatus(
+                index=x["index"],
+                source_type=x["source_type"],
+                source_url=x["source_url"],
+                status=x["status"],
+                report_ids=list(x["report_ids"]),
+                imported_count=x["imported_count"],
+                updated_count=x["updated_count"],
+                failed_count=x["failed_count"],
+                message=x["message"],
+                started_at=x["started_at"],
+                finished_at=x["finished_at"],
+            )
+            for x in items
+        ],
     )
 
 
@@ -2310,6 +3418,81 @@ def diagnose_feishu_docx(payload: FeishuDocxDiagnoseRequest):
     )
 
 
+def _create_report_from_docx(
+    db: Session,
+    document_id: str,
+    text_content: str,
+    docx_url: str,
+    auto_generate: bool,
+    auto_enable_playback: bool,
+) -> tuple[MeetingReport, bool]:
+    """根据飞书文档正文创建新闻（已提交），返回 (新闻, 是否已自动生成)。"""
+    # 3. 创建新闻记录
+    title = f"飞书文档_{document_id[:8]}"  # 默认标题
+    try:
+        # 尝试从文档内容提取标题（取第一行作为标题）
+        lines = [line.strip() for line in text_content.split("\n") if line.strip()]
+        if lines:
+            title = lines[0][:100]  # 限制标题长度
+    except Exception:
+        pass
+
+    report = MeetingReport(
+        title=title,
+        meeting_time=now_local_naive(),
+        speaker="",
+        summary_raw=text_content,
+        source_language=_detect_source_language(title, text_content, ""),
+        question_persona="board_director",
+        script_draft="",
+        script_final="",
+        auto_play_enabled=bool(auto_enable_playback),
+        status="draft",
+        source_type="feishu_docx",
+        source_meeting_no="",
+        source_meeting_id=f"docx:{document_id}",
+        source_minute_token="",
+        source_url=docx_url,
+        created_at=now_local_naive(),
+        updated_at=now_local_naive(),
+    )
+    db.add(report)
+    db.commit()
+    db.refresh(report)
+
+    # 4. 自动生成（如果启用）
+    generated = False
+    if auto_generate and text_content.strip():
+        try:
+            script, highlights, reflections, questions = generate_script_and_highlights(
+                summary_raw=report.summary_raw,
+                speaker=report.speaker,
+                title=report.title,
+                question_persona=_normalize_question_persona_key(
+                    report.question_persona
+                ),
+            )
+            report.script_draft = script
+            report.script_final = script
+            report.updated_at = now_local_naive()
+            _set_highlights(db, report.id, "draft", highlights[:2])
+            _set_highlights(db, report.id, "final", highlights[:2])
+            _set_reflections(db, report.id, _normalize_reflections(reflections))
+            _set_questions(
+                db,
+                report.id,
+                _normalize_questions(questions),
+                _normalize_question_persona_key(report.question_persona),
+            )
+            db.commit()
+            generated = True
+        except Exception:
+            # 生成失败不阻断导入链路，保留原始文档内容供人工编辑
+            db.rollback()
+
+    return report, generated
+
+
 @router.post("/import/feishu-docx", response_model=FeishuDocxImportResponse)
 def import_report_from_feishu_docx(
     payload: FeishuDocxImportRequest,
@@ -2385,68 +3568,19 @@ def import_report_from_feishu_docx(
             error=str(exc),
         )
 
-    # 3. 创建新闻记录
-    title = f"飞书文档_{document_id[:8]}"  # 默认标题
-    try:
-        # 尝试从文档内容提取标题（取第一行作为标题）
-        lines = [line.strip() for line in text_content.split("\n") if line.strip()]
-        if lines:
-            title = lines[0][:100]  # 限制标题长度
-    except Exception:
-        pass
-
-    report = MeetingReport(
-        title=title,
-        meeting_time=now_local_naive(),
-        speaker="",
-        summary_raw=text_content,
-        source_language=_detect_source_language(title, text_content, ""),
-        question_persona="board_director",
-        script_draft="",
-        script_final="",
-        auto_play_enabled=bool(payload.auto_enable_playback),
-        status="draft",
-        source_type="feishu_docx",
-        source_meeting_no="",
-        source_meeting_id=f"docx:{document_id}",
-        source_minute_token="",
-        source_url=payload.docx_url,
-        created_at=now_local_naive(),
-        updated_at=now_local_naive(),
+    # 3. 创建新闻记录并按需自动生成
+    report, generated = _create_report_from_docx(
+        db,
+        document_id=document_id,
+        text_content=text_content,
+        docx_url=payload.docx_url,
+        auto_generate=payload.auto_generate,
+        auto_enable_playback=payload.auto_enable_playback,
     )
-    db.add(report)
-    db.commit()
-    db.refresh(report)
-
-    # 4. 自动生成（如果启用）
-    if payload.auto_generate and text_content.strip():
-        try:
-            script, highlights, reflections, questions = generate_script_and_highlights(
-                summary_raw=report.summary_raw,
-                speaker=report.speaker,
-                title=report.title,
-                question_persona=_normalize_question_persona_key(
-                    report.question_persona
-                ),
-            )
-            report.script_draft = script
-            report.script_final = script
-            report.updated_at = now_local_naive()
-            _set_highlights(db, report.id, "draft", highlights[:2])
-            _set_highlights(db, report.id, "final", highlights[:2])
-            _set_reflections(db, report.id, _normalize_reflections(reflections))
-            _set_questions(
-                db,
-                report.id,
-                _normalize_questions(questions),
-                _normalize_question_persona_key(report.question_persona),
-            )
-            db.commit()
-            background_tasks.add_task(_refresh_report_translations_job, report.id)
-            background_tasks.add_task(_synthesize_reflection_audios_job, report.id)
-        except Exception:
-            # 生成失败不阻断导入链路，保留原始文档内容供人工编辑
-            db.rollback()
+    title = report.title
+    if generated:
+        background_tasks.add_task(_refresh_report_translations_job, report.id)
+        background_tasks.add_task(_synthesize_reflection_audios_job, report.id)
 
     return FeishuDocxImportResponse(
         success=True,
@@ -2458,34 +3592,19 @@ def import_report_from_feishu_docx(
     )
 
 
-@router.post("/import/feishu-meeting", response_model=FeishuMeetingImportResponse)
-def import_reports_from_feishu_meeting(
-    payload: FeishuMeetingImportRequest,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
-):
-    if not settings.feishu_app_id or not settings.feishu_app_secret:
-        raise HTTPException(
-            status_code=400, detail="后端未配置 FEISHU_APP_ID / FEISHU_APP_SECRET"
-        )
+def _import_feishu_source_items(
+    db: Session,
+    source_items: list[FeishuRawItem],
+    meeting_url: str,
+    auto_generate: bool,
+    auto_enable_playback: bool,
+) -> tuple[int, int, int, list[FeishuMeetingImportItem], set[int]]:
+    """将飞书会议/妙记条目写入新闻表，逐条提交。
 
-    try:
-        client = FeishuApiClient(
-            app_id=settings.feishu_app_id,
-            app_secret=settings.feishu_app_secret,
-            api_base=settings.feishu_api_base,
-            timeout_sec=settings.feishu_timeout_sec,
-            verify_ssl=settings.feishu_verify_ssl,
-        )
-        source_items = client.fetch_items_from_url(
-            source_url=payload.meeting_url,
-            lookback_days=payload.lookback_days,
-        )
-    except ValueError as exc:
-        raise HTTPException(status_code=400, detail=str(exc)) from exc
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"飞书导入失败: {exc}") from exc
+    章节纪要与口播稿的大模型调用在每条写入之前完成，写入只占一个短事务。
 
+    返回 (新增数, 更新数, 失败数, 明细, 需要刷新翻译的 report_id)。
+    """
     # 同一次导入按 meeting_id 去重，避免重复处理。
     unique_items: list[FeishuRawItem] = []
     seen_meeting_ids: set[str] = set()
@@ -2539,6 +3658,33 @@ def import_reports_from_feishu_meeting(
                     .first()
                 )
 
+            # 大模型生成放在写入之前：SQLite 下首次 flush 即持有写闸门直到提交，
+            # 不能在持有期间等待模型返回。
+            note_parts: list[str] = []
+            generated: tuple[str, list[str], list[str], list[str]] | None = None
+            question_persona = _normalize_question_persona_key(
+                report.question_persona if report is not None else "board_director"
+            )
+            should_generate = bool(
+                auto_generate
+                and source.transcript_status == "ready"
+                and source.transcript_text.strip()
+            )
+            if should_generate:
+                try:
+                    generated = generate_script_and_highlights(
+                        summary_raw=summary_raw,
+                        speaker=speaker,
+                        title=title,
+                        question_persona=question_persona,
+                    )
+                except Exception as exc:
+                    note_parts.append(f"AI 生成失败: {exc}")
+            elif auto_generate:
+                note_parts.append(
+                    f"未执行 AI 生成（文字记录状态: {source.transcript_status}）"
+                )
+
             created = report is None
             if created:
                 report = MeetingReport(
@@ -2550,13 +3696,13 @@ def import_reports_from_feishu_meeting(
                     question_persona="board_director",
                     script_draft="",
                     script_final="",
-                    auto_play_enabled=bool(payload.auto_enable_playback),
+                    auto_play_enabled=bool(auto_enable_playback),
                     status="draft",
                     source_type="feishu_meeting",
                     source_meeting_no=source.meeting_no,
                     source_meeting_id=source.meeting_id,
                     source_minute_token=source.minute_token,
-                    source_url=source.minute_url or payload.meeting_url,
+                    source_url=source.minute_url or meeting_url,
                     created_at=now_local_naive(),
                     updated_at=now_local_naive(),
                 )
@@ -2577,50 +3723,38 @@ def import_reports_from_feishu_meeting(
                 report.source_meeting_no = source.meeting_no
                 report.source_meeting_id = source.meeting_id
                 report.source_minute_token = source.minute_token
-                report.source_url = source.minute_url or payload.meeting_url
-                if payload.auto_enable_playback:
+                report.source_url = source.minute_url or meeting_url
+                if auto_enable_playback:
                     report.auto_play_enabled = True
                 report.updated_at = now_local_naive()
                 db.flush()
 
-            note_parts: list[str] = []
-            should_generate = bool(
-                payload.auto_generate
-                and source.transcript_status == "ready"
-                and source.transcript_text.strip()
-            )
-            if should_generate:
-                try:
-                    script, highlights, reflections, questions = (
-                        generate_script_and_highlights(
-                            summary_raw=report.summary_raw,
-                            speaker=report.speaker,
-                            title=report.title,
-                            question_persona=_normalize_question_persona_key(
-                                report.question_persona
-                            ),
-                        )
-                    )
-                    report.script_draft = script
-                    report.script_final = script
-                    _set_highlights(db, report.id, "draft", highlights[:2])
-                    _set_highlights(db, report.id, "final", highlights[:2])
-                    _set_reflections(db, report.id, _normalize_reflections(reflections))
-                    _set_questions(
-                        db,
-                        report.id,
-                        _normalize_questions(questions),
-                        _normalize_question_persona_key(report.question_persona),
-                    )
-                    translation_refresh_ids.add(report.id)
-                    note_parts.append("已自动生成口播稿与亮点")
-                except Exception as exc:
-                    note_parts.append(f"AI 生成失败: {exc}")
-            else:
-                if payload.auto_generate:
-                    note_parts.append(
-                        f"未执行 AI 生成（文字记录状态: {source.transcript_status}）"
-                    )
+            if source.transcript_status == "ready" and source.transcript_text.strip():
+                _sync_transcript_segments(
+                    db,
+                    report.id,
+                    FeishuApiClient.parse_transcript_segments(source.transcript_text),
+                )
+
+            if generated is not None:
+                script, highlights, reflections, questions = generated
+                report.script_draft = script
+                report.script_final = script
+                _set_highlights(db, report.id, "draft", highlights[:2])
+                _set_highlights(db, report.id, "final", highlights[:2])
+                _set_reflections(db, report.id, _normalize_reflections(reflections))
+                _set_questions(
+                    db,
+                    report.id,
+                    _normalize_questions(questions),
+                    question_persona,
+                )
+                note_parts.append("已自动生成口播稿与亮点")
+
+            # 逐条提交，写闸门只在本条写入期间持有。
+            db.commit()
+            if generated is not None:
+                translation_refresh_ids.add(report.id)
 
             if source.transcript_error:
                 note_parts.append(source.transcript_error)
@@ -2645,6 +3779,8 @@ def import_reports_from_feishu_meeting(
                 )
             )
         except Exception as exc:
+            # 只回滚本条未提交的写入，已提交的条目不受影响。
+            db.rollback()
             failed_count += 1
             response_items.append(
                 FeishuMeetingImportItem(
@@ -2659,7 +3795,61 @@ def import_reports_from_feishu_meeting(
                 )
             )
 
+    return (
+        imported_count,
+        updated_count,
+        failed_count,
+        response_items,
+        translation_refresh_ids,
+    )
+
+
+@router.post("/import/feishu-meeting", response_model=FeishuMeetingImportResponse)
+def import_reports_from_feishu_meeting(
+    payload: FeishuMeetingImportRequest,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db),
+):
+    if not settings.feishu_app_id or not settings.feishu_app_secret:
+        raise HTTPException(
+            status_code=400, detail="后端未配置 FEISHU_APP_ID / FEISHU_APP_SECRET"
+        )
+
+    try:
+        client = FeishuApiClient(
+            app_id=settings.feishu_app_id,
+            app_secret=settings.feishu_app_secret,
+            api_base=settings.feishu_api_base,
+            timeout_sec=settings.feishu_timeout_sec,
+            verify_ssl=settings.feishu_verify_ssl,
+        )
+        source_items = client.fetch_items_from_url(
+            source_url=payload.meeting_url,
+            lookback_days=payload.lookback_days,
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"飞书导入失败: {exc}") from exc
+
+    (
+        imported_count,
+        updated_count,
+        failed_count,
+        response_items,
+        translation_refresh_ids,
+    ) = _import_feishu_source_items(
+        db,
+        source_items,
+        meeting_url=payload.meeting_url,
+        auto_generate=payload.auto_generate,
+        auto_enable_playback=payload.auto_enable_playback,
+    )
+
     db.commit()
+    for item in response_items:
+        if item.report_id is not None:
+            invalidate_live_summary_cache(item.report_id)
     for report_id in translation_refresh_ids:
         background_tasks.add_task(_refresh_report_translations_job, report_id)
         background_tasks.add_task(_synthesize_reflection_audios_job, report_id)
@@ -2674,57 +3864,164 @@ def import_reports_from_feishu_meeting(
     )
 
 
-@router.get("/playback/queue", response_model=PlaybackQueueResponse)
+def _build_playback_queue_item(
+    db: Session,
+    report: MeetingReport,
+    *,
+    include_audio: bool,
+    audio_languages: set[str],
+    audio_formats: list[str],
+    audio_refs: bool,
+) -> PlaybackQueueItem:
+    highlights_final = [
+        h.highlight_text
+        for h in sorted(
+            [h for h in report.highlights if h.kind == "final"], key=lambda x: x.seq
+        )
+    ][:2]
+    reflections_final = [
+        r.reflection_text for r in sorted(report.reflections, key=lambda x: x.seq)
+    ][:5]
+    questions_final = [
+        q.question_text for q in sorted(report.questions, key=lambda x: x.seq)
+    ][:3]
+    return PlaybackQueueItem(
+        id=report.id,
+        title=report.title,
+        speaker=report.speaker,
+        meeting_time=report.meeting_time,
+        script_final=report.script_final,
+        highlights_final=highlights_final,
+        reflections_final=reflections_final,
+        questions_final=questions_final,
+        question_persona=_normalize_question_persona_key(report.question_persona),
+        localized=_build_localized_payload(
+            db,
+            report,
+            highlights_final,
+            reflections_final,
+            questions_final,
+            include_audio=include_audio,
+            audio_languages=audio_languages,
+            audio_formats=audio_formats,
+            audio_refs=audio_refs,
+        ),
+    )
+
+
+@router.get(
+    "/playback/queue",
+    response_model=PlaybackQueueResponse,
+    response_class=FastJSONResponse,
+)
 def get_playback_queue(
     include_audio: bool = Query(False),
     langs: str | None = Query(None),
     report_id: int | None = Query(None),
-    db: Session = Depends(get_db),
+    audio_format: str | None = Query(None),
+    audio_mode: str | None = Query(None, description="inline（默认）或 ref"),
+    current_id: int | None = Query(None),
+    since: int | None = Query(None, ge=0),
+    db: Session = Depends(get_read_db),
 ):
+    audio_formats = _parse_audio_formats(audio_format)
+    audio_refs = audio_mode == "ref"
     langs_text = langs if isinstance(langs, str) else ""
     audio_languages = {x.strip() for x in langs_text.split(",") if x.strip()}
     report_id_value = report_id if isinstance(report_id, int) else None
-    reports = (
+    note_carousel_activity(
+        audio_languages & LANGUAGE_TARGETS.keys(),
+        current_id if isinstance(current_id, int) else None,
+    )
+    # 先取版本号再读数据：期间提交的变动会在下次轮询重复返回，不会遗漏。
+    version = current_change_version(db)
+    changed_ids = (
+        changed_reports_since(db, since, version) if isinstance(since, int) else None
+    )
+    query = (
         db.query(MeetingReport)
+        .options(undefer(MeetingReport.script_final))
         .filter(MeetingReport.auto_play_enabled.is_(True))
-        .order_by(desc(MeetingReport.meeting_time), desc(MeetingReport.id))
-        .all()
     )
     if report_id_value is not None:
-        reports = [x for x in reports if x.id == report_id_value]
+        query = query.filter(MeetingReport.id == report_id_value)
+    if changed_ids is not None:
+        query = query.filter(MeetingReport.id.in_(changed_ids))
+    reports = query.order_by(
+        desc(MeetingReport.meeting_time), desc(MeetingReport.id)
+    ).all()
+
+    item_options = dict(
+        include_audio=include_audio,
+        audio_languages=audio_languages,
+        audio_formats=audio_formats,
+        audio_refs=audio_refs,
+    )
+    items = [
+        _build_playback_queue_item(db, report, **item_options)
+        for report in reports
+        if report.script_final.strip()
+    ]
 
-    items: list[PlaybackQueueItem] = []
-    for report in reports:
-        if not report.script_final.strip():
-            continue
-        highlights_final = sorted(
-            [h for h in report.highlights if h.kind == "final"], key=lambda x: x.seq
-        )
-        reflections_final = sorted(report.reflections, key=lambda x: x.seq)
-        questions_final = sorted(report.questions, key=lambda x: x.seq)
-        items.append(
-            PlaybackQueueItem(
-                id=report.id,
-                title=report.title,
-                speaker=report.speaker,
-                meeting_time=report.meeting_time,
-                script_final=report.script_final,
-                highlights_final=[h.highlight_text for h in highlights_final][:2],
-                reflections_final=[r.reflection_text for r in reflections_final][:5],
-                questions_final=[q.question_text for q in questions_final][:3],
-                question_persona=_normalize_question_persona_key(
-                    report.question_persona
-                ),
-                localized=_build_localized_payload(
-                    db,
-                    report,
-                    [h.highlight_text for h in highlights_final][:2],
-                    [r.reflection_text for r in reflections_final][:5],
-                    [q.question_text for q in questions_final][:3],
-                    include_audio=include_audio,
-                    audio_languages=audio_languages,
-                ),
+    if changed_ids is None:
+        ordered_ids = [item.id for item in items]
+    else:
+        # 增量响应只带变动项，total 与预取仍按完整队列计算（仅查 id，不加载正文）。
+        id_query = db.query(MeetingReport.id).filter(
+            MeetingReport.auto_play_enabled.is_(True),
+            func.trim(MeetingReport.script_final) != "",
+        )
+        if report_id_value is not None:
+            id_query = id_query.filter(MeetingReport.id == report_id_value)
+        ordered_ids = [
+            row.id
+            for row in id_query.order_by(
+                desc(MeetingReport.meeting_time), desc(MeetingReport.id)
             )
-        )
+        ]
 
-    return PlaybackQueueResponse(items=items, total=len(items))
+    prefetch: list[AudioRefItem] = []
+    if audio_refs and ordered_ids:
+        # 轮播按队列顺序循环：提示当前播放项的下一条，未传 current_id 时提示第一条。
+        current = current_id if isinstance(current_id, int) else None
+        next_id = ordered_ids[
+            (ordered_ids.index(current) + 1) % len(ordered_ids)
+            if current in ordered_ids
+            else 0
+        ]
+        next_item = next((item for item in items if item.id == next_id), None)
+        if next_item is None:
+            next_report = (
+                db.query(MeetingReport)
+                .options(undefer(MeetingReport.script_final))
+                .filter(MeetingReport.id == next_id)
+                .first()
+            )
+            if next_report is not None:
+                next_item = _build_playback_queue_item(
+                    db, next_report, **item_options
+                )
+        localized_items = next_item.localized.items() if next_item else []
+        for language_key, localized in localized_items:
+            if audio_languages and language_key not in audio_languages:
+                continue
+            ref = localized.get("audio_ref")
+            if ref:
+                prefetch.append(AudioRefItem(**ref))
+
+    if changed_ids is not None:
+        # 增量响应：变动过但已不在队列中的（关闭播报、清空口播稿、删除）作为 deleted_ids。
+        if report_id_value is not None:
+            changed_ids &= {report_id_value}
+        return PlaybackQueueResponse(
+            items=items,
+            total=len(ordered_ids),
+            prefetch=prefetch,
+            version=version,
+            full=False,
+            deleted_ids=sorted(changed_ids - {item.id for item in items}),
+        )
+
+    return PlaybackQueueResponse(
+        items=items, total=len(items), prefetch=prefetch, version=version
+    )
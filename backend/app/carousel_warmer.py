@@ -0,0 +1,277 @@
+"""轮播预热：提前为接下来要播的新闻准备译文与音频。
+
+carousel_summary 模式下播放屏按播报队列顺序轮播。某条新闻缺少某语种译文或音频时，
+前端只能临时调用 /synthesize-audio，在条目切换处出现停顿。
+
+后台线程按 CAROUSEL_WARM_INTERVAL_SEC 周期（或播放屏上报当前条目时立即）执行：
+根据 PlaybackRuntimeSetting（模式、轮播范围、选中新闻）与队列顺序，确定当前条目
+及其后 CAROUSEL_WARM_COUNT 条，逐条确认播放屏所用语种已有译文与音频，缺失则补齐。
+所用语种取 CAROUSEL_WARM_LANGUAGES；未配置时取播放屏近期请求过的语种。
+
+播放屏的请求会分散到各 worker：每个 worker 先在内存中记录所服务请求的语种与
+当前条目，每轮写入共享表 carousel_screen_activity，预热按共享表的合并结果进行。
+多 worker 部署时每轮再非阻塞地获取跨进程锁（见 process_lock），
+未获取到的 worker 跳过本轮，同一时刻只有一个进程在预热。
+预热失败的条目按内容摘要记录，以指数退避重试，内容变化后立即重试。
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import desc
+
+from .config import settings
+from .database import SessionLocal
+from .models import CarouselScreenActivity, MeetingReport, PlaybackRuntimeSetting
+from .process_lock import cross_process_lock
+from .utils.timezone import now_local_naive
+from .write_queue import run_background_write
+
+logger = logging.getLogger(__name__)
+
+# 播放屏请求过的语种在这段时间内视为“正在使用”。
+_RECENT_LANGUAGE_TTL_SEC = 600
+# 预热失败后的重试间隔从一个预热周期起翻倍，最长不超过该值。
+_FAILURE_BACKOFF_MAX_SEC = 3600
+_WARM_LOCK_NAME = "carousel_warm"
+
+_activity_lock = threading.Lock()
+# 本进程尚未写入共享表的活动：语种 -> 上报时间；当前条目 (新闻, 上报时间)。
+_pending_languages: dict[str, datetime] = {}
+_pending_current: tuple[int, datetime] | None = None
+_last_report_id: int | None = None
+
+_failures_lock = threading.Lock()
+# (新闻, 语种) -> (内容摘要, 连续失败次数, 下次允许重试的 monotonic 时间)
+_failures: dict[tuple[int, str], tuple[str, int, float]] = {}
+
+_status_lock = threading.Lock()
+_status: dict = {"enabled": False, "runs": 0, "last_run_at": None, "last": {}}
+_wake_event = threading.Event()
+_stop_event = threading.Event()
+_thread: threading.Thread | None = None
+
+
+def note_carousel_activity(
+    languages=None, current_report_id: int | None = None
+) -> None:
+    """记录播放屏正在使用的语种与当前播放条目；条目变化时立即唤醒预热。"""
+    global _pending_current, _last_report_id
+    now = now_local_naive()
+    wake = False
+    with _activity_lock:
+        for language_key in languages or ():
+            if language_key:
+                _pending_languages[language_key] = now
+        if current_report_id is not None:
+            _pending_current = (current_report_id, now)
+            if current_report_id != _last_report_id:
+                _last_report_id = current_report_id
+                wake = True
+    if wake:
+        _wake_event.set()
+
+
+def _flush_screen_activity() -> None:
+    """把本进程记录的播放屏活动写入共享表，已有记录只在时间更新时覆盖。"""
+    global _pending_current
+    with _activity_lock:
+        entries: dict[str, tuple[int | None, datetime]] = {
+            f"lang:{language_key}": (None, seen_at)
+            for language_key, seen_at in _pending_languages.items()
+        }
+        if _pending_current is not None:
+            entries["current"] = _pending_current
+        _pending_languages.clear()
+        _pending_current = None
+    if not entries:
+        return
+
+    def _save(db) -> None:
+        rows = {
+            row.activity_key: row
+            for row in db.query(CarouselScreenActivity).filter(
+                CarouselScreenActivity.activity_key.in_(list(entries))
+            )
+        }
+        for key, (report_id, seen_at) in entries.items():
+            row = rows.get(key)
+            if row is None:
+                db.add(
+                    CarouselScreenActivity(
+                        activity_key=key, report_id=report_id, seen_at=seen_at
+                    )
+                )
+            elif seen_at > row.seen_at:
+                row.report_id = report_id
+                row.seen_at = seen_at
+
+    run_background_write(_save)
+
+
+def _screen_activity() -> tuple[list[str], int | None]:
+    """读取各 worker 汇总的近期活动，返回 (在用语种, 当前播放条目)。"""
+    cutoff = now_local_naive() - timedelta(seconds=_RECENT_LANGUAGE_TTL_SEC)
+    with SessionLocal() as db:
+        rows = (
+            db.query(CarouselScreenActivity)
+            .filter(CarouselScreenActivity.seen_at >= cutoff)
+            .all()
+        )
+    languages = sorted(
+        row.activity_key[len("lang:") :]
+        for row in rows
+        if row.activity_key.startswith("lang:")
+    )
+    current = next(
+        (row.report_id for row in rows if row.activity_key == "current"), None
+    )
+    return languages, current
+
+
+def warm_backoff_active(report_id: int, language_key: str, digest: str) -> bool:
+    """该条目此前以相同内容预热失败且仍在退避期内时返回 True。"""
+    with _failures_lock:
+        failure = _failures.get((report_id, language_key))
+    if failure is None or failure[0] != digest:
+        return False
+    return time.monotonic() < failure[2]
+
+
+def record_warm_result(
+    report_id: int, language_key: str, digest: str, failed: bool
+) -> None:
+    """记录一次预热结果：成功清除失败记录，失败则延长退避时间。"""
+    key = (report_id, language_key)
+    with _failures_lock:
+        if not failed:
+            _failures.pop(key, None)
+            return
+        previous = _failures.get(key)
+        count = previous[1] + 1 if previous and previous[0] == digest else 1
+        delay = min(
+            _FAILURE_BACKOFF_MAX_SEC,
+            max(1, settings.carousel_warm_interval_sec) * 2 ** (count - 1),
+        )
+        _failures[key] = (digest, count, time.monotonic() + delay)
+
+
+def _warm_languages(screen_languages: list[str]) -> list[str]:
+    configured = [
+        x.strip()
+        for x in (settings.carousel_warm_languages or "").split(",")
+        if x.strip()
+    ]
+    return configured or screen_languages
+
+
+def _upcoming_report_ids(
+    count: int, anchor: int | None
+) -> tuple[list[int], str]:
+    """按运行时配置与队列顺序返回待预热的新闻（当前条目在前），以及跳过原因。"""
+    with SessionLocal() as db:
+        runtime = (
+            db.query(PlaybackRuntimeSetting)
+            .order_by(PlaybackRuntimeSetting.id.asc())
+            .first()
+        )
+        mode = runtime.mode if runtime else "carousel_summary"
+        if mode != "carousel_summary":
+            return [], f"mode={mode}"
+        selected_id = runtime.selected_report_id if runtime else None
+        if runtime and runtime.carousel_scope == "single":
+            return ([selected_id] if selected_id else []), ""
+        # 与 /api/reports/playback/queue 的顺序一致；口播稿为空的条目由预热时跳过。
+        queue_ids = [
+            row.id
+            for row in db.query(MeetingReport.id)
+            .filter(MeetingReport.auto_play_enabled.is_(True))
+            .order_by(desc(MeetingReport.meeting_time), desc(MeetingReport.id))
+        ]
+    if not queue_ids:
+        return [], "queue empty"
+    if anchor not in queue_ids:
+        anchor = selected_id if selected_id in queue_ids else queue_ids[0]
+    start = queue_ids.index(anchor)
+    span = min(len(queue_ids), count + 1)
+    return [queue_ids[(start + offset) % len(queue_ids)] for offset in range(span)], ""
+
+
+def run_carousel_warm() -> dict:
+    """执行一轮预热，返回各条目、各语种的处理结果。"""
+    from .api.reports import warm_report_language
+
+    started = time.perf_counter()
+    result: dict = {"reports": {}, "languages": []}
+    with cross_process_lock(_WARM_LOCK_NAME) as leader:
+        if not leader:
+            result["skipped"] = "other worker"
+        else:
+            screen_languages, current_report_id = _screen_activity()
+            languages = _warm_languages(screen_languages)
+            report_ids, reason = _upcoming_report_ids(
+                max(0, settings.carousel_warm_count), current_report_id
+            )
+            if reason:
+                result["skipped"] = reason
+            elif not languages:
+                result["skipped"] = "no languages"
+            else:
+                result["languages"] = languages
+                for report_id in report_ids:
+                    result["reports"][report_id] = {
+                        language_key: warm_report_language(report_id, language_key)
+                        for language_key in languages
+                    }
+    result["ms"] = round((time.perf_counter() - started) * 1000, 1)
+    with _status_lock:
+        _status["runs"] += 1
+        _status["last_run_at"] = now_local_naive().isoformat()
+        _status["last"] = result
+    return result
+
+
+def _warm_loop(interval_sec: int) -> None:
+    while not _stop_event.is_set():
+        _wake_event.wait(interval_sec)
+        _wake_event.clear()
+        if _stop_event.is_set():
+            break
+        try:
+            _flush_screen_activity()
+        except Exception:
+            logger.exception("carousel activity flush failed")
+        try:
+            run_carousel_warm()
+        except Exception:
+            logger.exception("carousel warm failed")
+
+
+def start_carousel_warmer() -> None:
+    global _thread
+    interval = settings.carousel_warm_interval_sec
+    if settings.carousel_warm_count <= 0 or interval <= 0:
+        return
+    if _thread is not None and _thread.is_alive():
+        return
+    _stop_event.clear()
+    with _status_lock:
+        _status["enabled"] = True
+        _status["interval_sec"] = interval
+        _status["count"] = settings.carousel_warm_count
+    _thread = threading.Thread(
+        target=_warm_loop, args=(interval,), name="carousel-warmer", daemon=True
+    )
+    _thread.start()
+
+
+def stop_carousel_warmer() -> None:
+    _stop_event.set()
+    _wake_event.set()
+
+
+def get_carousel_warmer_status() -> dict:
+    with _status_lock:
+        return dict(_status)
@@ -0,0 +1,109 @@
+"""响应压缩中间件：按 Accept-Encoding 协商 brotli / gzip。
+
+只压缩超过阈值、可压缩类型（JSON / 文本）且一次性返回的响应体；
+流式响应与已带 Content-Encoding 的响应原样透传。brotli 为可选依赖，未安装时只用 gzip。
+较大的响应体（如内联 PCM 的播报队列）在线程池中压缩，不阻塞事件循环。
+"""
+
+import gzip
+from functools import partial
+
+import anyio
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 可选依赖
+    brotli = None
+
+_COMPRESSIBLE_TYPES = ("application/json", "text/")
+# 超过该大小的响应体交给线程池压缩；更小的直接压缩，省去线程切换。
+_OFFLOAD_MIN_BYTES = 256 * 1024
+
+
+def _negotiate_encoding(accept_encoding: str) -> str | None:
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name] = quality
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 5,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = _negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            assert start_message is not None
+            headers = MutableHeaders(raw=start_message["headers"])
+            body = message.get("body", b"")
+            content_type = headers.get("content-type", "")
+            if (
+                message.get("more_body", False)
+                or "content-encoding" in headers
+                or len(body) < self.minimum_size
+                or not content_type.startswith(_COMPRESSIBLE_TYPES)
+            ):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            if encoding == "br":
+                compress = partial(brotli.compress, body, quality=self.brotli_quality)
+            else:
+                compress = partial(gzip.compress, body, compresslevel=self.gzip_level)
+            if len(body) >= _OFFLOAD_MIN_BYTES:
+                compressed = await anyio.to_thread.run_sync(compress)
+            else:
+                compressed = compress()
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(compressed))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
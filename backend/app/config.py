@@ -19,6 +19,43 @@ class Settings(BaseSettings):
     app_port: int = 8000
 
     database_url: str = f'sqlite:///{DEFAULT_SQLITE_PATH}'
+    # 只读副本连接串；留空表示不启用，只读接口也走主库。
+    database_read_url: str | None = None
+    # 客户端写入后在该时间窗口内读主库，避免读到副本尚未同步的数据。
+    read_replica_sticky_sec: float = 5.0
+    # 副本延迟超过该值（或不可用）时只读接口回退主库；探测结果缓存 probe 间隔秒。
+    read_replica_max_lag_sec: float = 2.0
+    read_replica_probe_interval_sec: float = 5.0
+    # 连接池配置；留空时按方言取默认值（见 database._pool_options）。
+    db_pool_size: int | None = None
+    db_max_overflow: int | None = None
+    db_pool_timeout_sec: float = 30
+    db_pool_recycle_sec: int | None = None
+    db_pool_pre_ping: bool | None = None
+    # SQLite PRAGMA 配置（仅 SQLite 生效）。cache_size 单位 KiB，mmap_size 单位 MiB。
+    sqlite_synchronous: str = 'NORMAL'
+    sqlite_cache_size_kb: int = 65536
+    sqlite_mmap_size_mb: int = 256
+    sqlite_temp_store: str = 'MEMORY'
+    sqlite_wal_autocheckpoint_pages: int = 1000
+    # 定期维护（wal_checkpoint(TRUNCATE) / ANALYZE / incremental_vacuum）间隔，0 表示关闭。
+    sqlite_maintenance_interval_sec: int = 3600
+    sqlite_incremental_vacuum_pages: int = 2000
+
+    # 轮播预热：当前条目之后预热的条数（0 关闭）、检查间隔与语种（逗号分隔，留空取播放屏近期请求的语种）。
+    carousel_warm_count: int = 2
+    carousel_warm_interval_sec: int = 30
+    carousel_warm_languages: str = ''
+    # 会议直播逐字稿轮询间隔（秒，0 关闭）：后台拉取 meeting_live 选中新闻的飞书逐字稿并追加段落。
+    transcript_poll_interval_sec: int = 30
+
+    # 播报队列变更日志保留条数（since 早于保留范围时客户端回退全量同步），0 表示不裁剪。
+    playback_change_log_retention: int = 10000
+
+    # JSON/文本响应压缩：超过阈值才压缩，客户端支持且安装了 brotli 时优先 br，否则 gzip。
+    response_compression_min_bytes: int = 1024
+    response_gzip_level: int = 5
+    response_brotli_quality: int = 4
 
     cors_allow_origins: str = '*'
 
@@ -35,12 +72,24 @@ class Settings(BaseSettings):
     azure_request_timeout_sec: int = 45
     azure_request_retry_count: int = 3
     azure_request_retry_backoff_sec: float = 1.2
+    azure_chapter_chunk_chars: int = 6000
+    azure_chapter_max_workers: int = 4
+    # 提示词输入预算（估算 token）：生成口播稿时会议总结的上限；
+    # 反思/提问等已有口播稿的调用只附带未被口播稿覆盖的总结句，上限更低。0 表示不压缩。
+    azure_prompt_source_max_tokens: int = 6000
+    azure_prompt_aux_summary_max_tokens: int = 1200
     azure_speech_key: str | None = None
     azure_speech_key_secondary: str | None = None
     azure_speech_region: str | None = None
     azure_speech_endpoint: str | None = None
     azure_speech_tts_path: str = '/tts/cognitiveservices/v1'
     azure_speech_output_format: str = 'raw-16khz-16bit-mono-pcm'
+    # 与 PCM 一同落库的压缩音频（Azure Speech 输出格式名，需含 opus 或 mp3），留空则只存 PCM。
+    azure_speech_compressed_output_format: str = 'ogg-16khz-16bit-mono-opus'
+    # PCM 仅百度数字人 AUDIO_STREAM_RENDER 需要；不接数字人的部署可关闭，只存压缩音频。
+    tts_store_pcm: bool = True
+    # /synthesize-audio 按需合成结果的持久化保留天数，0 表示不清理。
+    tts_audio_cache_retention_days: int = 30
     azure_ssl_skip_verify: bool = False
 
     feishu_app_id: str | None = None
@@ -49,6 +98,11 @@ class Settings(BaseSettings):
     feishu_timeout_sec: int = 20
     feishu_verify_ssl: bool = True
 
+    # 导入后续任务（译文刷新、反思音频）线程数；导入本身按来源使用下面两个并发上限。
+    import_job_max_workers: int = 4
+    import_feishu_concurrency: int = 2
+    import_file_concurrency: int = 1
+
     baidu_avatar_token: str | None = None
     baidu_figure_id: str | None = None
     baidu_camera_id: str | None = None
@@ -1,7 +1,12 @@
+import threading
+import time
 from pathlib import Path
 
-from sqlalchemy import create_engine, event, inspect, text
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from fastapi import Request
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from .config import BACKEND_DIR, settings
 
@@ -30,12 +35,93 @@ def _normalize_database_url(url: str) -> str:
 
 DATABASE_URL = _normalize_database_url(settings.database_url)
 
+_pool_metrics_lock = threading.Lock()
+_pool_metrics = {
+    "checkouts": 0,
+    "wait_total_ms": 0.0,
+    "wait_max_ms": 0.0,
+    "slow_checkouts": 0,
+    "timeouts": 0,
+}
+# 等待连接超过该阈值计为一次慢借出，用于发现连接池偏小。
+_SLOW_CHECKOUT_MS = 50.0
+
+
+class _MeteredQueuePool(QueuePool):
+    """记录从连接池借出连接的等待耗时。"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            wait_ms = (time.perf_counter() - started) * 1000
+            with _pool_metrics_lock:
+                _pool_metrics["checkouts"] += 1
+                _pool_metrics["wait_total_ms"] += wait_ms
+                _pool_metrics["wait_max_ms"] = max(
+                    _pool_metrics["wait_max_ms"], wait_ms
+                )
+                if wait_ms >= _SLOW_CHECKOUT_MS:
+                    _pool_metrics["slow_checkouts"] += 1
+                if timed_out:
+                    _pool_metrics["timeouts"] += 1
+
+
+def _pool_options(url: str) -> dict:
+    """按方言给出连接池默认值，Settings 中显式配置的项优先。
+
+    同步接口跑在约 40 线程的线程池里，池容量（size + overflow）按 40 设计。
+    MySQL 需要 pre-ping 与定期回收，避免拿到被 wait_timeout 断开的连接；
+    SQLite 为本地文件，不需要探活与回收。内存库沿用 SQLAlchemy 默认的单连接池。
+    """
+    if url.startswith("sqlite") and ":memory:" in url:
+        return {}
+    if url.startswith("sqlite"):
+        defaults = {
+            "pool_size": 8,
+            "max_overflow": 32,
+            "pool_recycle": -1,
+            "pool_pre_ping": False,
+        }
+    else:
+        defaults = {
+            "pool_size": 20,
+            "max_overflow": 20,
+            "pool_recycle": 1800,
+            "pool_pre_ping": True,
+        }
+    overrides = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_recycle": settings.db_pool_recycle_sec,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+    }
+    options = {
+        key: (value if value is not None else defaults[key])
+        for key, value in overrides.items()
+    }
+    options["pool_timeout"] = settings.db_pool_timeout_sec
+    options["poolclass"] = _MeteredQueuePool
+    return options
+
+
 connect_args = (
     {"check_same_thread": False, "timeout": 30}
     if DATABASE_URL.startswith("sqlite")
     else {}
 )
-engine = create_engine(DATABASE_URL, echo=False, future=True, connect_args=connect_args)
+engine = create_engine(
+    DATABASE_URL,
+    echo=False,
+    future=True,
+    connect_args=connect_args,
+    **_pool_options(DATABASE_URL),
+)
 SessionLocal = sessionmaker(
     bind=engine, autoflush=False, autocommit=False, expire_on_commit=False
 )
@@ -43,122 +129,167 @@ SessionLocal = sessionmaker(
 
 if DATABASE_URL.startswith("sqlite"):
 
+    _SQLITE_SYNCHRONOUS_MODES = {"OFF", "NORMAL", "FULL", "EXTRA"}
+    _SQLITE_TEMP_STORE_MODES = {"DEFAULT", "FILE", "MEMORY"}
+
     @event.listens_for(engine, "connect")
     def _set_sqlite_pragma(dbapi_connection, _connection_record):
+        synchronous = settings.sqlite_synchronous.strip().upper()
+        temp_store = settings.sqlite_temp_store.strip().upper()
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA journal_mode=WAL;")
         cursor.execute("PRAGMA busy_timeout=30000;")
+        # WAL 模式下 NORMAL 只在检查点时 fsync，掉电最多丢最近事务，不会损坏库文件。
+        if synchronous in _SQLITE_SYNCHRONOUS_MODES:
+            cursor.execute(f"PRAGMA synchronous={synchronous};")
+        # 负数表示按 KiB 计算页缓存大小。
+        cursor.execute(f"PRAGMA cache_size=-{max(0, settings.sqlite_cache_size_kb)};")
+        cursor.execute(
+            f"PRAGMA mmap_size={max(0, settings.sqlite_mmap_size_mb) * 1024 * 1024};"
+        )
+        if temp_store in _SQLITE_TEMP_STORE_MODES:
+            cursor.execute(f"PRAGMA temp_store={temp_store};")
+        cursor.execute(
+            "PRAGMA wal_autocheckpoint="
+            f"{max(0, settings.sqlite_wal_autocheckpoint_pages)};"
+        )
         cursor.close()
 
 
-def ensure_schema_compatibility() -> None:
-    inspector = inspect(engine)
-    if "meeting_reports" not in inspector.get_table_names():
-        return
+READ_DATABASE_URL = (
+    _normalize_database_url(settings.database_read_url.strip())
+    if (settings.database_read_url or "").strip()
+    else ""
+)
+READ_REPLICA_ENABLED = bool(READ_DATABASE_URL) and READ_DATABASE_URL != DATABASE_URL
+# 客户端最近一次写入时间（unix 秒），由 main 中的中间件在写请求成功后下发。
+LAST_WRITE_COOKIE = "gmw_last_write"
 
-    columns = {col["name"] for col in inspector.get_columns("meeting_reports")}
-    if "auto_play_enabled" in columns:
-        pass
-    else:
-        # 兼容已有数据库：补充自动播报开关字段，默认关闭。
-        with engine.begin() as conn:
-            if engine.dialect.name == "mysql":
-                conn.execute(
-                    text(
-                        "ALTER TABLE meeting_reports ADD COLUMN auto_play_enabled TINYINT(1) NOT NULL DEFAULT 0"
-                    )
-                )
-            else:
-                conn.execute(
-                    text(
-                        "ALTER TABLE meeting_reports ADD COLUMN auto_play_enabled BOOLEAN NOT NULL DEFAULT 0"
-                    )
-                )
+if READ_REPLICA_ENABLED:
+    read_engine = create_engine(
+        READ_DATABASE_URL,
+        echo=False,
+        future=True,
+        connect_args=(
+            {"check_same_thread": False, "timeout": 30}
+            if READ_DATABASE_URL.startswith("sqlite")
+            else {}
+        ),
+        **_pool_options(READ_DATABASE_URL),
+    )
+    ReadSessionLocal = sessionmaker(
+        bind=read_engine,
+        autoflush=False,
+        autocommit=False,
+        expire_on_commit=False,
+        info={"read_only": True},
+    )
+else:
+    read_engine = engine
+    ReadSessionLocal = SessionLocal
+
+_replica_probe_lock = threading.Lock()
+_replica_probe = {
+    "checked_at": 0.0,
+    "healthy": True,
+    "lag_sec": 0.0,
+    "error": "",
+    "probing": False,
+}
 
-    extra_report_columns = {
-        "source_language": 'ALTER TABLE meeting_reports ADD COLUMN source_language VARCHAR(16) NOT NULL DEFAULT "zh"',
-        "question_persona": 'ALTER TABLE meeting_reports ADD COLUMN question_persona VARCHAR(32) NOT NULL DEFAULT "board_director"',
-        "source_type": 'ALTER TABLE meeting_reports ADD COLUMN source_type VARCHAR(32) NOT NULL DEFAULT ""',
-        "source_meeting_no": 'ALTER TABLE meeting_reports ADD COLUMN source_meeting_no VARCHAR(64) NOT NULL DEFAULT ""',
-        "source_meeting_id": 'ALTER TABLE meeting_reports ADD COLUMN source_meeting_id VARCHAR(64) NOT NULL DEFAULT ""',
-        "source_minute_token": 'ALTER TABLE meeting_reports ADD COLUMN source_minute_token VARCHAR(128) NOT NULL DEFAULT ""',
-        "source_url": "ALTER TABLE meeting_reports ADD COLUMN source_url TEXT",
-    }
-    for column_name, sql in extra_report_columns.items():
-        if column_name in columns:
-            continue
-        with engine.begin() as conn:
-            conn.execute(text(sql))
-            if column_name == "source_url":
-                conn.execute(
-                    text(
-                        'UPDATE meeting_reports SET source_url = "" WHERE source_url IS NULL'
-                    )
-                )
 
-    if "meeting_report_translations" in inspector.get_table_names():
-        translation_columns = {
-            col["name"] for col in inspector.get_columns("meeting_report_translations")
+def _query_replica_lag() -> float:
+    with read_engine.connect() as conn:
+        if read_engine.dialect.name != "mysql":
+            conn.exec_driver_sql("SELECT 1")
+            return 0.0
+        for sql, column in (
+            ("SHOW REPLICA STATUS", "Seconds_Behind_Source"),
+            ("SHOW SLAVE STATUS", "Seconds_Behind_Master"),
+        ):
+            try:
+                row = conn.exec_driver_sql(sql).mappings().first()
+            except Exception:
+                continue
+            if row is None:
+                # 非复制从库（如读写分离代理后的只读实例），视为无延迟。
+                return 0.0
+            lag = row.get(column)
+            if lag is None:
+                raise RuntimeError("副本复制线程未运行")
+            return float(lag)
+        return 0.0
+
+
+def _run_replica_probe() -> None:
+    try:
+        lag = _query_replica_lag()
+        result = {
+            "healthy": lag <= settings.read_replica_max_lag_sec,
+            "lag_sec": lag,
+            "error": "",
         }
-        if "audio_pcm_base64" not in translation_columns:
-            with engine.begin() as conn:
-                if engine.dialect.name == "mysql":
-                    conn.execute(
-                        text(
-                            'ALTER TABLE meeting_report_translations ADD COLUMN audio_pcm_base64 LONGTEXT NOT NULL DEFAULT ""'
-                        )
-                    )
-                else:
-                    conn.execute(
-                        text(
-                            'ALTER TABLE meeting_report_translations ADD COLUMN audio_pcm_base64 TEXT NOT NULL DEFAULT ""'
-                        )
-                    )
-        if "reviewed" not in translation_columns:
-            with engine.begin() as conn:
-                if engine.dialect.name == "mysql":
-                    conn.execute(
-                        text(
-                            "ALTER TABLE meeting_report_translations ADD COLUMN reviewed TINYINT(1) NOT NULL DEFAULT 0"
-                        )
-                    )
-                else:
-                    conn.execute(
-                        text(
-                            "ALTER TABLE meeting_report_translations ADD COLUMN reviewed BOOLEAN NOT NULL DEFAULT 0"
-                        )
-                    )
-        if "reviewed_at" not in translation_columns:
-            with engine.begin() as conn:
-                conn.execute(
-                    text(
-                        "ALTER TABLE meeting_report_translations ADD COLUMN reviewed_at DATETIME NULL"
-                    )
-                )
-        if "reflections_json" not in translation_columns:
-            with engine.begin() as conn:
-                conn.execute(
-                    text(
-                        'ALTER TABLE meeting_report_translations ADD COLUMN reflections_json TEXT NOT NULL DEFAULT "[]"'
-                    )
-                )
-        if "questions_json" not in translation_columns:
-            with engine.begin() as conn:
-                conn.execute(
-                    text(
-                        'ALTER TABLE meeting_report_translations ADD COLUMN questions_json TEXT NOT NULL DEFAULT "[]"'
-                    )
-                )
-        if "question_persona" not in translation_columns:
-            with engine.begin() as conn:
-                conn.execute(
-                    text(
-                        'ALTER TABLE meeting_report_translations ADD COLUMN question_persona VARCHAR(32) NOT NULL DEFAULT "board_director"'
-                    )
-                )
+    except Exception as exc:
+        result = {"healthy": False, "lag_sec": -1.0, "error": str(exc)}
+    with _replica_probe_lock:
+        _replica_probe.update(result, checked_at=time.monotonic(), probing=False)
+
+
+def replica_status() -> dict:
+    """副本健康与延迟（带缓存），只读接口据此决定是否回退主库。
+
+    探测在后台线程执行，请求只读取缓存结果：副本不可达时不会让请求
+    排队等待连接超时。
+    """
+    if not READ_REPLICA_ENABLED:
+        return {"enabled": False}
+    now = time.monotonic()
+    with _replica_probe_lock:
+        due = (
+            not _replica_probe["probing"]
+            and now - _replica_probe["checked_at"]
+            >= settings.read_replica_probe_interval_sec
+        )
+        if due:
+            _replica_probe["probing"] = True
+        snapshot = {"enabled": True, **_replica_probe}
+    if due:
+        threading.Thread(
+            target=_run_replica_probe, name="replica-probe", daemon=True
+        ).start()
+    return snapshot
+
 
-    # 反思音频缓存表（meeting_report_reflection_audios）由 create_all 自动建表，
-    # 此处不需要额外 ALTER，但保留占位注释方便将来扩列。
+def _client_wrote_recently(request: Request) -> bool:
+    raw = request.cookies.get(LAST_WRITE_COOKIE) or ""
+    try:
+        last_write = float(raw)
+    except ValueError:
+        return False
+    return time.time() - last_write < settings.read_replica_sticky_sec
+
+
+def get_pool_metrics() -> dict:
+    """连接池当前占用与借出等待统计。"""
+    with _pool_metrics_lock:
+        metrics = dict(_pool_metrics)
+    checkouts = metrics["checkouts"]
+    metrics["wait_avg_ms"] = (
+        round(metrics["wait_total_ms"] / checkouts, 2) if checkouts else 0.0
+    )
+    metrics["wait_total_ms"] = round(metrics["wait_total_ms"], 1)
+    metrics["wait_max_ms"] = round(metrics["wait_max_ms"], 1)
+    pool = engine.pool
+    if isinstance(pool, QueuePool):
+        metrics.update(
+            {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "overflow": pool.overflow(),
+                "idle": pool.checkedin(),
+            }
+        )
+    return metrics
 
 
 def get_db():
@@ -167,3 +298,21 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def get_read_db(request: Request):
+    """只读接口使用的会话：优先走副本；客户端刚写入过或副本延迟过大时回退主库。"""
+    use_primary = (
+        not READ_REPLICA_ENABLED
+        or _client_wrote_recently(request)
+        or not replica_status()["healthy"]
+    )
+    db = SessionLocal() if use_primary else ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def is_read_only_session(db: Session) -> bool:
+    return bool(db.info.get("read_only"))
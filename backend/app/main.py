@@ -1,17 +1,101 @@
-from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+import time
 
-from .api.avatar import router as avatar_router
-from .api.playback import router as playback_router
-from .api.reports import router as reports_router
-from .config import settings
-from .database import Base, engine, ensure_schema_compatibility
+_import_started = time.perf_counter()
+_import_timings_ms: dict[str, float] = {}
 
 
-Base.metadata.create_all(bind=engine)
-ensure_schema_compatibility()
+def _mark_import(name: str, started: float) -> float:
+    now = time.perf_counter()
+    _import_timings_ms[name] = round((now - started) * 1000, 1)
+    return now
 
-app = FastAPI(title=settings.app_name)
+
+from contextlib import asynccontextmanager  # noqa: E402
+
+from fastapi import FastAPI, Request  # noqa: E402
+from fastapi.middleware.cors import CORSMiddleware  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+_t = _mark_import('fastapi', _import_started)
+from .carousel_warmer import (  # noqa: E402
+    get_carousel_warmer_status,
+    start_carousel_warmer,
+    stop_carousel_warmer,
+)
+from .compression import CompressionMiddleware  # noqa: E402
+from .config import settings  # noqa: E402
+from .database import (  # noqa: E402
+    LAST_WRITE_COOKIE,
+    READ_REPLICA_ENABLED,
+    SessionLocal,
+    engine,
+    get_pool_metrics,
+    replica_status,
+)
+from .maintenance import (  # noqa: E402
+    get_maintenance_status,
+    start_sqlite_maintenance,
+    stop_sqlite_maintenance,
+)
+from .migrations import run_migrations  # noqa: E402
+from .services.playback_changes import register_playback_change_log  # noqa: E402
+from .services.prompt_budget import get_llm_usage_stats  # noqa: E402
+from .services.search import init_search_backend, register_search_sync  # noqa: E402
+from .services.tts_store import get_tts_store_stats  # noqa: E402
+from .transcript_poller import (  # noqa: E402
+    get_transcript_poller_status,
+    start_transcript_poller,
+    stop_transcript_poller,
+)
+from .warmup import ping_database, run_warmup  # noqa: E402
+from .write_queue import register_write_gate  # noqa: E402
+
+_t = _mark_import('core', _t)
+from .api.reports import router as reports_router  # noqa: E402
+
+_t = _mark_import('api.reports', _t)
+from .api.playback import router as playback_router  # noqa: E402
+
+_t = _mark_import('api.playback', _t)
+from .api.avatar import router as avatar_router  # noqa: E402
+
+_t = _mark_import('api.avatar', _t)
+_import_timings_ms['total'] = round((_t - _import_started) * 1000, 1)
+
+# 启动各阶段耗时（毫秒），由 lifespan 写入，/readyz 返回。
+_startup_timings_ms: dict[str, float] = {}
+_startup_state = {'ready': False, 'migrations_applied': []}
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # 表结构迁移放在 lifespan 中执行，导入 app.main 本身不触碰数据库。
+    started = time.perf_counter()
+    _startup_state['migrations_applied'] = run_migrations()
+    step = time.perf_counter()
+    _startup_timings_ms['migrations'] = round((step - started) * 1000, 1)
+
+    with engine.connect() as conn:
+        init_search_backend(conn)
+    register_search_sync(SessionLocal)
+    register_playback_change_log(SessionLocal)
+    # SQLite 下串行化写事务：编辑保存优先，后台任务经写线程批量提交。
+    register_write_gate(SessionLocal)
+    now = time.perf_counter()
+    _startup_timings_ms['search_backend'] = round((now - step) * 1000, 1)
+    _startup_timings_ms['total'] = round((now - started) * 1000, 1)
+    start_sqlite_maintenance()
+    start_carousel_warmer()
+    start_transcript_poller()
+    _startup_state['ready'] = True
+    yield
+    _startup_state['ready'] = False
+    stop_sqlite_maintenance()
+    stop_carousel_warmer()
+    stop_transcript_poller()
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
 
 origins = [x.strip() for x in settings.cors_allow_origins.split(',') if x.strip()]
 if not origins:
@@ -24,6 +108,35 @@ app.add_middleware(
     allow_methods=['*'],
     allow_headers=['*'],
 )
+if settings.response_compression_min_bytes > 0:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.response_compression_min_bytes,
+        gzip_level=settings.response_gzip_level,
+        brotli_quality=settings.response_brotli_quality,
+    )
+
+
+_WRITE_METHODS = {'POST', 'PUT', 'PATCH', 'DELETE'}
+
+
+async def mark_recent_write(request: Request, call_next):
+    # 写请求成功后下发写入时间，随后短时间内该客户端的只读接口读主库。
+    response = await call_next(request)
+    if request.method in _WRITE_METHODS and response.status_code < 400:
+        response.set_cookie(
+            LAST_WRITE_COOKIE,
+            f'{time.time():.3f}',
+            max_age=max(1, int(settings.read_replica_sticky_sec) + 1),
+            httponly=True,
+            samesite='lax',
+        )
+    return response
+
+
+# 仅在启用只读副本时注册，未配置副本时不增加每个请求的中间件开销。
+if READ_REPLICA_ENABLED:
+    app.middleware('http')(mark_recent_write)
 
 
 @app.get('/healthz')
@@ -33,7 +146,27 @@ def healthz():
 
 @app.get('/readyz')
 def readyz():
-    return {'ok': True}
+    # 首次调用执行预热（连接池、播报队列、TTS 缓存、WAL 校验），之后复用结果并做数据库探活。
+    warmup = run_warmup() if _startup_state['ready'] else {'ok': False, 'checks': {}}
+    database = ping_database()
+    ok = bool(_startup_state['ready'] and warmup['ok'] and database['ok'])
+    return JSONResponse(
+        status_code=200 if ok else 503,
+        content={
+            'ok': ok,
+            'dependencies': {**warmup['checks'], 'database': database},
+            'db_pool': get_pool_metrics(),
+            'read_replica': replica_status(),
+            'sqlite_maintenance': get_maintenance_status(),
+            'carousel_warmer': get_carousel_warmer_status(),
+            'transcript_poller': get_transcript_poller_status(),
+            'tts_store': get_tts_store_stats(),
+            'llm_usage': get_llm_usage_stats(),
+            'import_ms': _import_timings_ms,
+            'startup_ms': _startup_timings_ms,
+            'migrations_applied': _startup_state['migrations_applied'],
+        },
+    )
 
 
 app.include_router(reports_router)
@@ -0,0 +1,121 @@
+"""SQLite 定期维护。
+
+按 SQLITE_MAINTENANCE_INTERVAL_SEC 周期执行：
+- ANALYZE：刷新查询规划器统计信息；
+- incremental_vacuum：回收音频等大字段删除后留下的空闲页（需 auto_vacuum=INCREMENTAL）；
+- wal_checkpoint(TRUNCATE)：把 WAL 合并回主库并截断 -wal 文件。
+每步耗时与结果记录在 get_maintenance_status()，由 /readyz 返回。
+"""
+
+import logging
+import threading
+import time
+
+from .config import settings
+from .database import engine
+from .utils.timezone import now_local_naive
+from .write_queue import background_write_lock
+
+logger = logging.getLogger(__name__)
+
+_status_lock = threading.Lock()
+_status: dict = {"enabled": False, "runs": 0, "last_run_at": None, "last": {}}
+_stop_event = threading.Event()
+_thread: threading.Thread | None = None
+
+
+def _timed_step(conn, name: str, sql: str, results: dict) -> None:
+    started = time.perf_counter()
+    try:
+        if sql.lower().startswith("pragma incremental_vacuum"):
+            # sqlite3 的 execute 只单步执行，incremental_vacuum 每步只回收一页；
+            # executescript 会执行到结束。
+            conn.connection.driver_connection.executescript(f"{sql};")
+            rows = []
+        else:
+            result = conn.exec_driver_sql(sql)
+            rows = result.fetchall() if result.returns_rows else []
+        results[name] = {
+            "ok": True,
+            "ms": round((time.perf_counter() - started) * 1000, 1),
+            "result": [list(row) for row in rows[:1]],
+        }
+    except Exception as exc:
+        results[name] = {
+            "ok": False,
+            "ms": round((time.perf_counter() - started) * 1000, 1),
+            "error": str(exc),
+        }
+
+
+def run_sqlite_maintenance() -> dict:
+    """执行一轮维护并返回各步耗时；非 SQLite 直接跳过。"""
+    if engine.dialect.name != "sqlite":
+        return {}
+    results: dict = {}
+    pages = max(0, settings.sqlite_incremental_vacuum_pages)
+    # 维护操作会写库，按后台优先级持有写闸门，不与编辑保存抢锁。
+    with background_write_lock():
+        with engine.connect() as conn:
+            # 以自动提交方式执行，checkpoint / VACUUM 不能处于事务中。
+            conn = conn.execution_options(isolation_level="AUTOCOMMIT")
+            _timed_step(conn, "analyze", "ANALYZE", results)
+            _timed_step(
+                conn,
+                "incremental_vacuum",
+                f"PRAGMA incremental_vacuum({pages})",
+                results,
+            )
+            # 最后做检查点，把前两步产生的 WAL 一并合并并截断。
+            _timed_step(
+                conn, "wal_checkpoint", "PRAGMA wal_checkpoint(TRUNCATE)", results
+            )
+            page_count = conn.exec_driver_sql("PRAGMA page_count").scalar() or 0
+            freelist = conn.exec_driver_sql("PRAGMA freelist_count").scalar() or 0
+            page_size = conn.exec_driver_sql("PRAGMA page_size").scalar() or 0
+    results["file"] = {
+        "size_mb": round(page_count * page_size / 1024 / 1024, 2),
+        "free_pages": freelist,
+    }
+    with _status_lock:
+        _status["runs"] += 1
+        _status["last_run_at"] = now_local_naive().isoformat()
+        _status["last"] = results
+    return results
+
+
+def _maintenance_loop(interval_sec: int) -> None:
+    while not _stop_event.wait(interval_sec):
+        try:
+            run_sqlite_maintenance()
+        except Exception:
+            logger.exception("sqlite maintenance failed")
+
+
+def start_sqlite_maintenance() -> None:
+    global _thread
+    interval = settings.sqlite_maintenance_interval_sec
+    if engine.dialect.name != "sqlite" or interval <= 0:
+        return
+    if _thread is not None and _thread.is_alive():
+        return
+    _stop_event.clear()
+    with _status_lock:
+        _status["enabled"] = True
+        _status["interval_sec"] = interval
+    _thread = threading.Thread(
+        target=_maintenance_loop,
+        args=(interval,),
+        name="sqlite-maintenance",
+        daemon=True,
+    )
+    _thread.start()
+
+
+def stop_sqlite_maintenance() -> None:
+    _stop_event.set()
+
+
+def get_maintenance_status() -> dict:
+    with _status_lock:
+        return dict(_status)
@@ -0,0 +1,323 @@
+"""版本化数据库迁移。
+
+schema_version 表记录已执行的迁移版本；启动时只读一次最大版本号，
+已是最新则直接返回，不做任何表结构探测。存在待执行迁移时先获取跨进程锁
+（MySQL 使用 GET_LOCK，SQLite 文件库使用文件锁），锁内复查版本后按顺序执行，
+多个 worker 同时启动也只会有一个执行 ALTER。
+
+新增表结构变更时在 MIGRATIONS 末尾追加一条，版本号递增，已发布的迁移不要修改。
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from contextlib import contextmanager
+from pathlib import Path
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.orm import Session
+
+from . import models  # noqa: F401  注册全部模型到 Base.metadata
+from .database import Base, engine
+from .services.generator import audio_digest
+from .services.search import create_search_table, init_search_backend, rebuild_search_index
+from .utils.timezone import now_local_naive
+
+logger = logging.getLogger(__name__)
+
+MIGRATION_LOCK_NAME = "gmwavatar_schema_migration"
+MIGRATION_LOCK_TIMEOUT_SEC = 120
+
+_version_metadata = MetaData()
+schema_version_table = Table(
+    "schema_version",
+    _version_metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(128), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def _add_legacy_report_columns(conn: Connection) -> None:
+    """兼容迁移体系上线前的旧库：补齐历史上陆续新增的列。"""
+    inspector = inspect(conn)
+    table_names = set(inspector.get_table_names())
+    is_mysql = conn.dialect.name == "mysql"
+
+    if "meeting_reports" in table_names:
+        columns = {col["name"] for col in inspector.get_columns("meeting_reports")}
+        extra_report_columns = {
+            # 自动播报开关字段，默认关闭。
+            "auto_play_enabled": (
+                "ALTER TABLE meeting_reports ADD COLUMN auto_play_enabled TINYINT(1) NOT NULL DEFAULT 0"
+                if is_mysql
+                else "ALTER TABLE meeting_reports ADD COLUMN auto_play_enabled BOOLEAN NOT NULL DEFAULT 0"
+            ),
+            "source_language": 'ALTER TABLE meeting_reports ADD COLUMN source_language VARCHAR(16) NOT NULL DEFAULT "zh"',
+            "question_persona": 'ALTER TABLE meeting_reports ADD COLUMN question_persona VARCHAR(32) NOT NULL DEFAULT "board_director"',
+            "source_type": 'ALTER TABLE meeting_reports ADD COLUMN source_type VARCHAR(32) NOT NULL DEFAULT ""',
+            "source_meeting_no": 'ALTER TABLE meeting_reports ADD COLUMN source_meeting_no VARCHAR(64) NOT NULL DEFAULT ""',
+            "source_meeting_id": 'ALTER TABLE meeting_reports ADD COLUMN source_meeting_id VARCHAR(64) NOT NULL DEFAULT ""',
+            "source_minute_token": 'ALTER TABLE meeting_reports ADD COLUMN source_minute_token VARCHAR(128) NOT NULL DEFAULT ""',
+            "source_url": "ALTER TABLE meeting_reports ADD COLUMN source_url TEXT",
+        }
+        for column_name, sql in extra_report_columns.items():
+            if column_name in columns:
+                continue
+            conn.execute(text(sql))
+            if column_name == "source_url":
+                conn.execute(
+                    text(
+                        'UPDATE meeting_reports SET source_url = "" WHERE source_url IS NULL'
+                    )
+                )
+
+    if "meeting_report_translations" in table_names:
+        translation_columns = {
+            col["name"] for col in inspector.get_columns("meeting_report_translations")
+        }
+        extra_translation_columns = {
+            "audio_pcm_base64": (
+                'ALTER TABLE meeting_report_translations ADD COLUMN audio_pcm_base64 LONGTEXT NOT NULL DEFAULT ""'
+                if is_mysql
+                else 'ALTER TABLE meeting_report_translations ADD COLUMN audio_pcm_base64 TEXT NOT NULL DEFAULT ""'
+            ),
+            "reviewed": (
+                "ALTER TABLE meeting_report_translations ADD COLUMN reviewed TINYINT(1) NOT NULL DEFAULT 0"
+                if is_mysql
+                else "ALTER TABLE meeting_report_translations ADD COLUMN reviewed BOOLEAN NOT NULL DEFAULT 0"
+            ),
+            "reviewed_at": "ALTER TABLE meeting_report_translations ADD COLUMN reviewed_at DATETIME NULL",
+            "reflections_json": 'ALTER TABLE meeting_report_translations ADD COLUMN reflections_json TEXT NOT NULL DEFAULT "[]"',
+            "questions_json": 'ALTER TABLE meeting_report_translations ADD COLUMN questions_json TEXT NOT NULL DEFAULT "[]"',
+            "question_persona": 'ALTER TABLE meeting_report_translations ADD COLUMN question_persona VARCHAR(32) NOT NULL DEFAULT "board_director"',
+        }
+        for column_name, sql in extra_translation_columns.items():
+            if column_name not in translation_columns:
+                conn.execute(text(sql))
+
+
+def _ensure_declared_indexes(conn: Connection) -> None:
+    # create_all 只为新建表建索引；已有表补建模型中声明的索引。
+    inspector = inspect(conn)
+    table_names = set(inspector.get_table_names())
+    for table in Base.metadata.sorted_tables:
+        if table.name not in table_names:
+            continue
+        existing = {
+            idx["name"] for idx in inspector.get_indexes(table.name) if idx.get("name")
+        }
+        for index in table.indexes:
+            if index.name and index.name not in existing:
+                index.create(bind=conn, checkfirst=True)
+
+
+def _migration_0001_baseline(conn: Connection) -> None:
+    # 基线：建齐模型中的表，并把迁移体系上线前的旧库补到同一结构。
+    Base.metadata.create_all(bind=conn)
+    _add_legacy_report_columns(conn)
+    _ensure_declared_indexes(conn)
+
+
+def _migration_0002_search_index(conn: Connection) -> None:
+    create_search_table(conn)
+    init_search_backend(conn)
+    with Session(bind=conn) as db:
+        rebuild_search_index(db)
+
+
+def _migration_0003_sqlite_incremental_vacuum(conn: Connection) -> None:
+    # auto_vacuum 需 VACUUM 一次才对已有库生效，之后由定期维护执行 incremental_vacuum。
+    if conn.dialect.name != "sqlite":
+        return
+    mode = conn.exec_driver_sql("PRAGMA auto_vacuum").scalar()
+    if mode == 2:
+        return
+    conn.exec_driver_sql("PRAGMA auto_vacuum=INCREMENTAL")
+    conn.exec_driver_sql("VACUUM")
+
+
+def _migration_0004_compressed_audio_columns(conn: Connection) -> None:
+    inspector = inspect(conn)
+    is_mysql = conn.dialect.name == "mysql"
+    text_type = "LONGTEXT" if is_mysql else "TEXT"
+    for table_name in ("meeting_report_translations", "meeting_report_reflection_audios"):
+        columns = {col["name"] for col in inspector.get_columns(table_name)}
+        if "audio_compressed_base64" not in columns:
+            conn.execute(
+                text(
+                    f"ALTER TABLE {table_name} ADD COLUMN audio_compressed_base64 "
+                    f'{text_type} NOT NULL DEFAULT ""'
+                )
+            )
+        if "audio_compressed_format" not in columns:
+            conn.execute(
+                text(
+                    f"ALTER TABLE {table_name} ADD COLUMN audio_compressed_format "
+                    'VARCHAR(16) NOT NULL DEFAULT ""'
+                )
+            )
+
+
+def _migration_0005_audio_digest_columns(conn: Connection) -> None:
+    # 音频字节数与哈希：新增列后为已有音频回填，之后由写入路径维护。
+    inspector = inspect(conn)
+    digest_columns = {
+        "audio_pcm_bytes": "INTEGER NOT NULL DEFAULT 0",
+        "audio_pcm_sha256": 'VARCHAR(64) NOT NULL DEFAULT ""',
+        "audio_compressed_bytes": "INTEGER NOT NULL DEFAULT 0",
+        "audio_compressed_sha256": 'VARCHAR(64) NOT NULL DEFAULT ""',
+    }
+    for table_name in ("meeting_report_translations", "meeting_report_reflection_audios"):
+        columns = {col["name"] for col in inspector.get_columns(table_name)}
+        for column_name, ddl in digest_columns.items():
+            if column_name not in columns:
+                conn.execute(
+                    text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {ddl}")
+                )
+        # 逐行读取音频，避免一次把全部音频载入内存。
+        row_ids = conn.execute(
+            text(
+                f"SELECT id FROM {table_name} "
+                "WHERE audio_pcm_base64 != '' OR audio_compressed_base64 != ''"
+            )
+        ).scalars().all()
+        for row_id in row_ids:
+            pcm, compressed = conn.execute(
+                text(
+                    "SELECT audio_pcm_base64, audio_compressed_base64 "
+                    f"FROM {table_name} WHERE id = :id"
+                ),
+                {"id": row_id},
+            ).one()
+            pcm_bytes, pcm_sha = audio_digest(pcm)
+            compressed_bytes, compressed_sha = audio_digest(compressed)
+            conn.execute(
+                text(
+                    f"UPDATE {table_name} SET audio_pcm_bytes = :pcm_bytes, "
+                    "audio_pcm_sha256 = :pcm_sha, "
+                    "audio_compressed_bytes = :compressed_bytes, "
+                    "audio_compressed_sha256 = :compressed_sha WHERE id = :id"
+                ),
+                {
+                    "id": row_id,
+                    "pcm_bytes": pcm_bytes,
+                    "pcm_sha": pcm_sha,
+                    "compressed_bytes": compressed_bytes,
+                    "compressed_sha": compressed_sha,
+                },
+            )
+
+
+def _migration_0006_playback_change_log(conn: Connection) -> None:
+    models.PlaybackChangeLog.__table__.create(bind=conn, checkfirst=True)
+
+
+def _migration_0007_tts_audio_cache(conn: Connection) -> None:
+    models.TtsAudioCache.__table__.create(bind=conn, checkfirst=True)
+
+
+def _migration_0008_carousel_screen_activity(conn: Connection) -> None:
+    models.CarouselScreenActivity.__table__.create(bind=conn, checkfirst=True)
+
+
+MIGRATIONS: list[tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "baseline", _migration_0001_baseline),
+    (2, "report_search_index", _migration_0002_search_index),
+    (3, "sqlite_incremental_vacuum", _migration_0003_sqlite_incremental_vacuum),
+    (4, "compressed_audio_columns", _migration_0004_compressed_audio_columns),
+    (5, "audio_digest_columns", _migration_0005_audio_digest_columns),
+    (6, "playback_change_log", _migration_0006_playback_change_log),
+    (7, "tts_audio_cache", _migration_0007_tts_audio_cache),
+    (8, "carousel_screen_activity", _migration_0008_carousel_screen_activity),
+]
+LATEST_SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def _read_schema_version(conn: Connection) -> int:
+    try:
+        return int(
+            conn.execute(text("SELECT MAX(version) FROM schema_version")).scalar() or 0
+        )
+    except (OperationalError, ProgrammingError):
+        # schema_version 表尚不存在：全新库或迁移体系上线前的旧库。
+        conn.rollback()
+        return 0
+
+
+def _sqlite_lock_path() -> Path | None:
+    database = engine.url.database
+    if not database or database == ":memory:":
+        return None
+    return Path(f"{database}.migrate.lock")
+
+
+@contextmanager
+def _migration_lock():
+    if engine.dialect.name == "mysql":
+        with engine.connect() as conn:
+            acquired = conn.execute(
+                text("SELECT GET_LOCK(:name, :timeout)"),
+                {"name": MIGRATION_LOCK_NAME, "timeout": MIGRATION_LOCK_TIMEOUT_SEC},
+            ).scalar()
+            if acquired != 1:
+                raise RuntimeError("获取数据库迁移锁超时")
+            try:
+                yield
+            finally:
+                conn.execute(
+                    text("SELECT RELEASE_LOCK(:name)"), {"name": MIGRATION_LOCK_NAME}
+                )
+        return
+
+    lock_path = _sqlite_lock_path() if engine.dialect.name == "sqlite" else None
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+    if lock_path is None or fcntl is None:
+        yield
+        return
+    with open(lock_path, "a+") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def run_migrations() -> list[str]:
+    """执行待处理的迁移，返回本次执行的迁移名称列表（已是最新时为空）。"""
+    with engine.connect() as conn:
+        current = _read_schema_version(conn)
+    if current >= LATEST_SCHEMA_VERSION:
+        return []
+
+    applied: list[str] = []
+    with _migration_lock():
+        with engine.begin() as conn:
+            _version_metadata.create_all(bind=conn)
+        with engine.connect() as conn:
+            current = _read_schema_version(conn)
+        for version, name, migrate in MIGRATIONS:
+            if version <= current:
+                continue
+            started = time.perf_counter()
+            # 每条迁移与其版本记录在同一事务内提交（MySQL DDL 会隐式提交，需保持幂等）。
+            with engine.begin() as conn:
+                migrate(conn)
+                conn.execute(
+                    schema_version_table.insert().values(
+                        version=version, name=name, applied_at=now_local_naive()
+                    )
+                )
+            applied.append(name)
+            logger.info(
+                "schema migration %s_%s applied in %.1fms",
+                version,
+                name,
+                (time.perf_counter() - started) * 1000,
+            )
+    return applied
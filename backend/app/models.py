@@ -4,6 +4,7 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -18,17 +19,41 @@ from .utils.timezone import now_local_naive
 
 class MeetingReport(Base):
     __tablename__ = "meeting_reports"
+    # 覆盖列表页、播报队列、最新发布与飞书导入幂等查询的过滤/排序列。
+    __table_args__ = (
+        Index("ix_meeting_reports_time", "meeting_time", "id"),
+        Index("ix_meeting_reports_status_time", "status", "meeting_time", "id"),
+        Index(
+            "ix_meeting_reports_autoplay_time",
+            "auto_play_enabled",
+            "meeting_time",
+            "id",
+        ),
+        Index(
+            "ix_meeting_reports_status_published", "status", "published_at", "id"
+        ),
+        Index("ix_meeting_reports_updated", "updated_at", "id"),
+        Index("ix_meeting_reports_minute_token", "source_minute_token"),
+        Index(
+            "ix_meeting_reports_source_meeting", "source_type", "source_meeting_id"
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     meeting_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     speaker: Mapped[str] = mapped_column(String(120), nullable=False)
-    summary_raw: Mapped[str] = mapped_column(Text, nullable=False)
+    # 纪要可能包含整场会议逐字稿，口播稿也较长：默认延迟加载，需要时显式 undefer。
+    summary_raw: Mapped[str] = mapped_column(Text, nullable=False, deferred=True)
     source_language: Mapped[str] = mapped_column(
         String(16), default="zh", nullable=False
     )
-    script_draft: Mapped[str] = mapped_column(Text, default="", nullable=False)
-    script_final: Mapped[str] = mapped_column(Text, default="", nullable=False)
+    script_draft: Mapped[str] = mapped_column(
+        Text, default="", nullable=False, deferred=True
+    )
+    script_final: Mapped[str] = mapped_column(
+        Text, default="", nullable=False, deferred=True
+    )
     question_persona: Mapped[str] = mapped_column(
         String(32), default="board_director", nullable=False
     )
@@ -67,10 +92,20 @@ class MeetingReport(Base):
     translations: Mapped[list["MeetingReportTranslation"]] = relationship(
         back_populates="report", cascade="all, delete-orphan", passive_deletes=True
     )
+    transcript_segments: Mapped[list["MeetingReportTranscriptSegment"]] = (
+        relationship(
+            back_populates="report",
+            cascade="all, delete-orphan",
+            passive_deletes=True,
+        )
+    )
 
 
 class MeetingReportHighlight(Base):
     __tablename__ = "meeting_report_highlights"
+    __table_args__ = (
+        Index("ix_highlights_report_kind_seq", "report_id", "kind", "seq"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
     report_id: Mapped[int] = mapped_column(
@@ -112,6 +147,33 @@ class MeetingReportQuestion(Base):
     report: Mapped["MeetingReport"] = relationship(back_populates="questions")
 
 
+class MeetingReportTranscriptSegment(Base):
+    """会议逐字稿的结构化段落，按 (report_id, seq) 顺序存储。
+
+    替代在 summary_raw 大字符串上反复正则切分，支持按 seq / 时间区间切片读取。
+    """
+
+    __tablename__ = "meeting_report_transcript_segments"
+    __table_args__ = (
+        UniqueConstraint("report_id", "seq", name="uq_transcript_segment"),
+        Index("ix_transcript_segment_start", "report_id", "start_ms"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    report_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("meeting_reports.id", ondelete="CASCADE"), index=True
+    )
+    seq: Mapped[int] = mapped_column(Integer, nullable=False)
+    speaker: Mapped[str] = mapped_column(String(120), default="", nullable=False)
+    start_ms: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    end_ms: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    text: Mapped[str] = mapped_column(Text, default="", nullable=False)
+
+    report: Mapped["MeetingReport"] = relationship(
+        back_populates="transcript_segments"
+    )
+
+
 class MeetingReportReflectionAudio(Base):
     """每条反思 × 每种语言的预合成 TTS 音频缓存。
 
@@ -137,6 +199,22 @@ class MeetingReportReflectionAudio(Base):
     audio_pcm_base64: Mapped[str] = mapped_column(
         Text().with_variant(LONGTEXT, "mysql"), default="", nullable=False
     )
+    # 压缩音频（opus / mp3，base64），供不需要 PCM 的客户端按格式协商读取。
+    audio_compressed_base64: Mapped[str] = mapped_column(
+        Text().with_variant(LONGTEXT, "mysql"), default="", nullable=False
+    )
+    audio_compressed_format: Mapped[str] = mapped_column(
+        String(16), default="", nullable=False
+    )
+    # 各变体解码后的字节数与 SHA-256，播报队列引用模式直接返回，无需读取音频大字段。
+    audio_pcm_bytes: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    audio_pcm_sha256: Mapped[str] = mapped_column(String(64), default="", nullable=False)
+    audio_compressed_bytes: Mapped[int] = mapped_column(
+        Integer, default=0, nullable=False
+    )
+    audio_compressed_sha256: Mapped[str] = mapped_column(
+        String(64), default="", nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=now_local_naive, nullable=False
     )
@@ -165,8 +243,31 @@ class MeetingReportTranslation(Base):
         String(32), default="board_director", nullable=False
     )
     # 预生成的 16k PCM(base64)，用于非中英文音频驱动播报。
+    # 音频大字段延迟加载，只在需要内联返回或单独拉取音频时读取。
     audio_pcm_base64: Mapped[str] = mapped_column(
-        Text().with_variant(LONGTEXT, "mysql"), default="", nullable=False
+        Text().with_variant(LONGTEXT, "mysql"),
+        default="",
+        nullable=False,
+        deferred=True,
+    )
+    # 压缩音频（opus / mp3，base64），供不需要 PCM 的客户端按格式协商读取。
+    audio_compressed_base64: Mapped[str] = mapped_column(
+        Text().with_variant(LONGTEXT, "mysql"),
+        default="",
+        nullable=False,
+        deferred=True,
+    )
+    audio_compressed_format: Mapped[str] = mapped_column(
+        String(16), default="", nullable=False
+    )
+    # 各变体解码后的字节数与 SHA-256，播报队列引用模式直接返回，无需读取音频大字段。
+    audio_pcm_bytes: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    audio_pcm_sha256: Mapped[str] = mapped_column(String(64), default="", nullable=False)
+    audio_compressed_bytes: Mapped[int] = mapped_column(
+        Integer, default=0, nullable=False
+    )
+    audio_compressed_sha256: Mapped[str] = mapped_column(
+        String(64), default="", nullable=False
     )
     reviewed: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     reviewed_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
@@ -206,3 +307,61 @@ class PlaybackRuntimeSetting(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=now_local_naive, onupdate=now_local_naive, nullable=False
     )
+
+
+class CarouselScreenActivity(Base):
+    """播放屏近期活动，供各 worker 共享给轮播预热。
+
+    activity_key 为 "lang:<语种>"（播放屏在用的语种）或 "current"（当前播放条目，
+    report_id 有值）；seen_at 为最近一次上报时间。
+    """
+
+    __tablename__ = "carousel_screen_activity"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    activity_key: Mapped[str] = mapped_column(String(32), unique=True, nullable=False)
+    report_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    seen_at: Mapped[datetime] = mapped_column(
+        DateTime, default=now_local_naive, nullable=False
+    )
+
+
+class PlaybackChangeLog(Base):
+    """播报队列变更日志：自增 id 即版本号，供播报页按 since 增量同步。
+
+    新闻、子表、译文与音频写入时追加受影响的 report_id；只记录“哪条变了”，
+    是否仍在队列中由读取时判断。旧记录按 PLAYBACK_CHANGE_LOG_RETENTION 裁剪。
+    """
+
+    __tablename__ = "playback_change_log"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    report_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=now_local_naive, nullable=False, index=True
+    )
+
+
+class TtsAudioCache(Base):
+    """按 (文本 SHA-256, 语种, 格式) 持久化的按需合成音频，跨进程、跨重启复用。"""
+
+    __tablename__ = "tts_audio_cache"
+    __table_args__ = (
+        UniqueConstraint(
+            "text_sha256", "language_key", "audio_format", name="uq_tts_audio_cache"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    text_sha256: Mapped[str] = mapped_column(String(64), nullable=False)
+    language_key: Mapped[str] = mapped_column(String(16), nullable=False)
+    audio_format: Mapped[str] = mapped_column(String(16), nullable=False)
+    audio_base64: Mapped[str] = mapped_column(
+        Text().with_variant(LONGTEXT, "mysql"), default="", nullable=False
+    )
+    audio_bytes: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    audio_sha256: Mapped[str] = mapped_column(String(64), default="", nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=now_local_naive, nullable=False, index=True
+    )
@@ -0,0 +1,131 @@
+"""跨进程互斥锁。
+
+多 worker 部署时，后台线程（轮播预热、逐字稿轮询）每个进程各有一份，
+需要保证同一时刻只有一个进程在执行；按需 TTS 也需要按文本在 worker 之间互斥。
+MySQL 使用 GET_LOCK，SQLite 文件库使用数据库文件旁的文件锁；其他数据库、
+内存库或不支持 fcntl 的平台视为单进程部署，直接获得锁。
+"""
+
+import hashlib
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from sqlalchemy import text
+
+from .database import engine
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+_POLL_SEC = 0.05
+# 按键加锁时 SQLite 锁文件划分的字节槽数：不同键落在同一槽只会互相等待。
+_KEY_SLOTS = 4096
+
+# 按键加锁使用 POSIX 记录锁，关闭同一文件的任一描述符会释放本进程的全部记录锁，
+# 因此每个锁文件在进程内只打开一次、不关闭。
+_keyed_files_lock = threading.Lock()
+_keyed_files: dict[str, int] = {}
+
+
+def _sqlite_lock_path(name: str) -> Path | None:
+    if engine.dialect.name != "sqlite" or fcntl is None:
+        return None
+    database = engine.url.database
+    if not database or database == ":memory:":
+        return None
+    return Path(f"{database}.{name}.lock")
+
+
+@contextmanager
+def cross_process_lock(name: str, timeout_sec: float = 0):
+    """获取名为 name 的跨进程锁，产出是否获取成功；timeout_sec 为 0 时不等待。"""
+    if engine.dialect.name == "mysql":
+        lock_name = f"gmwavatar_{name}"
+        with engine.connect() as conn:
+            acquired = conn.execute(
+                text("SELECT GET_LOCK(:name, :timeout)"),
+                {"name": lock_name, "timeout": timeout_sec},
+            ).scalar()
+            try:
+                yield acquired == 1
+            finally:
+                if acquired == 1:
+                    conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": lock_name})
+        return
+
+    lock_path = _sqlite_lock_path(name)
+    if lock_path is None:
+        yield True
+        return
+    with open(lock_path, "a+") as lock_file:
+        deadline = time.monotonic() + timeout_sec
+        while True:
+            try:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    yield False
+                    return
+                time.sleep(_POLL_SEC)
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _keyed_lock_fd(lock_path: Path) -> int:
+    with _keyed_files_lock:
+        fd = _keyed_files.get(str(lock_path))
+        if fd is None:
+            fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+            _keyed_files[str(lock_path)] = fd
+        return fd
+
+
+@contextmanager
+def keyed_cross_process_lock(name: str, key: str, timeout_sec: float):
+    """按 key 获取跨进程锁，产出是否获取成功；超时后产出 False，由调用方决定是否继续。
+
+    同一进程内的并发由调用方自行合并（SQLite 下记录锁按进程持有，不区分线程）。
+    """
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+    if engine.dialect.name == "mysql":
+        lock_name = f"gmwavatar_{name}_{digest}"
+        with engine.connect() as conn:
+            acquired = conn.execute(
+                text("SELECT GET_LOCK(:name, :timeout)"),
+                {"name": lock_name, "timeout": timeout_sec},
+            ).scalar()
+            try:
+                yield acquired == 1
+            finally:
+                if acquired == 1:
+                    conn.execute(text("SELECT RELEASE_LOCK(:name)"), {"name": lock_name})
+        return
+
+    lock_path = _sqlite_lock_path(name)
+    if lock_path is None:
+        yield True
+        return
+    fd = _keyed_lock_fd(lock_path)
+    slot = int(digest, 16) % _KEY_SLOTS
+    deadline = time.monotonic() + timeout_sec
+    while True:
+        try:
+            fcntl.lockf(fd, fcntl.LOCK_EX | fcntl.LOCK_NB, 1, slot)
+            break
+        except OSError:
+            if time.monotonic() >= deadline:
+                yield False
+                return
+            time.sleep(_POLL_SEC)
+    try:
+        yield True
+    finally:
+        fcntl.lockf(fd, fcntl.LOCK_UN, 1, slot)
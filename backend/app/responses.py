@@ -0,0 +1,16 @@
+"""JSON 响应类。
+
+播报队列、反思等接口会返回数 MB 的 base64 音频，标准库 json 序列化较慢；
+安装了 orjson 时使用 ORJSONResponse，未安装时回退为 FastAPI 默认的 JSONResponse。
+"""
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson  # noqa: F401
+except ImportError:  # pragma: no cover - 可选依赖
+    FastJSONResponse = JSONResponse
+else:
+    from fastapi.responses import ORJSONResponse as FastJSONResponse
+
+__all__ = ["FastJSONResponse"]
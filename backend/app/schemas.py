@@ -46,6 +46,26 @@ class ReportListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    # 游标模式下一页的 cursor；为 None 表示没有更多数据或未使用游标模式。
+    next_cursor: str | None = None
+
+
+class ReportSearchItem(BaseModel):
+    id: int
+    title: str
+    speaker: str
+    meeting_time: datetime
+    status: str
+    # 命中的语种（原文语种或译文语种）。
+    language_key: str
+    snippet: str
+    score: float
+
+
+class ReportSearchResponse(BaseModel):
+    query: str
+    total: int
+    items: list[ReportSearchItem]
 
 
 class ReportDetail(BaseModel):
@@ -103,11 +123,16 @@ class TranslateScriptResponse(BaseModel):
 class SynthesizeAudioRequest(BaseModel):
     script_text: str
     language_key: str
+    # 可接受的音频格式，按优先级逗号分隔（pcm / opus / mp3），默认 pcm。
+    audio_format: str | None = None
 
 
 class SynthesizeAudioResponse(BaseModel):
     language_key: str
     audio_pcm_base64: str
+    audio_format: str = "pcm"
+    # 协商结果为压缩格式时音频放在此字段，audio_pcm_base64 为空。
+    audio_base64: str = ""
 
 
 class PublishResponse(BaseModel):
@@ -122,11 +147,22 @@ class ImportResponse(BaseModel):
     errors: list[str]
 
 
-class SourceImportRequest(BaseModel):
-    source_type: str
+class SourceImportItem(BaseModel):
+    # auto | feishu_meeting | feishu_minutes | feishu_docx
+    source_type: str = "auto"
     source_url: str
+    lookback_days: int = Field(default=30, ge=1, le=180)
+
+
+class SourceImportRequest(BaseModel):
+    # 兼容旧版单来源入参；批量导入请使用 sources。
+    source_type: str = ""
+    source_url: str = ""
     auth_config: dict = Field(default_factory=dict)
     mapping: dict = Field(default_factory=dict)
+    sources: list[SourceImportItem] = Field(default_factory=list)
+    auto_generate: bool = True
+    auto_enable_playback: bool = False
 
 
 class SourceImportResponse(BaseModel):
@@ -135,6 +171,31 @@ class SourceImportResponse(BaseModel):
     message: str
 
 
+class ImportJobItemStatus(BaseModel):
+    index: int
+    source_type: str
+    source_url: str
+    status: str
+    report_ids: list[int] = Field(default_factory=list)
+    imported_count: int = 0
+    updated_count: int = 0
+    failed_count: int = 0
+    message: str = ""
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+
+class ImportJobStatusResponse(BaseModel):
+    task_id: str
+    status: str
+    total: int
+    completed: int
+    failed: int
+    created_at: datetime
+    updated_at: datetime
+    items: list[ImportJobItemStatus]
+
+
 class FeishuMeetingImportRequest(BaseModel):
     meeting_url: str
     lookback_days: int = Field(default=30, ge=1, le=180)
@@ -279,9 +340,28 @@ class PlaybackQueueItem(BaseModel):
     localized: dict[str, dict] = Field(default_factory=dict)
 
 
+class AudioRefItem(BaseModel):
+    """音频引用：客户端按 url 单独拉取音频，bytes / sha256 用于缓存校验。"""
+
+    report_id: int
+    language_key: str
+    audio_format: str
+    url: str
+    bytes: int
+    sha256: str
+
+
 class PlaybackQueueResponse(BaseModel):
     items: list[PlaybackQueueItem]
     total: int
+    # 引用模式下，轮播中下一条新闻待播语种的音频引用，客户端可提前拉取。
+    prefetch: list[AudioRefItem] = Field(default_factory=list)
+    # 变更日志版本号，下次轮询作为 since 传入。
+    version: int = 0
+    # since 增量响应时为 False：items 只含变动条目，deleted_ids 为已移出队列的新闻；
+    # total 与 prefetch 始终按完整队列计算。
+    full: bool = True
+    deleted_ids: list[int] = Field(default_factory=list)
 
 
 class TranslationItem(BaseModel):
@@ -367,17 +447,45 @@ class FeishuLiveRecordItem(BaseModel):
     timestamp: datetime
     speaker: str
     content: str
+    # 逐字稿段落序号，仅 feishu_transcript 来源有值，用作增量拉取游标。
+    seq: int | None = None
 
 
 class FeishuLiveRecordsResponse(BaseModel):
     source: str
     records: list[FeishuLiveRecordItem]
+    # 下次增量拉取传入的 since_seq（末尾仍在增长的段落会再次返回，按 seq 覆盖）；非逐字稿来源为 None。
+    next_seq: int | None = None
+
+
+class TranscriptSegmentItem(BaseModel):
+    seq: int
+    speaker: str
+    start_ms: int
+    end_ms: int
+    text: str
+
+
+class TranscriptSegmentsResponse(BaseModel):
+    report_id: int
+    total: int
+    items: list[TranscriptSegmentItem]
+
+
+class TranscriptSyncResponse(BaseModel):
+    report_id: int
+    transcript_status: str
+    transcript_error: str = ""
+    appended_count: int
+    total: int
 
 
 class ReflectionItem(BaseModel):
     text: str
     # 预合成音频（zh 版本），前端可直接播放，None 表示尚未合成
     audio_pcm_base64: str | None = None
+    audio_format: str | None = None
+    audio_base64: str | None = None
 
 
 class ReflectionAudioItem(BaseModel):
@@ -27,6 +27,32 @@ class FeishuMeetingImportItem:
     transcript_error: str
 
 
+@dataclass
+class FeishuTranscriptSegment:
+    seq: int
+    speaker: str
+    start_ms: int
+    end_ms: int
+    text: str
+
+
+# 飞书 txt 逐字稿的发言段落头："说话人 00:01:23" 或 "说话人 01:23"。
+_TRANSCRIPT_HEADER_RE = re.compile(
+    r"^(?P<speaker>\S.{0,60}?)\s+(?P<ts>\d{1,2}:\d{2}(?::\d{2})?)$"
+)
+
+
+def parse_transcript_header(line: str) -> tuple[str, str] | None:
+    """解析逐字稿发言段落头，返回 (发言人, 时间戳)；不是段落头时返回 None。
+
+    导入分段、逐字稿分块与提示词压缩共用这一判断。
+    """
+    match = _TRANSCRIPT_HEADER_RE.match(line.strip())
+    if match is None:
+        return None
+    return match.group("speaker").strip(), match.group("ts")
+
+
 class FeishuApiClient:
     def __init__(
         self,
@@ -201,6 +227,60 @@ class FeishuApiClient:
                 return None
         return None
 
+    @staticmethod
+    def _parse_clock_ms(raw: str) -> int:
+        parts = [int(x) for x in raw.split(":")]
+        seconds = 0
+        for part in parts:
+            seconds = seconds * 60 + part
+        return seconds * 1000
+
+    @staticmethod
+    def parse_transcript_segments(transcript_text: str) -> list[FeishuTranscriptSegment]:
+        """将带发言人/时间戳的 txt 逐字稿解析为结构化段落。
+
+        段落头之前的标题、关键词等元信息忽略；end_ms 取下一段的开始时间，
+        最后一段无法确定结束时间时与 start_ms 相同。
+        """
+        segments: list[FeishuTranscriptSegment] = []
+        speaker = ""
+        start_ms = 0
+        buffer: list[str] = []
+        in_segment = False
+
+        def _flush() -> None:
+            text = "\n".join(buffer).strip()
+            if in_segment and text:
+                segments.append(
+                    FeishuTranscriptSegment(
+                        seq=len(segments),
+                        speaker=speaker,
+                        start_ms=start_ms,
+                        end_ms=start_ms,
+                        text=text,
+                    )
+                )
+
+        for raw_line in (transcript_text or "").splitlines():
+            line = raw_line.strip()
+            header = parse_transcript_header(line) if line else None
+            if header:
+                _flush()
+                speaker, clock = header
+                start_ms = FeishuApiClient._parse_clock_ms(clock)
+                buffer = []
+                in_segment = True
+                continue
+            if line:
+                buffer.append(line)
+        _flush()
+
+        for idx in range(len(segments) - 1):
+            next_start = segments[idx + 1].start_ms
+            if next_start >= segments[idx].start_ms:
+                segments[idx].end_ms = next_start
+        return segments
+
     @staticmethod
     def _walk_text_nodes(
         node: Any, path: list[str], out: list[tuple[list[str], str]]
@@ -1,19 +1,31 @@
+from __future__ import annotations
+
 import base64
 import hashlib
 import json
 import re
 import ssl
+import threading
 import time
 import urllib.error
 import urllib.request
 
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from html import escape
-from typing import Any
-
-import httpx
-from openai import AzureOpenAI
+from typing import TYPE_CHECKING, Any
 
 from ..config import settings
+from .feishu_import import parse_transcript_header
+from .prompt_budget import (
+    compact_text,
+    estimate_messages_tokens,
+    record_compaction,
+    record_llm_usage,
+)
+
+if TYPE_CHECKING:
+    from openai import AzureOpenAI
 
 
 QUESTION_PERSONA_PROMPTS: dict[str, str] = {
@@ -47,6 +59,20 @@ def _extract_json_text(text: str) -> str:
     return match.group(0) if match else ""
 
 
+def _compact_meeting_summary(label: str, summary: str, script: str = "") -> str:
+    """压缩随提示词发送的会议总结；已有口播稿时去掉被口播稿覆盖的句子并收紧预算。"""
+    if not summary:
+        return ""
+    max_tokens = (
+        settings.azure_prompt_aux_summary_max_tokens
+        if script
+        else settings.azure_prompt_source_max_tokens
+    )
+    compacted = compact_text(summary, max_tokens, reference=script)
+    record_compaction(label, compacted)
+    return compacted.text
+
+
 def _build_client() -> AzureOpenAI:
     if not settings.azure_openai_api_key:
         raise ValueError("未配置 Azure AI 参数，请先配置 AZURE_OPENAI_API_KEY")
@@ -58,6 +84,10 @@ def _build_client() -> AzureOpenAI:
             "未配置 Azure AI 地址，请配置 AZURE_ENDPOINT_URL 或 AZURE_BASE_URL"
         )
 
+    # openai / httpx 体积较大，首次调用模型时才导入，缩短应用冷启动。
+    import httpx
+    from openai import AzureOpenAI
+
     http_client = httpx.Client(
         verify=not settings.azure_ssl_skip_verify,
         timeout=settings.azure_request_timeout_sec,
@@ -101,7 +131,9 @@ def _chat_completion_with_retry(client: AzureOpenAI, **kwargs):
     raise ValueError(f"AI 请求失败（重试 {retries} 次后仍失败）: {last_error}")
 
 
-def _chat_completion_with_model_fallback(client: AzureOpenAI, **kwargs):
+def _chat_completion_with_model_fallback(
+    client: AzureOpenAI, usage_label: str = "chat", **kwargs
+):
     fallback_models = [
         x.strip()
         for x in (settings.azure_deployment_fallbacks or "").split(",")
@@ -115,7 +147,9 @@ def _chat_completion_with_model_fallback(client: AzureOpenAI, **kwargs):
     last_error: Exception | None = None
     for model_name in model_candidates:
         try:
-            return _chat_completion_with_retry(client, model=model_name, **kwargs)
+            completion = _chat_completion_with_retry(
+                client, model=model_name, **kwargs
+            )
         except Exception as exc:
             last_error = exc
             text = str(exc)
@@ -127,6 +161,12 @@ def _chat_completion_with_model_fallback(client: AzureOpenAI, **kwargs):
             ):
                 continue
             raise
+        record_llm_usage(
+            usage_label,
+            estimate_messages_tokens(kwargs.get("messages") or []),
+            completion,
+        )
+        return completion
 
     raise ValueError(
         f"AI 请求失败：可用部署均不可用（{','.join(model_candidates)}），最后错误: {last_error}"
@@ -280,7 +320,10 @@ def _resolve_speech_voice(language_key: str) -> tuple[str, str]:
 
 
 def _synthesize_with_azure_speech_service(
-    script_text: str, language_key: str, language_label: str
+    script_text: str,
+    language_key: str,
+    language_label: str,
+    output_format: str | None = None,
 ) -> str:
     key = (settings.azure_speech_key or "").strip()
     key2 = (settings.azure_speech_key_secondary or "").strip()
@@ -300,7 +343,8 @@ def _synthesize_with_azure_speech_service(
     headers = {
         "Ocp-Apim-Subscription-Key": key,
         "Content-Type": "application/ssml+xml",
-        "X-Microsoft-OutputFormat": settings.azure_speech_output_format,
+        "X-Microsoft-OutputFormat": output_format
+        or settings.azure_speech_output_format,
         "User-Agent": "gmwAvatar",
     }
 
@@ -355,6 +399,7 @@ def generate_finance_reflections(
     source_text = script or summary
     if not source_text:
         raise ValueError("会议内容不能为空")
+    summary = _compact_meeting_summary("reflections", summary, script)
 
     client = _build_client()
     prompt = (
@@ -367,6 +412,7 @@ def generate_finance_reflections(
     try:
         completion = _chat_completion_with_model_fallback(
             client,
+            usage_label="reflections",
             messages=[
                 {"role": "system", "content": [{"type": "text", "text": prompt}]},
                 {
@@ -421,6 +467,7 @@ def generate_sharp_questions(
     source_text = script or summary
     if not source_text:
         raise ValueError("会议内容不能为空")
+    summary = _compact_meeting_summary("questions", summary, script)
 
     persona = normalize_question_persona(persona_key)
     persona_prompt = QUESTION_PERSONA_PROMPTS[persona]
@@ -444,6 +491,7 @@ def generate_sharp_questions(
     try:
         completion = _chat_completion_with_model_fallback(
             client,
+            usage_label="questions",
             messages=[
                 {"role": "system", "content": [{"type": "text", "text": prompt}]},
                 {
@@ -493,6 +541,8 @@ def generate_script_and_highlights(
 ) -> tuple[str, list[str], list[str], list[str]]:
     if not summary_raw.strip():
         raise ValueError("内容不能为空")
+    # 飞书导入的总结含元数据行与整场逐字稿，按预算去重压缩后再发送。
+    summary_text = _compact_meeting_summary("script", summary_raw.strip())
     client = _build_client()
     prompt = (
         "你是新闻口播编辑，同时具备国际金融与财务分析背景。"
@@ -505,6 +555,7 @@ def generate_script_and_highlights(
     try:
         completion = _chat_completion_with_model_fallback(
             client,
+            usage_label="script",
             messages=[
                 {"role": "system", "content": [{"type": "text", "text": prompt}]},
                 {
@@ -512,7 +563,7 @@ def generate_script_and_highlights(
                     "content": [
                         {
                             "type": "text",
-                            "text": f"新闻标题：{title}\n发言人：{speaker}\n会议总结：{summary_raw}",
+                            "text": f"新闻标题：{title}\n发言人：{speaker}\n会议总结：{summary_text}",
                         }
                     ],
                 },
@@ -587,6 +638,7 @@ def translate_script(script_text: str, target_language: str) -> str:
     try:
         completion = _chat_completion_with_model_fallback(
             client,
+            usage_label="translate",
             messages=[
                 {"role": "system", "content": [{"type": "text", "text": prompt}]},
                 {"role": "user", "content": [{"type": "text", "text": text}]},
@@ -641,6 +693,7 @@ def translate_report_package(
     try:
         completion = _chat_completion_with_model_fallback(
             client,
+            usage_label="translate_package",
             messages=[
                 {"role": "system", "content": [{"type": "text", "text": prompt}]},
                 {
@@ -694,6 +747,7 @@ def generate_reflection_qa(
     source_text = script or summary
     if not source_text:
         raise ValueError("会议内容不能为空")
+    summary = _compact_meeting_summary("reflection_qa", summary, script)
 
     client = _build_client()
     prompt = (
@@ -711,6 +765,7 @@ def generate_reflection_qa(
     try:
         completion = _chat_completion_with_model_fallback(
             client,
+            usage_label="reflection_qa",
             messages=[
                 {"role": "system", "content": [{"type": "text", "text": prompt}]},
                 {
@@ -767,6 +822,154 @@ def generate_reflection_qa(
     return fallback
 
 
+# 逐字稿分块摘要缓存：key = 分块文本 sha256，重复导入同一会议时复用已摘要的分块。
+_chapter_chunk_cache: dict[str, list[str]] = {}
+_CHAPTER_CHUNK_CACHE_MAX = 512
+_chapter_chunk_cache_lock = threading.Lock()
+
+def _split_transcript_blocks(transcript: str) -> list[str]:
+    """按发言人/时间戳段落切分逐字稿，每个段落包含段落头与其后的发言内容。"""
+    blocks: list[str] = []
+    current: list[str] = []
+    for raw_line in transcript.splitlines():
+        line = raw_line.rstrip()
+        if parse_transcript_header(line) and current:
+            blocks.append("\n".join(current).strip())
+            current = []
+        if not line.strip():
+            if current and not parse_transcript_header(current[-1]):
+                blocks.append("\n".join(current).strip())
+                current = []
+            continue
+        current.append(line)
+    if current:
+        blocks.append("\n".join(current).strip())
+    return [b for b in blocks if b]
+
+
+def _split_transcript_chunks(transcript: str, max_chars: int) -> list[str]:
+    """将逐字稿按段落边界合并为不超过 max_chars 的分块；单段超长时按句切开。"""
+    limit = max(1000, int(max_chars))
+    chunks: list[str] = []
+    current = ""
+    for block in _split_transcript_blocks(transcript):
+        pieces = [block]
+        if len(block) > limit:
+            pieces = []
+            buf = ""
+            for sentence in re.split(r"(?<=[。！？!?\n])", block):
+                if buf and len(buf) + len(sentence) > limit:
+                    pieces.append(buf)
+                    buf = ""
+                buf += sentence
+                while len(buf) > limit:
+                    pieces.append(buf[:limit])
+                    buf = buf[limit:]
+            if buf.strip():
+                pieces.append(buf)
+        for piece in pieces:
+            if current and len(current) + len(piece) + 2 > limit:
+                chunks.append(current)
+                current = ""
+            current = f"{current}\n\n{piece}" if current else piece
+    if current.strip():
+        chunks.append(current)
+    return chunks
+
+
+def _fallback_chapter_lines(source: str, limit: int = 4) -> list[str]:
+    # 回退：从逐字稿句子中提炼可读章节句。
+    lines = _split_sentences(source)
+    cleaned: list[str] = []
+    seen: set[str] = set()
+    for line in lines:
+        if len(line) < 10:
+            continue
+        normalized = re.sub(r"\s+", " ", line).strip()
+        if normalized in seen:
+            continue
+        seen.add(normalized)
+        cleaned.append(normalized)
+        if len(cleaned) >= limit:
+            break
+    return cleaned
+
+
+def _request_chapter_list(
+    client: AzureOpenAI,
+    prompt: str,
+    user_payload: dict[str, Any],
+    usage_label: str = "chapters",
+) -> list[str]:
+    completion = _chat_completion_with_model_fallback(
+        client,
+        usage_label=usage_label,
+        messages=[
+            {"role": "system", "content": [{"type": "text", "text": prompt}]},
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": json.dumps(user_payload, ensure_ascii=False),
+                    }
+                ],
+            },
+        ],
+        max_completion_tokens=1600,
+        stream=False,
+    )
+    content = _completion_text(completion)
+    json_text = _extract_json_text(content)
+    if not json_text:
+        raise ValueError("AI 返回格式异常，未解析到 JSON")
+    parsed = json.loads(json_text)
+    raw = parsed.get("chapters", [])
+    if not isinstance(raw, list):
+        raw = []
+    return [str(x).replace("```", "").strip() for x in raw if str(x).strip()]
+
+
+def _summarize_transcript_chunk(
+    client: AzureOpenAI, title: str, chunk: str, index: int, total: int
+) -> list[str]:
+    """map 阶段：对单个分块提炼阶段要点，结果按分块 hash 缓存。"""
+    chunk_hash = hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+    with _chapter_chunk_cache_lock:
+        cached = _chapter_chunk_cache.get(chunk_hash)
+    if cached is not None:
+        return list(cached)
+
+    prompt = (
+        "你是会议纪要编辑。输入是一场长会议逐字稿的其中一段，"
+        "请提炼该段落的 1 到 3 条阶段要点，每条是完整句，保留关键数字、结论与责任人。"
+        '严格返回 JSON：{"chapters":["要点1","要点2"]}。'
+        "只返回 JSON，不要其他文字。"
+    )
+    try:
+        points = _request_chapter_list(
+            client,
+            prompt,
+            {
+                "title": title,
+                "part": f"{index + 1}/{total}",
+                "transcript": chunk,
+            },
+            usage_label="chapters_map",
+        )[:3]
+    except Exception:
+        # 单个分块失败只影响该段，不缓存回退结果，下次导入会重试。
+        return _fallback_chapter_lines(chunk, limit=2)
+    if not points:
+        return _fallback_chapter_lines(chunk, limit=2)
+
+    with _chapter_chunk_cache_lock:
+        if len(_chapter_chunk_cache) >= _CHAPTER_CHUNK_CACHE_MAX:
+            _chapter_chunk_cache.pop(next(iter(_chapter_chunk_cache)))
+        _chapter_chunk_cache[chunk_hash] = points
+    return list(points)
+
+
 def generate_meeting_chapters_from_transcript(
     title_text: str, transcript_text: str
 ) -> list[str]:
@@ -775,8 +978,9 @@ def generate_meeting_chapters_from_transcript(
     if not transcript:
         return []
 
-    # 限制输入长度，避免超长逐字稿导致超时。
-    source = transcript[:12000]
+    chunks = _split_transcript_chunks(
+        transcript, settings.azure_chapter_chunk_chars
+    ) or [transcript]
     client = _build_client()
     prompt = (
         "你是会议纪要编辑。请根据逐字稿抽取“章节纪要”，输出 3 到 6 条。"
@@ -785,59 +989,67 @@ def generate_meeting_chapters_from_transcript(
         "只返回 JSON，不要其他文字。"
     )
 
+    if len(chunks) == 1:
+        try:
+            return _request_chapter_list(
+                client, prompt, {"title": title, "transcript": chunks[0]}
+            )[:6]
+        except Exception:
+            return _fallback_chapter_lines(chunks[0])
+
+    # map：各分块并行提炼阶段要点，整体耗时约等于单个分块的调用耗时。
+    max_workers = max(1, min(int(settings.azure_chapter_max_workers), len(chunks)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        partials = list(
+            executor.map(
+                lambda pair: _summarize_transcript_chunk(
+                    client, title, pair[1], pair[0], len(chunks)
+                ),
+                enumerate(chunks),
+            )
+        )
+
+    # reduce：按时间顺序合并各段要点，归纳为覆盖全场的 3 到 6 条章节。
+    ordered_points = [
+        {"part": idx + 1, "points": points}
+        for idx, points in enumerate(partials)
+        if points
+    ]
+    if not ordered_points:
+        return _fallback_chapter_lines(transcript)
+    reduce_prompt = (
+        "你是会议纪要编辑。输入是同一场会议按时间顺序分段提炼的阶段要点，"
+        "请合并归纳为覆盖整场会议的章节纪要，输出 3 到 6 条，保持时间顺序。"
+        "每条必须是完整句，聚焦一个阶段主题，避免口语和赘述。"
+        '严格返回 JSON：{"chapters":["章节1","章节2","章节3"]}。'
+        "只返回 JSON，不要其他文字。"
+    )
     try:
-        completion = _chat_completion_with_model_fallback(
+        chapters = _request_chapter_list(
             client,
-            messages=[
-                {"role": "system", "content": [{"type": "text", "text": prompt}]},
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "text",
-                            "text": json.dumps(
-                                {
-                                    "title": title,
-                                    "transcript": source,
-                                },
-                                ensure_ascii=False,
-                            ),
-                        }
-                    ],
-                },
-            ],
-            max_completion_tokens=1600,
-            stream=False,
+            reduce_prompt,
+            {"title": title, "segments": ordered_points},
+            usage_label="chapters_reduce",
         )
-        content = _completion_text(completion)
-        json_text = _extract_json_text(content)
-        if not json_text:
-            raise ValueError("AI 返回格式异常，未解析到 JSON")
-        parsed = json.loads(json_text)
-        raw = parsed.get("chapters", [])
-        if not isinstance(raw, list):
-            raw = []
-        chapters = [str(x).replace("```", "").strip() for x in raw if str(x).strip()]
-        return chapters[:6]
+        if chapters:
+            return chapters[:6]
     except Exception:
-        # 回退：从逐字稿句子中提炼最多 4 条可读章节句。
-        lines = _split_sentences(source)
-        cleaned: list[str] = []
-        seen: set[str] = set()
-        for line in lines:
-            if len(line) < 10:
-                continue
-            normalized = re.sub(r"\s+", " ", line).strip()
-            if normalized in seen:
-                continue
-            seen.add(normalized)
-            cleaned.append(normalized)
-            if len(cleaned) >= 4:
-                break
-        return cleaned
+        pass
+
+    # reduce 失败时取各段首条要点，并按时间均匀抽样，保证覆盖整场会议。
+    merged: list[str] = []
+    seen: set[str] = set()
+    for points in partials:
+        if points and points[0] not in seen:
+            seen.add(points[0])
+            merged.append(points[0])
+    if len(merged) <= 6:
+        return merged
+    step = len(merged) / 6
+    return [merged[int(i * step)] for i in range(6)]
 
 
-# 进程内 TTS 缓存：key = (text_sha256, language_key)，最多缓存 128 条，避免重复调用 Azure。
+# 进程内 PCM TTS 缓存：key = (text_sha256, language_key)，最多缓存 128 条，避免重复调用 Azure。
 _tts_cache: dict[tuple[str, str], str] = {}
 _TTS_CACHE_MAX = 128
 
@@ -847,29 +1059,30 @@ def _tts_cache_key(text: str, language_key: str) -> tuple[str, str]:
     return (sha, language_key)
 
 
-def synthesize_script_audio_pcm_base64(
-    script_text: str, language_key: str, language_label: str
-) -> str:
-    text = script_text.strip()
-    if not text:
-        raise ValueError("口播稿不能为空")
-
-    cache_key = _tts_cache_key(text, language_key)
-    if cache_key in _tts_cache:
-        return _tts_cache[cache_key]
-
-    # 优先使用 Azure Speech 服务（语种覆盖更好，尤其粤语）。
-    if (settings.azure_speech_key or "").strip():
-        result = _synthesize_with_azure_speech_service(
-            script_text=text,
-            language_key=language_key,
-            language_label=language_label,
-        )
-        if len(_tts_cache) >= _TTS_CACHE_MAX:
-            _tts_cache.pop(next(iter(_tts_cache)))
-        _tts_cache[cache_key] = result
-        return result
-
+def _tts_cache_put(cache_key: tuple[str, str], audio: str) -> None:
+    if len(_tts_cache) >= _TTS_CACHE_MAX:
+        _tts_cache.pop(next(iter(_tts_cache)))
+    _tts_cache[cache_key] = audio
+
+
+def prime_tts_cache(entries: list[tuple[str, str, str]]) -> int:
+    """用已落库的音频 (script_text, language_key, pcm_base64) 预热 TTS 缓存，返回写入条数。"""
+    primed = 0
+    for script_text, language_key, audio in entries[:_TTS_CACHE_MAX]:
+        text = (script_text or "").strip()
+        if not text or not audio:
+            continue
+        cache_key = _tts_cache_key(text, language_key)
+        if cache_key in _tts_cache:
+            continue
+        _tts_cache_put(cache_key, audio)
+        primed += 1
+    return primed
+
+
+def _synthesize_with_openai_tts(
+    text: str, language_key: str, language_label: str, response_format: str
+) -> bytes:
     # 回退：Azure OpenAI TTS 部署。
     deployment = (settings.azure_tts_deployment_name or "").strip()
     if not deployment:
@@ -884,7 +1097,7 @@ def synthesize_script_audio_pcm_base64(
             model=deployment,
             voice=voice,
             input=text,
-            response_format="pcm",
+            response_format=response_format,
             timeout=settings.azure_request_timeout_sec,
         )
     except Exception as exc:
@@ -894,11 +1107,134 @@ def synthesize_script_audio_pcm_base64(
     audio_bytes = _response_to_bytes(response)
     if not audio_bytes:
         raise ValueError(f"AI 语音合成结果为空({language_key}/{language_label})")
+    return audio_bytes
+
+
+def synthesize_script_audio_pcm_base64(
+    script_text: str, language_key: str, language_label: str
+) -> str:
+    text = script_text.strip()
+    if not text:
+        raise ValueError("口播稿不能为空")
+
+    cache_key = _tts_cache_key(text, language_key)
+    if cache_key in _tts_cache:
+        return _tts_cache[cache_key]
+
+    # 优先使用 Azure Speech 服务（语种覆盖更好，尤其粤语）。
+    if (settings.azure_speech_key or "").strip():
+        result = _synthesize_with_azure_speech_service(
+            script_text=text,
+            language_key=language_key,
+            language_label=language_label,
+        )
+        _tts_cache_put(cache_key, result)
+        return result
+
+    audio_bytes = _synthesize_with_openai_tts(text, language_key, language_label, "pcm")
     pcm_bytes = _extract_wav_pcm_data(audio_bytes)
     if not pcm_bytes:
         raise ValueError(f"AI 语音 PCM 提取失败({language_key}/{language_label})")
     result = base64.b64encode(pcm_bytes).decode("ascii")
-    if len(_tts_cache) >= _TTS_CACHE_MAX:
-        _tts_cache.pop(next(iter(_tts_cache)))
-    _tts_cache[cache_key] = result
+    _tts_cache_put(cache_key, result)
     return result
+
+
+def compressed_audio_format() -> str:
+    """配置的压缩音频格式简称（opus / mp3），未配置或无法识别时为空。"""
+    output_format = (settings.azure_speech_compressed_output_format or "").lower()
+    if "opus" in output_format:
+        return "opus"
+    if "mp3" in output_format:
+        return "mp3"
+    return ""
+
+
+def synthesize_script_audio_compressed_base64(
+    script_text: str, language_key: str, language_label: str
+) -> tuple[str, str]:
+    """合成压缩音频，返回 (格式简称, base64)。
+
+    不进入进程内 TTS 缓存：该缓存只留给 PCM（启动预热也只预热 PCM），
+    压缩音频已随译文行与 tts_audio_cache 表持久化。
+    """
+    audio_format = compressed_audio_format()
+    if not audio_format:
+        raise ValueError("未配置压缩音频格式：请设置 AZURE_SPEECH_COMPRESSED_OUTPUT_FORMAT")
+    text = script_text.strip()
+    if not text:
+        raise ValueError("口播稿不能为空")
+
+    if (settings.azure_speech_key or "").strip():
+        result = _synthesize_with_azure_speech_service(
+            script_text=text,
+            language_key=language_key,
+            language_label=language_label,
+            output_format=settings.azure_speech_compressed_output_format,
+        )
+    else:
+        audio_bytes = _synthesize_with_openai_tts(
+            text, language_key, language_label, audio_format
+        )
+        result = base64.b64encode(audio_bytes).decode("ascii")
+    return audio_format, result
+
+
+@dataclass
+class AudioVariants:
+    """一段口播的落库音频：PCM 供百度数字人驱动，压缩格式供其他客户端播放。"""
+
+    pcm_base64: str = ""
+    compressed_base64: str = ""
+    compressed_format: str = ""
+
+
+def audio_digest(audio_base64: str) -> tuple[int, str]:
+    """返回 base64 音频解码后的 (字节数, SHA-256)，空音频返回 (0, "")。"""
+    audio_base64 = (audio_base64 or "").strip()
+    if not audio_base64:
+        return 0, ""
+    audio_bytes = base64.b64decode(audio_base64)
+    return len(audio_bytes), hashlib.sha256(audio_bytes).hexdigest()
+
+
+# 同时落库 PCM 与压缩音频时，两路上游合成并行执行，保存耗时取两者较长者而非之和。
+_tts_variant_executor = ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="tts-variant"
+)
+
+
+def synthesize_script_audio_variants(
+    script_text: str, language_key: str, language_label: str
+) -> AudioVariants:
+    """按配置合成需要落库的音频变体；任一变体成功即返回，全部失败时抛出首个错误。"""
+    variants = AudioVariants()
+    errors: list[Exception] = []
+    store_compressed = bool(compressed_audio_format())
+    store_pcm = settings.tts_store_pcm or not store_compressed
+    compressed_future = None
+    if store_compressed:
+        compressed_future = _tts_variant_executor.submit(
+            synthesize_script_audio_compressed_base64,
+            script_text,
+            language_key,
+            language_label,
+        )
+    if store_pcm:
+        try:
+            variants.pcm_base64 = synthesize_script_audio_pcm_base64(
+                script_text, language_key, language_label
+            )
+        except Exception as exc:
+            errors.append(exc)
+    if compressed_future is not None:
+        try:
+            (
+                variants.compressed_format,
+                variants.compressed_base64,
+            ) = compressed_future.result()
+        except Exception as exc:
+            errors.append(exc)
+    if errors and not variants.pcm_base64 and not variants.compressed_base64:
+        raise errors[0]
+    return variants
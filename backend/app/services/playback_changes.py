@@ -0,0 +1,125 @@
+"""播报队列变更日志。
+
+会话 flush 后收集受影响的 report_id（新闻本身、亮点/反思/提问、译文与反思音频），
+提交前批量追加到 playback_change_log，自增 id 作为单调递增的版本号。
+播报队列接口据此按 since 只返回变动的条目与已移出的 ID；since 早于已裁剪的记录
+或大于当前版本（如换库）时返回 None，由调用方回退为全量同步。
+
+使用 Core 语句直接写子表的路径需自行调用 record_report_changes。
+"""
+
+from datetime import timedelta
+
+from sqlalchemy import delete, event, func, insert, or_, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..config import settings
+from ..models import (
+    MeetingReport,
+    MeetingReportHighlight,
+    MeetingReportQuestion,
+    MeetingReportReflection,
+    MeetingReportReflectionAudio,
+    MeetingReportTranslation,
+    PlaybackChangeLog,
+)
+from ..utils.timezone import now_local_naive
+
+_PENDING_KEY = "playback_changed_reports"
+_CHILD_MODELS = (
+    MeetingReportHighlight,
+    MeetingReportQuestion,
+    MeetingReportReflection,
+    MeetingReportReflectionAudio,
+    MeetingReportTranslation,
+)
+# MySQL 并发事务的自增 id 可能晚于更大的 id 提交；读取时把最近几秒的记录一并返回，
+# 条目按 upsert 语义合并，重复返回无副作用。SQLite 写事务串行，id 顺序即提交顺序。
+_SETTLE_SEC = 5
+# 每追加这么多条检查一次裁剪。
+_PRUNE_EVERY = 200
+
+
+def record_report_changes(db: Session, report_ids) -> None:
+    """登记本事务中变动的新闻，提交前统一写入变更日志。"""
+    pending: set[int] = db.info.setdefault(_PENDING_KEY, set())
+    pending.update(int(report_id) for report_id in report_ids if report_id is not None)
+
+
+def _report_id_of(obj) -> int | None:
+    if isinstance(obj, MeetingReport):
+        return obj.id
+    if isinstance(obj, _CHILD_MODELS):
+        return obj.report_id
+    return None
+
+
+def _collect_changed_reports(session: Session, _flush_context) -> None:
+    changed = [
+        _report_id_of(obj)
+        for obj in list(session.new) + list(session.deleted)
+    ]
+    changed += [
+        _report_id_of(obj)
+        for obj in session.dirty
+        if session.is_modified(obj, include_collections=False)
+    ]
+    changed = [report_id for report_id in changed if report_id is not None]
+    if changed:
+        record_report_changes(session, changed)
+
+
+def _write_change_log(session: Session) -> None:
+    session.flush()
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    now = now_local_naive()
+    session.execute(
+        insert(PlaybackChangeLog),
+        [{"report_id": report_id, "created_at": now} for report_id in sorted(pending)],
+    )
+    retention = settings.playback_change_log_retention
+    if retention <= 0:
+        return
+    latest = session.execute(select(func.max(PlaybackChangeLog.id))).scalar() or 0
+    if latest % _PRUNE_EVERY < len(pending):
+        session.execute(
+            delete(PlaybackChangeLog).where(PlaybackChangeLog.id <= latest - retention)
+        )
+
+
+def _discard_pending(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def register_playback_change_log(session_factory: sessionmaker) -> None:
+    """为会话工厂注册变更日志写入；重复调用不会重复注册。"""
+    if event.contains(session_factory, "after_flush", _collect_changed_reports):
+        return
+    event.listen(session_factory, "after_flush", _collect_changed_reports)
+    event.listen(session_factory, "before_commit", _write_change_log)
+    event.listen(session_factory, "after_rollback", _discard_pending)
+
+
+def current_change_version(db: Session) -> int:
+    return int(db.execute(select(func.max(PlaybackChangeLog.id))).scalar() or 0)
+
+
+def changed_reports_since(db: Session, since: int, version: int) -> set[int] | None:
+    """返回 since 之后变动过的 report_id；无法增量（记录已裁剪或版本超前）时返回 None。"""
+    if since > version:
+        return None
+    if since < version:
+        oldest = db.execute(select(func.min(PlaybackChangeLog.id))).scalar() or 0
+        # since 之后的第一条记录已被裁剪，中间的变动无从得知。
+        if oldest > since + 1:
+            return None
+    condition = PlaybackChangeLog.id > since
+    if db.get_bind().dialect.name != "sqlite":
+        settle_from = now_local_naive() - timedelta(seconds=_SETTLE_SEC)
+        condition = or_(condition, PlaybackChangeLog.created_at >= settle_from)
+    rows = db.execute(
+        select(PlaybackChangeLog.report_id).where(condition).distinct()
+    )
+    return {int(report_id) for report_id in rows.scalars()}
@@ -0,0 +1,335 @@
+"""LLM 输入的 token 预算与压缩。
+
+会议总结（尤其飞书导入的 summary_raw）常包含会议号、实例 ID、链接等元数据行，
+以及正式总结、AI 章节与整场逐字稿等重复内容，每次调用都按输入 token 计费。
+这里在组装提示词前：
+- 估算 token（中日韩字符按 1 个计，其余字符约 4 个计 1 个，不依赖分词库）；
+- 去掉元数据行、链接与逐字稿时间戳，合并重复段落和重复行；
+- 超出预算时按句抽取式压缩：按词频打分，优先保留靠前段落与含数字的句子，
+  跳过与已选句高度重合的句子，按原顺序输出；
+- 记录每次调用的输入/输出 token（以接口返回的 usage 为准），汇总见 get_llm_usage_stats()。
+"""
+
+import logging
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any
+
+from .feishu_import import parse_transcript_header
+
+logger = logging.getLogger(__name__)
+
+_CJK_CHAR = re.compile(r"[぀-ヿ㐀-䶿一-鿿가-힯豈-﫿]")
+_LATIN_WORD = re.compile(r"[A-Za-z0-9]+")
+_URL = re.compile(r"https?://\S+")
+# _build_feishu_summary 写入的元数据行，对生成口播稿没有信息量。
+_METADATA_LINE = re.compile(
+    r"^\s*(会议号|会议实例ID|会议ID|妙记链接|文字记录状态|文字记录说明|链接|URL)\s*[:：]",
+    re.IGNORECASE,
+)
+_SECTION_HEADER = re.compile(r"^【[^】]{1,30}】$")
+# 只有该段落是逐字稿，其余段落中形如 "会议时间 10:00" 的行原样保留。
+_TRANSCRIPT_HEADER = "【会议文字记录】"
+_SENTENCE_SPLIT = re.compile(r"(?<=[。！？!?；;])")
+_NORMALIZE_STRIP = re.compile(r"[\s\W_]+", re.UNICODE)
+# 短于该长度的行（如“好的”“嗯”）不参与去重，避免误删有意义的短句。
+_DEDUPE_MIN_CHARS = 8
+# 摘要句与口播稿的二元组重合度达到该比例即视为已被口播稿覆盖。
+_COVERED_OVERLAP = 0.6
+_MIN_SENTENCE_CHARS = 4
+
+
+def estimate_tokens(text: str) -> int:
+    if not text:
+        return 0
+    cjk = len(_CJK_CHAR.findall(text))
+    rest = len(re.sub(r"\s+", " ", _CJK_CHAR.sub("", text)).strip())
+    return cjk + math.ceil(rest / 4)
+
+
+def _normalize(text: str) -> str:
+    return _NORMALIZE_STRIP.sub("", text).lower()
+
+
+def _bigrams(text: str) -> set[str]:
+    normalized = _normalize(text)
+    return {normalized[i : i + 2] for i in range(len(normalized) - 1)}
+
+
+def strip_metadata(text: str) -> str:
+    """去掉元数据行、链接与逐字稿时间戳（仅【会议文字记录】段落内）。"""
+    lines: list[str] = []
+    last_speaker = ""
+    in_transcript = False
+    for raw_line in text.splitlines():
+        if _METADATA_LINE.match(raw_line):
+            continue
+        line = _URL.sub("", raw_line).rstrip()
+        # 飞书逐字稿发言段落头，例如 "张三 00:01:23"：只保留发言人。
+        header = parse_transcript_header(line) if in_transcript else None
+        if header:
+            # 同一发言人连续发言时只保留第一个段落头。
+            if header[0] == last_speaker:
+                continue
+            last_speaker = header[0]
+            line = f"{last_speaker}："
+        elif _SECTION_HEADER.match(line.strip()):
+            last_speaker = ""
+            in_transcript = line.strip() == _TRANSCRIPT_HEADER
+        lines.append(line)
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(lines)).strip()
+
+
+def _split_sections(text: str) -> list[tuple[str, list[str]]]:
+    """按【标题】切分段落；首个标题前的内容归入空标题段落。"""
+    sections: list[tuple[str, list[str]]] = [("", [])]
+    for line in text.splitlines():
+        if _SECTION_HEADER.match(line.strip()):
+            sections.append((line.strip(), []))
+            continue
+        sections[-1][1].append(line)
+    return [(h, body) for h, body in sections if h or any(x.strip() for x in body)]
+
+
+def dedupe_sections(text: str) -> str:
+    """合并重复段落与重复行：正文已被前面段落完整包含的段落整段去掉。"""
+    kept: list[tuple[str, list[str]]] = []
+    kept_bodies: list[str] = []
+    seen_lines: set[str] = set()
+    for header, body in _split_sections(text):
+        normalized_body = _normalize("".join(body))
+        if normalized_body and any(normalized_body in prev for prev in kept_bodies):
+            continue
+        lines: list[str] = []
+        for line in body:
+            key = _normalize(line)
+            if len(key) >= _DEDUPE_MIN_CHARS:
+                if key in seen_lines:
+                    continue
+                seen_lines.add(key)
+            lines.append(line)
+        if not any(x.strip() for x in lines):
+            continue
+        kept.append((header, lines))
+        kept_bodies.append(normalized_body)
+    blocks = [
+        "\n".join(([header] if header else []) + lines).strip()
+        for header, lines in kept
+    ]
+    return "\n\n".join(b for b in blocks if b)
+
+
+def drop_covered_sentences(text: str, reference: str) -> str:
+    """去掉已被 reference（如口播稿）覆盖的句子，用于同时发送总结与口播稿的场景。"""
+    ref_grams = _bigrams(reference)
+    if not ref_grams:
+        return text
+    kept: list[str] = []
+    for line in text.splitlines():
+        sentences = [s for s in _SENTENCE_SPLIT.split(line) if s.strip()]
+        remaining = []
+        for sentence in sentences:
+            grams = _bigrams(sentence)
+            if grams and len(grams & ref_grams) / len(grams) >= _COVERED_OVERLAP:
+                continue
+            remaining.append(sentence)
+        if remaining or not sentences:
+            kept.append("".join(remaining))
+    return re.sub(r"\n{3,}", "\n\n", "\n".join(kept)).strip()
+
+
+def _terms(text: str) -> list[str]:
+    normalized = _normalize(text)
+    cjk_terms = [
+        normalized[i : i + 2]
+        for i in range(len(normalized) - 1)
+        if _CJK_CHAR.match(normalized[i])
+    ]
+    return cjk_terms + [w.lower() for w in _LATIN_WORD.findall(text) if len(w) > 1]
+
+
+def compress_to_budget(text: str, max_tokens: int) -> str:
+    """抽取式压缩：按句打分挑选到预算内，保持段落标题与原有顺序。"""
+    if max_tokens <= 0 or estimate_tokens(text) <= max_tokens:
+        return text
+
+    # units: (段落序号, 行序号, 句子)；段落标题单独保留，不参与打分。
+    sections = _split_sections(text)
+    units: list[tuple[int, int, str]] = []
+    for s_idx, (_header, body) in enumerate(sections):
+        for l_idx, line in enumerate(body):
+            for sentence in _SENTENCE_SPLIT.split(line):
+                if sentence.strip():
+                    units.append((s_idx, l_idx, sentence.strip()))
+    if not units:
+        return text
+
+    freq = Counter(term for _, _, sentence in units for term in set(_terms(sentence)))
+    seen_sections: set[int] = set()
+    scores: list[float] = []
+    for idx, (s_idx, _l_idx, sentence) in enumerate(units):
+        terms = set(_terms(sentence))
+        # “嗯好的”、孤立的发言人行等不参与抽取。
+        if not terms or len(_normalize(sentence)) < _MIN_SENTENCE_CHARS:
+            scores.append(0.0)
+            continue
+        # 取对数词频均值，避免逐字稿中反复出现的口头语压过总结段落。
+        score = sum(math.log1p(freq[t]) for t in terms) / len(terms)
+        if re.search(r"\d", sentence):
+            score *= 1.3
+        if s_idx not in seen_sections:
+            seen_sections.add(s_idx)
+            score *= 1.5
+        # 总结类段落在逐字稿之前，越靠前的段落权重越高。
+        score *= 1 / (1 + s_idx)
+        scores.append(score)
+
+    header_tokens = sum(estimate_tokens(h) + 1 for h, _ in sections if h)
+    budget = max_tokens - header_tokens
+    selected: set[int] = set()
+    selected_grams: list[set[str]] = []
+    for idx in sorted(range(len(units)), key=lambda i: scores[i], reverse=True):
+        cost = estimate_tokens(units[idx][2]) + 1
+        if scores[idx] <= 0 or cost > budget:
+            continue
+        grams = _bigrams(units[idx][2])
+        if grams and any(
+            len(grams & prev) / len(grams) >= _COVERED_OVERLAP
+            for prev in selected_grams
+        ):
+            continue
+        selected.add(idx)
+        selected_grams.append(grams)
+        budget -= cost
+        if budget <= 0:
+            break
+
+    blocks: list[str] = []
+    for s_idx, (header, _body) in enumerate(sections):
+        lines: dict[int, list[str]] = {}
+        for idx, (u_section, l_idx, sentence) in enumerate(units):
+            if u_section == s_idx and idx in selected:
+                lines.setdefault(l_idx, []).append(sentence)
+        if not lines:
+            continue
+        body_text = "\n".join("".join(lines[k]) for k in sorted(lines))
+        blocks.append(f"{header}\n{body_text}" if header else body_text)
+    return "\n\n".join(blocks)
+
+
+@dataclass
+class CompactedText:
+    text: str
+    tokens_before: int
+    tokens_after: int
+    compressed: bool
+
+
+def compact_text(text: str, max_tokens: int, reference: str = "") -> CompactedText:
+    """去元数据、去重，必要时去掉已被 reference 覆盖的句子并压缩到 max_tokens 以内。"""
+    source = (text or "").strip()
+    before = estimate_tokens(source)
+    cleaned = dedupe_sections(strip_metadata(source))
+    if reference:
+        cleaned = drop_covered_sentences(cleaned, reference)
+    compressed = False
+    if max_tokens > 0 and estimate_tokens(cleaned) > max_tokens:
+        cleaned = compress_to_budget(cleaned, max_tokens)
+        compressed = True
+    return CompactedText(
+        text=cleaned,
+        tokens_before=before,
+        tokens_after=estimate_tokens(cleaned),
+        compressed=compressed,
+    )
+
+
+_stats_lock = threading.Lock()
+_stats: dict[str, dict[str, int]] = {}
+
+
+def _label_stats(label: str) -> dict[str, int]:
+    row = _stats.get(label)
+    if row is None:
+        row = {
+            "calls": 0,
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "trimmed_tokens": 0,
+            "compressed": 0,
+        }
+        _stats[label] = row
+    return row
+
+
+def record_compaction(label: str, compacted: CompactedText) -> None:
+    trimmed = max(0, compacted.tokens_before - compacted.tokens_after)
+    if trimmed:
+        logger.info(
+            "llm %s: input compacted %s -> %s tokens%s",
+            label,
+            compacted.tokens_before,
+            compacted.tokens_after,
+            " (extractive)" if compacted.compressed else "",
+        )
+    with _stats_lock:
+        row = _label_stats(label)
+        row["trimmed_tokens"] += trimmed
+        row["compressed"] += int(compacted.compressed)
+
+
+def estimate_messages_tokens(messages: list[dict[str, Any]]) -> int:
+    total = 0
+    for message in messages:
+        content = message.get("content")
+        if isinstance(content, str):
+            total += estimate_tokens(content)
+        elif isinstance(content, list):
+            total += sum(
+                estimate_tokens(str(part.get("text", "")))
+                for part in content
+                if isinstance(part, dict)
+            )
+        # 每条消息的角色与分隔符约 4 个 token。
+        total += 4
+    return total
+
+
+def _usage_value(usage: Any, key: str) -> int | None:
+    if usage is None:
+        return None
+    value = usage.get(key) if isinstance(usage, dict) else getattr(usage, key, None)
+    return int(value) if isinstance(value, (int, float)) else None
+
+
+def record_llm_usage(label: str, estimated_prompt_tokens: int, completion: Any) -> None:
+    """记录一次调用的输入/输出 token；接口未返回 usage 时输入按估算值计。"""
+    usage = (
+        completion.get("usage")
+        if isinstance(completion, dict)
+        else getattr(completion, "usage", None)
+    )
+    prompt_tokens = _usage_value(usage, "prompt_tokens")
+    completion_tokens = _usage_value(usage, "completion_tokens") or 0
+    logger.info(
+        "llm %s: prompt_tokens=%s completion_tokens=%s estimated_prompt_tokens=%s",
+        label,
+        prompt_tokens,
+        completion_tokens,
+        estimated_prompt_tokens,
+    )
+    with _stats_lock:
+        row = _label_stats(label)
+        row["calls"] += 1
+        row["prompt_tokens"] += (
+            prompt_tokens if prompt_tokens is not None else estimated_prompt_tokens
+        )
+        row["completion_tokens"] += completion_tokens
+
+
+def get_llm_usage_stats() -> dict:
+    with _stats_lock:
+        return {label: dict(row) for label, row in _stats.items()}
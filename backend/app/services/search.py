@@ -0,0 +1,359 @@
+import re
+from dataclasses import dataclass
+
+from sqlalchemy import event, inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session, sessionmaker
+
+from ..models import MeetingReport, MeetingReportTranslation
+
+SEARCH_TABLE = "meeting_report_search"
+_INDEXED_REPORT_FIELDS = ("title", "speaker", "summary_raw", "script_final", "source_language")
+_INDEXED_TRANSLATION_FIELDS = ("language_key", "title_text", "script_text")
+
+# 当前库是否具备全文索引；init_search_backend 启动时探测并写入。
+_search_backend = {"dialect": "", "available": False, "trigram": False}
+
+
+@dataclass
+class SearchHit:
+    report_id: int
+    language_key: str
+    score: float
+    snippet: str
+
+
+def create_search_table(conn: Connection) -> None:
+    """创建全文检索表：SQLite 使用 FTS5，MySQL 使用 ngram FULLTEXT。由迁移调用。"""
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        try:
+            # trigram 分词支持中文等无空格语言的子串检索。
+            with conn.begin_nested():
+                conn.execute(
+                    text(
+                        f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+                        "report_id UNINDEXED, language_key UNINDEXED, "
+                        "title, speaker, summary, script, tokenize='trigram')"
+                    )
+                )
+        except Exception:
+            conn.execute(
+                text(
+                    f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+                    "report_id UNINDEXED, language_key UNINDEXED, "
+                    "title, speaker, summary, script)"
+                )
+            )
+    elif dialect == "mysql":
+        conn.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ("
+                "id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY, "
+                "report_id INT NOT NULL, "
+                "language_key VARCHAR(16) NOT NULL, "
+                "title TEXT, speaker VARCHAR(120), summary LONGTEXT, script LONGTEXT, "
+                "UNIQUE KEY uq_report_search (report_id, language_key), "
+                "FULLTEXT KEY ft_report_search (title, speaker, summary, script) "
+                "WITH PARSER ngram"
+                ") ENGINE=InnoDB DEFAULT CHARSET=utf8mb4"
+            )
+        )
+
+
+def init_search_backend(conn: Connection) -> None:
+    """启动时探测检索表是否存在及分词方式，只做一次轻量查询。"""
+    dialect = conn.dialect.name
+    _search_backend.update({"dialect": dialect, "available": False, "trigram": False})
+    if dialect == "sqlite":
+        ddl = conn.execute(
+            text("SELECT sql FROM sqlite_master WHERE name = :name"),
+            {"name": SEARCH_TABLE},
+        ).scalar()
+        if ddl:
+            _search_backend["available"] = True
+            _search_backend["trigram"] = "trigram" in ddl.lower()
+    elif dialect == "mysql":
+        exists = conn.execute(
+            text(
+                "SELECT COUNT(*) FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = :name"
+            ),
+            {"name": SEARCH_TABLE},
+        ).scalar()
+        _search_backend["available"] = bool(exists)
+
+
+def search_available() -> bool:
+    return bool(_search_backend["available"])
+
+
+def _collect_documents(db: Session, report_ids: list[int]) -> list[dict]:
+    if not report_ids:
+        return []
+    params = {f"id_{idx}": rid for idx, rid in enumerate(report_ids)}
+    placeholders = ", ".join(f":{key}" for key in params)
+    docs: list[dict] = []
+    report_rows = db.execute(
+        text(
+            "SELECT id, title, speaker, summary_raw, script_final, source_language "
+            f"FROM meeting_reports WHERE id IN ({placeholders})"
+        ),
+        params,
+    ).all()
+    for row in report_rows:
+        docs.append(
+            {
+                "report_id": row.id,
+                "language_key": (row.source_language or "zh"),
+                "title": row.title or "",
+                "speaker": row.speaker or "",
+                "summary": row.summary_raw or "",
+                "script": row.script_final or "",
+            }
+        )
+    source_langs = {row.id: (row.source_language or "zh") for row in report_rows}
+    translation_rows = db.execute(
+        text(
+            "SELECT report_id, language_key, title_text, script_text "
+            f"FROM meeting_report_translations WHERE report_id IN ({placeholders})"
+        ),
+        params,
+    ).all()
+    for row in translation_rows:
+        # 原始语种以主表内容为准，避免重复收录。
+        if source_langs.get(row.report_id) == row.language_key:
+            continue
+        docs.append(
+            {
+                "report_id": row.report_id,
+                "language_key": row.language_key,
+                "title": row.title_text or "",
+                "speaker": "",
+                "summary": "",
+                "script": row.script_text or "",
+            }
+        )
+    return docs
+
+
+def index_reports(db: Session, report_ids: list[int]) -> None:
+    """按新闻重建检索文档（原文 + 各语种译文），由调用方提交事务。"""
+    if not search_available() or not report_ids:
+        return
+    ids = sorted({int(x) for x in report_ids})
+    remove_reports(db, ids)
+    docs = _collect_documents(db, ids)
+    if docs:
+        db.execute(
+            text(
+                f"INSERT INTO {SEARCH_TABLE} "
+                "(report_id, language_key, title, speaker, summary, script) "
+                "VALUES (:report_id, :language_key, :title, :speaker, :summary, :script)"
+            ),
+            docs,
+        )
+
+
+def index_report(db: Session, report_id: int) -> None:
+    index_reports(db, [report_id])
+
+
+def remove_reports(db: Session, report_ids: list[int]) -> None:
+    if not search_available() or not report_ids:
+        return
+    params = {f"id_{idx}": rid for idx, rid in enumerate(report_ids)}
+    placeholders = ", ".join(f":{key}" for key in params)
+    db.execute(
+        text(f"DELETE FROM {SEARCH_TABLE} WHERE report_id IN ({placeholders})"),
+        params,
+    )
+
+
+def rebuild_search_index(db: Session, batch_size: int = 500) -> None:
+    if not search_available():
+        return
+    db.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+    last_id = 0
+    while True:
+        ids = [
+            row[0]
+            for row in db.execute(
+                text(
+                    "SELECT id FROM meeting_reports WHERE id > :last_id "
+                    "ORDER BY id LIMIT :limit"
+                ),
+                {"last_id": last_id, "limit": batch_size},
+            ).all()
+        ]
+        if not ids:
+            break
+        index_reports(db, ids)
+        last_id = ids[-1]
+
+
+def _collect_dirty_report_ids(session: Session, _flush_context) -> None:
+    dirty: set[int] = session.info.setdefault("search_dirty_reports", set())
+    for obj in list(session.new) + list(session.deleted):
+        if isinstance(obj, MeetingReport) and obj.id is not None:
+            dirty.add(int(obj.id))
+        elif isinstance(obj, MeetingReportTranslation) and obj.report_id is not None:
+            dirty.add(int(obj.report_id))
+    for obj in session.dirty:
+        if isinstance(obj, MeetingReport) and obj.id is not None:
+            # 播报开关、状态等字段变动不影响检索内容，跳过重建。
+            attrs = inspect(obj).attrs
+            if any(attrs[name].history.has_changes() for name in _INDEXED_REPORT_FIELDS):
+                dirty.add(int(obj.id))
+        elif isinstance(obj, MeetingReportTranslation) and obj.report_id is not None:
+            # 预热、反思任务与 TTS 只写音频及摘要列，不需要重建检索文档。
+            attrs = inspect(obj).attrs
+            if any(
+                attrs[name].history.has_changes()
+                for name in _INDEXED_TRANSLATION_FIELDS
+            ):
+                dirty.add(int(obj.report_id))
+
+
+def _sync_dirty_reports(session: Session) -> None:
+    # before_commit 先于提交时的 flush 触发，这里主动 flush 以收集待写入对象。
+    session.flush()
+    dirty = session.info.pop("search_dirty_reports", None)
+    if dirty:
+        index_reports(session, sorted(dirty))
+
+
+def _discard_dirty_reports(session: Session) -> None:
+    session.info.pop("search_dirty_reports", None)
+
+
+def register_search_sync(session_factory: sessionmaker) -> None:
+    """在会话提交前同步检索表，覆盖新建、编辑、删除与译文写入等 ORM 写路径。
+
+    使用 Core insert() 批量写入的路径需自行调用 index_reports。重复调用不会重复注册。
+    """
+    if event.contains(session_factory, "after_flush", _collect_dirty_report_ids):
+        return
+    event.listen(session_factory, "after_flush", _collect_dirty_report_ids)
+    event.listen(session_factory, "before_commit", _sync_dirty_reports)
+    event.listen(session_factory, "after_rollback", _discard_dirty_reports)
+
+
+def _make_snippet(contents: list[str | None], terms: list[str], width: int = 60) -> str:
+    """从首个包含检索词的字段截取片段，命中词用【】标出，与 FTS5 snippet() 一致。"""
+    fallback = ""
+    for content in contents:
+        flat = re.sub(r"\s+", " ", content or "").strip()
+        if not flat:
+            continue
+        fallback = fallback or flat
+        lower = flat.lower()
+        for term in terms:
+            pos = lower.find(term.lower())
+            if pos < 0:
+                continue
+            start = max(0, pos - width // 3)
+            end = min(len(flat), start + width)
+            piece = flat[:pos][start:] + "【" + flat[pos : pos + len(term)] + "】"
+            piece += flat[pos + len(term) : max(end, pos + len(term))]
+            return ("…" if start else "") + piece + ("…" if end < len(flat) else "")
+    return fallback[:width] + ("…" if len(fallback) > width else "")
+
+
+def search_reports(
+    db: Session, query: str, limit: int = 20, language_key: str | None = None
+) -> list[SearchHit]:
+    """全文检索新闻，按相关度返回每篇新闻的最佳命中（含摘要片段）。"""
+    terms = [t for t in re.split(r"\s+", (query or "").strip()) if t]
+    if not terms or not search_available():
+        return []
+
+    fetch_limit = max(1, limit) * 4
+    params: dict = {"limit": fetch_limit}
+    lang_filter = ""
+    if language_key:
+        params["lang"] = language_key
+        lang_filter = " AND language_key = :lang"
+
+    hits: list[SearchHit] = []
+    if _search_backend["dialect"] == "sqlite":
+        use_match = not _search_backend["trigram"] or all(len(t) >= 3 for t in terms)
+        if use_match:
+            params["q"] = " ".join('"' + t.replace('"', '""') + '"' for t in terms)
+            rows = db.execute(
+                text(
+                    "SELECT report_id, language_key, bm25("
+                    f"{SEARCH_TABLE}, 0, 0, 10.0, 5.0, 1.0, 2.0) AS score, "
+                    f"snippet({SEARCH_TABLE}, -1, '【', '】', '…', 24) AS snippet "
+                    f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH :q{lang_filter} "
+                    "ORDER BY score LIMIT :limit"
+                ),
+                params,
+            ).all()
+            hits = [
+                SearchHit(
+                    report_id=int(row.report_id),
+                    language_key=row.language_key,
+                    score=-float(row.score),
+                    snippet=row.snippet or "",
+                )
+                for row in rows
+            ]
+        else:
+            # trigram 索引无法匹配少于 3 个字符的词，短词回退为检索表内的 LIKE。
+            clauses = []
+            for idx, term in enumerate(terms):
+                params[f"t{idx}"] = f"%{term}%"
+                clauses.append(
+                    f"(title LIKE :t{idx} OR speaker LIKE :t{idx} "
+                    f"OR summary LIKE :t{idx} OR script LIKE :t{idx})"
+                )
+            rows = db.execute(
+                text(
+                    "SELECT report_id, language_key, title, summary, script "
+                    f"FROM {SEARCH_TABLE} WHERE {' AND '.join(clauses)}{lang_filter} "
+                    "LIMIT :limit"
+                ),
+                params,
+            ).all()
+            hits = [
+                SearchHit(
+                    report_id=int(row.report_id),
+                    language_key=row.language_key,
+                    score=(2.0 if any(t in (row.title or "") for t in terms) else 1.0),
+                    snippet=_make_snippet([row.title, row.summary, row.script], terms),
+                )
+                for row in rows
+            ]
+    elif _search_backend["dialect"] == "mysql":
+        params["q"] = " ".join(terms)
+        rows = db.execute(
+            text(
+                "SELECT report_id, language_key, title, "
+                "SUBSTRING(script, 1, 4000) AS script, "
+                "SUBSTRING(summary, 1, 4000) AS summary, "
+                "MATCH(title, speaker, summary, script) AGAINST (:q IN NATURAL LANGUAGE MODE) AS score "
+                f"FROM {SEARCH_TABLE} "
+                "WHERE MATCH(title, speaker, summary, script) AGAINST (:q IN NATURAL LANGUAGE MODE)"
+                f"{lang_filter} ORDER BY score DESC LIMIT :limit"
+            ),
+            params,
+        ).all()
+        hits = [
+            SearchHit(
+                report_id=int(row.report_id),
+                language_key=row.language_key,
+                score=float(row.score or 0),
+                snippet=_make_snippet([row.title, row.summary, row.script], terms),
+            )
+            for row in rows
+        ]
+
+    # 同一新闻可能在多个语种命中，只保留得分最高的一条。
+    best: dict[int, SearchHit] = {}
+    for hit in hits:
+        current = best.get(hit.report_id)
+        if current is None or hit.score > current.score:
+            best[hit.report_id] = hit
+    ranked = sorted(best.values(), key=lambda x: x.score, reverse=True)
+    return ranked[:limit]
@@ -0,0 +1,173 @@
+"""按需 TTS 的合并请求与持久化存储。
+
+/synthesize-audio 以 (文本 SHA-256, 语种, 格式) 为键：
+- 先查 tts_audio_cache 表，命中直接返回（跨 worker、跨重启复用）；
+- 未命中时同一进程内的并发请求只发起一次上游合成，其余等待同一结果（single-flight）；
+- worker 之间再按同一键互斥（MySQL 使用 GET_LOCK，SQLite 使用锁文件，见 process_lock），
+  拿到锁后复查存储，避免多个 worker 重复合成。
+合成结果写入存储，旧记录按 TTS_AUDIO_CACHE_RETENTION_DAYS 定期清理（每写入若干条检查一次）。
+"""
+
+import hashlib
+import logging
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import timedelta
+
+from sqlalchemy import delete
+from sqlalchemy.exc import IntegrityError
+
+from ..config import settings
+from ..database import SessionLocal
+from ..models import TtsAudioCache
+from ..process_lock import keyed_cross_process_lock
+from ..utils.timezone import now_local_naive
+from .generator import (
+    audio_digest,
+    synthesize_script_audio_compressed_base64,
+    synthesize_script_audio_pcm_base64,
+)
+
+logger = logging.getLogger(__name__)
+
+_LOCK_TIMEOUT_SEC = 60
+# 每写入这么多条检查一次过期清理。
+_PRUNE_EVERY = 200
+
+_inflight_lock = threading.Lock()
+_inflight: dict[tuple[str, str, str], Future] = {}
+_stats_lock = threading.Lock()
+_stats = {"store_hits": 0, "coalesced": 0, "synthesized": 0}
+
+
+@dataclass
+class StoredAudio:
+    audio_format: str
+    audio_base64: str
+    audio_bytes: int
+    audio_sha256: str
+
+
+def _text_sha256(script_text: str) -> str:
+    return hashlib.sha256(script_text.strip().encode("utf-8")).hexdigest()
+
+
+def _count(name: str) -> None:
+    with _stats_lock:
+        _stats[name] += 1
+
+
+def find_stored_audio(
+    script_text: str, language_key: str, audio_format: str
+) -> StoredAudio | None:
+    with SessionLocal() as db:
+        row = (
+            db.query(TtsAudioCache)
+            .filter(
+                TtsAudioCache.text_sha256 == _text_sha256(script_text),
+                TtsAudioCache.language_key == language_key,
+                TtsAudioCache.audio_format == audio_format,
+            )
+            .first()
+        )
+        if row is None or not row.audio_base64:
+            return None
+        return StoredAudio(
+            row.audio_format, row.audio_base64, row.audio_bytes, row.audio_sha256
+        )
+
+
+def _save_stored_audio(text_sha256: str, language_key: str, audio: StoredAudio) -> None:
+    db = SessionLocal()
+    try:
+        row = TtsAudioCache(
+            text_sha256=text_sha256,
+            language_key=language_key,
+            audio_format=audio.audio_format,
+            audio_base64=audio.audio_base64,
+            audio_bytes=audio.audio_bytes,
+            audio_sha256=audio.audio_sha256,
+        )
+        db.add(row)
+        db.flush()
+        retention_days = settings.tts_audio_cache_retention_days
+        if retention_days > 0 and row.id % _PRUNE_EVERY == 0:
+            db.execute(
+                delete(TtsAudioCache).where(
+                    TtsAudioCache.created_at
+                    < now_local_naive() - timedelta(days=retention_days)
+                )
+            )
+        db.commit()
+    except IntegrityError:
+        # 其他 worker 已写入同一条，保留先写入的结果。
+        db.rollback()
+    except Exception:
+        db.rollback()
+        logger.exception("save tts audio cache failed")
+    finally:
+        db.close()
+
+
+def _synthesize_and_store(
+    script_text: str, language_key: str, language_label: str, audio_format: str
+) -> StoredAudio:
+    key = (_text_sha256(script_text), language_key, audio_format)
+    with keyed_cross_process_lock("tts", "|".join(key), _LOCK_TIMEOUT_SEC):
+        stored = find_stored_audio(script_text, language_key, audio_format)
+        if stored is not None:
+            _count("store_hits")
+            return stored
+        if audio_format == "pcm":
+            audio_base64 = synthesize_script_audio_pcm_base64(
+                script_text, language_key, language_label
+            )
+        else:
+            audio_format, audio_base64 = synthesize_script_audio_compressed_base64(
+                script_text, language_key, language_label
+            )
+        _count("synthesized")
+        audio_bytes, audio_sha256 = audio_digest(audio_base64)
+        stored = StoredAudio(audio_format, audio_base64, audio_bytes, audio_sha256)
+        _save_stored_audio(key[0], language_key, stored)
+        return stored
+
+
+def synthesize_audio_shared(
+    script_text: str, language_key: str, language_label: str, audio_format: str
+) -> StoredAudio:
+    """返回该文本的合成音频：先查存储，未命中时并发的相同请求只合成一次。"""
+    stored = find_stored_audio(script_text, language_key, audio_format)
+    if stored is not None:
+        _count("store_hits")
+        return stored
+
+    key = (_text_sha256(script_text), language_key, audio_format)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = Future()
+            _inflight[key] = future
+    if not leader:
+        _count("coalesced")
+        return future.result()
+
+    try:
+        result = _synthesize_and_store(
+            script_text, language_key, language_label, audio_format
+        )
+        future.set_result(result)
+        return result
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+def get_tts_store_stats() -> dict:
+    with _stats_lock:
+        return dict(_stats)
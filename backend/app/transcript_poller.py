@@ -0,0 +1,120 @@
+"""会议直播逐字稿轮询。
+
+meeting_live 模式下播放屏只按 since_seq 增量读取已存储的逐字稿段落，
+由这里的后台线程按 TRANSCRIPT_POLL_INTERVAL_SEC 周期拉取当前直播新闻
+（PlaybackRuntimeSetting 选中的新闻）的飞书逐字稿并追加新段落，
+无论有多少块屏幕，每个周期最多一次上游拉取与一次写入。
+连续没有新段落时（会议已结束或暂停）逐步放慢，最长 5 分钟一次；有新段落或切换新闻后恢复。
+多 worker 部署时每轮先非阻塞地获取跨进程锁（见 process_lock），同一时刻只有一个进程拉取。
+"""
+
+import logging
+import threading
+import time
+
+from .config import settings
+from .database import SessionLocal
+from .models import PlaybackRuntimeSetting
+from .process_lock import cross_process_lock
+from .utils.timezone import now_local_naive
+
+logger = logging.getLogger(__name__)
+
+_POLL_LOCK_NAME = "transcript_poll"
+# 连续无新段落时轮询间隔翻倍，最长不超过该值。
+_IDLE_MAX_INTERVAL_SEC = 300
+
+# 新闻 -> (下次拉取的 monotonic 时间, 当前间隔)
+_schedule: dict[int, tuple[float, float]] = {}
+
+_status_lock = threading.Lock()
+_status: dict = {"enabled": False, "runs": 0, "last_run_at": None, "last": {}}
+_stop_event = threading.Event()
+_thread: threading.Thread | None = None
+
+
+def _live_report_id() -> int | None:
+    with SessionLocal() as db:
+        runtime = (
+            db.query(PlaybackRuntimeSetting)
+            .order_by(PlaybackRuntimeSetting.id.asc())
+            .first()
+        )
+        if runtime is None or runtime.mode != "meeting_live":
+            return None
+        return runtime.selected_report_id
+
+
+def run_transcript_poll(interval_sec: int) -> dict:
+    """执行一轮轮询，返回处理结果。"""
+    from .api.reports import sync_live_transcript
+
+    result: dict = {}
+    with cross_process_lock(_POLL_LOCK_NAME) as leader:
+        report_id = _live_report_id() if leader else None
+        if not leader:
+            result["skipped"] = "other worker"
+        elif report_id is None:
+            result["skipped"] = "not live"
+            _schedule.clear()
+        else:
+            for stale_id in [x for x in _schedule if x != report_id]:
+                _schedule.pop(stale_id, None)
+            now = time.monotonic()
+            next_at, interval = _schedule.get(report_id, (now, interval_sec))
+            if now < next_at:
+                result["skipped"] = "not due"
+            else:
+                result["report_id"] = report_id
+                try:
+                    appended = sync_live_transcript(report_id)
+                except Exception as exc:
+                    appended = 0
+                    result["error"] = str(exc)
+                    logger.warning("transcript poll failed: %s", exc)
+                result["appended"] = appended
+                interval = (
+                    interval_sec
+                    if appended
+                    else min(_IDLE_MAX_INTERVAL_SEC, interval * 2)
+                )
+                _schedule[report_id] = (now + interval, interval)
+    with _status_lock:
+        _status["runs"] += 1
+        _status["last_run_at"] = now_local_naive().isoformat()
+        _status["last"] = result
+    return result
+
+
+def _poll_loop(interval_sec: int) -> None:
+    while not _stop_event.wait(interval_sec):
+        try:
+            run_transcript_poll(interval_sec)
+        except Exception:
+            logger.exception("transcript poll failed")
+
+
+def start_transcript_poller() -> None:
+    global _thread
+    interval = settings.transcript_poll_interval_sec
+    if interval <= 0 or not settings.feishu_app_id or not settings.feishu_app_secret:
+        return
+    if _thread is not None and _thread.is_alive():
+        return
+    _stop_event.clear()
+    with _status_lock:
+        _status["enabled"] = True
+        _status["interval_sec"] = interval
+    _thread = threading.Thread(
+        target=_poll_loop, args=(interval,), name="transcript-poller", daemon=True
+    )
+    _thread.start()
+
+
+def stop_transcript_poller() -> None:
+    _stop_event.set()
+
+
+def get_transcript_poller_status() -> dict:
+    with _status_lock:
+        return dict(_status)
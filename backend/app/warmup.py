@@ -0,0 +1,135 @@
+"""就绪预热：/readyz 首次调用时预热数据库连接池、播报队列与 TTS 缓存。
+
+预热只执行一次（并发请求共享结果），每项依赖记录耗时与错误，
+任一依赖失败时 /readyz 返回 503，负载均衡不会把流量导到冷 worker。
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+from sqlalchemy import text
+
+from .database import SessionLocal, engine
+from .models import MeetingReport, MeetingReportTranslation
+
+_warmup_lock = threading.Lock()
+_warmup_state: dict = {"done": False, "ok": False, "checks": {}}
+
+# 预热时同时打开的连接数上限，让连接池在接流量前就有可用连接。
+_WARMUP_MAX_CONNECTIONS = 4
+
+
+def _timed_check(name: str, fn: Callable[[], object], checks: dict) -> bool:
+    started = time.perf_counter()
+    try:
+        detail = fn()
+    except Exception as exc:
+        checks[name] = {
+            "ok": False,
+            "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+            "error": str(exc),
+        }
+        return False
+    checks[name] = {
+        "ok": True,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 1),
+        "detail": detail,
+    }
+    return True
+
+
+def _open_db_pool() -> dict:
+    size_fn = getattr(engine.pool, "size", None)
+    target = max(1, min(size_fn() if callable(size_fn) else 1, _WARMUP_MAX_CONNECTIONS))
+    connections = []
+    try:
+        for _ in range(target):
+            conn = engine.connect()
+            connections.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in connections:
+            conn.close()
+    return {"connections": target}
+
+
+def _check_sqlite_wal() -> dict:
+    if engine.dialect.name != "sqlite":
+        return {"skipped": engine.dialect.name}
+    with engine.connect() as conn:
+        mode = str(conn.exec_driver_sql("PRAGMA journal_mode").scalar() or "")
+    if mode.lower() != "wal" and engine.url.database not in (None, "", ":memory:"):
+        raise RuntimeError(f"SQLite journal_mode 为 {mode}，未启用 WAL")
+    return {"journal_mode": mode}
+
+
+def _prime_playback_queue() -> dict:
+    from .api.reports import get_playback_queue
+
+    with SessionLocal() as db:
+        snapshot = get_playback_queue(
+            report_id=None,
+            include_audio=False,
+            langs=None,
+            audio_format=None,
+            audio_mode=None,
+            current_id=None,
+            since=None,
+            db=db,
+        )
+    return {"items": snapshot.total}
+
+
+def _prime_tts_cache() -> dict:
+    from .services.generator import _TTS_CACHE_MAX, prime_tts_cache
+
+    with SessionLocal() as db:
+        rows = (
+            db.query(
+                MeetingReportTranslation.script_text,
+                MeetingReportTranslation.language_key,
+                MeetingReportTranslation.audio_pcm_base64,
+            )
+            .join(MeetingReport, MeetingReport.id == MeetingReportTranslation.report_id)
+            .filter(
+                MeetingReport.auto_play_enabled.is_(True),
+                MeetingReportTranslation.audio_pcm_base64 != "",
+            )
+            .order_by(MeetingReport.meeting_time.desc(), MeetingReport.id.desc())
+            .limit(_TTS_CACHE_MAX)
+            .all()
+        )
+    primed = prime_tts_cache(
+        [(row.script_text, row.language_key, row.audio_pcm_base64) for row in rows]
+    )
+    return {"entries": primed}
+
+
+def run_warmup() -> dict:
+    """执行一次预热并缓存结果；失败时下次调用会重试。"""
+    if _warmup_state["done"]:
+        return _warmup_state
+    with _warmup_lock:
+        if _warmup_state["done"]:
+            return _warmup_state
+        checks: dict = {}
+        ok = _timed_check("database_pool", _open_db_pool, checks)
+        ok = _timed_check("sqlite_wal", _check_sqlite_wal, checks) and ok
+        ok = _timed_check("playback_queue", _prime_playback_queue, checks) and ok
+        ok = _timed_check("tts_cache", _prime_tts_cache, checks) and ok
+        _warmup_state.update({"done": ok, "ok": ok, "checks": checks})
+    return _warmup_state
+
+
+def _select_one() -> dict:
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    return {}
+
+
+def ping_database() -> dict:
+    """每次 /readyz 都做一次轻量探活，反映当前数据库延迟。"""
+    checks: dict = {}
+    _timed_check("database", _select_one, checks)
+    return checks["database"]
@@ -0,0 +1,265 @@
+"""SQLite 写入串行化。
+
+SQLite 同一时刻只允许一个写事务。后台任务（TTS 预合成、译文刷新）与编辑保存
+争抢写锁时，原先只能靠 busy_timeout 等待，超时后保存接口返回 503。
+
+这里用一把带优先级的写闸门协调进程内的写事务：会话在首次写入（flush、
+INSERT/UPDATE/DELETE 语句或提交）时获取闸门，事务结束时释放。
+- 请求链路的会话以高优先级获取闸门；
+- 后台会话（background_session）以低优先级获取，只在没有请求等待时进入；
+- 后台写入经 run_background_write 交给单一写线程，合并成批量事务提交。
+MySQL 等数据库不启用闸门，run_background_write 直接在调用线程执行。
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from contextlib import contextmanager
+from typing import TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction
+
+from .database import DATABASE_URL, SessionLocal
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SERIALIZE_WRITES = DATABASE_URL.startswith("sqlite")
+# 单批最多合并的后台写入数，避免一个批次占用写锁过久。
+_WRITER_BATCH_MAX = 32
+# 请求持续占用时，后台写入最多让路的时长，防止饿死。
+_BACKGROUND_MAX_YIELD_SEC = 5.0
+# 请求等待闸门的上限，与 busy_timeout 一致；超时后不再等待，交由 SQLite 自身加锁。
+_REQUEST_MAX_WAIT_SEC = 30.0
+# 后台等待闸门的上限：持有方泄漏会话时不至于永久阻塞，超时后同样交由 SQLite 加锁。
+_BACKGROUND_MAX_WAIT_SEC = 120.0
+_LOCKED_RETRY_COUNT = 3
+_LOCKED_RETRY_BACKOFF_SEC = 0.2
+
+
+class _WriteGate:
+    """进程内写闸门：请求写入优先，后台写入在无请求等待时进入。
+
+    同一线程已持有闸门时再次获取（嵌套会话）直接返回 False，由外层负责释放。
+    """
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._held = False
+        self._owner: int | None = None
+        self._waiting_requests = 0
+
+    def held_by_current_thread(self) -> bool:
+        with self._cond:
+            return self._held and self._owner == threading.get_ident()
+
+    def acquire(self, background: bool) -> bool:
+        with self._cond:
+            if self._held and self._owner == threading.get_ident():
+                return False
+            if background:
+                started = time.monotonic()
+                yield_deadline = started + _BACKGROUND_MAX_YIELD_SEC
+                deadline = started + _BACKGROUND_MAX_WAIT_SEC
+                while self._held or (
+                    self._waiting_requests and time.monotonic() < yield_deadline
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        logger.warning("background write gate wait timed out")
+                        return False
+                    self._cond.wait(timeout=min(0.05, remaining))
+            else:
+                deadline = time.monotonic() + _REQUEST_MAX_WAIT_SEC
+                self._waiting_requests += 1
+                try:
+                    while self._held:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            return False
+                        self._cond.wait(timeout=remaining)
+                finally:
+                    self._waiting_requests -= 1
+            self._held = True
+            self._owner = threading.get_ident()
+            return True
+
+    def release(self) -> None:
+        with self._cond:
+            self._held = False
+            self._owner = None
+            self._cond.notify_all()
+
+
+_gate = _WriteGate()
+_GATE_INFO_KEY = "write_gate_held"
+_BACKGROUND_INFO_KEY = "background_writer"
+_WRITE_SQL_PREFIXES = ("insert", "update", "delete", "replace")
+
+
+def _acquire_gate(session: Session) -> None:
+    if session.info.get(_GATE_INFO_KEY):
+        return
+    if _gate.acquire(background=bool(session.info.get(_BACKGROUND_INFO_KEY))):
+        session.info[_GATE_INFO_KEY] = True
+
+
+def _acquire_gate_before_flush(session: Session, _flush_context, _instances) -> None:
+    _acquire_gate(session)
+
+
+def _acquire_gate_on_write_statement(state: ORMExecuteState) -> None:
+    if state.is_select:
+        return
+    if not (state.is_insert or state.is_update or state.is_delete):
+        # text() 语句：按语句开头判断是否为写入。
+        sql = str(state.statement).lstrip().lower()
+        if not sql.startswith(_WRITE_SQL_PREFIXES):
+            return
+    _acquire_gate(state.session)
+
+
+def _release_gate_after_transaction(
+    session: Session, transaction: SessionTransaction
+) -> None:
+    if transaction.parent is not None or not session.info.pop(_GATE_INFO_KEY, False):
+        return
+    _gate.release()
+
+
+def register_write_gate(session_factory) -> None:
+    """为会话工厂注册写闸门（仅 SQLite）；重复调用不会重复注册。"""
+    if not SERIALIZE_WRITES:
+        return
+    if event.contains(session_factory, "before_commit", _acquire_gate):
+        return
+    # 先于其他 before_commit 监听注册，确保提交阶段的写入（如检索表同步）已持有闸门。
+    event.listen(session_factory, "before_commit", _acquire_gate, insert=True)
+    event.listen(session_factory, "before_flush", _acquire_gate_before_flush)
+    event.listen(session_factory, "do_orm_execute", _acquire_gate_on_write_statement)
+    event.listen(
+        session_factory, "after_transaction_end", _release_gate_after_transaction
+    )
+
+
+def background_session() -> Session:
+    """后台任务使用的会话：提交时以低优先级获取写闸门，让路给编辑保存。"""
+    return SessionLocal(info={_BACKGROUND_INFO_KEY: True})
+
+
+@contextmanager
+def background_write_lock():
+    """以后台优先级持有写闸门，供检查点、ANALYZE 等不经会话的维护操作使用。"""
+    acquired = SERIALIZE_WRITES and _gate.acquire(background=True)
+    try:
+        yield
+    finally:
+        if acquired:
+            _gate.release()
+
+
+class _WriteTask:
+    __slots__ = ("fn", "future")
+
+    def __init__(self, fn: Callable[[Session], object]) -> None:
+        self.fn = fn
+        self.future: Future = Future()
+
+
+_write_queue: "queue.Queue[_WriteTask]" = queue.Queue()
+_writer_lock = threading.Lock()
+_writer_thread: threading.Thread | None = None
+
+
+def _is_locked_error(exc: Exception) -> bool:
+    return isinstance(exc, OperationalError) and "locked" in str(exc).lower()
+
+
+def _commit_tasks(tasks: list[_WriteTask]) -> list[object]:
+    for attempt in range(_LOCKED_RETRY_COUNT):
+        db = background_session()
+        try:
+            results = [task.fn(db) for task in tasks]
+            db.commit()
+            return results
+        except Exception as exc:
+            db.rollback()
+            if not _is_locked_error(exc) or attempt == _LOCKED_RETRY_COUNT - 1:
+                raise
+            time.sleep(_LOCKED_RETRY_BACKOFF_SEC * (attempt + 1))
+        finally:
+            db.close()
+    return []
+
+
+def _run_batch(tasks: list[_WriteTask]) -> None:
+    try:
+        results = _commit_tasks(tasks)
+    except Exception:
+        if len(tasks) == 1:
+            raise
+        # 批量提交失败时逐条重试，把错误隔离到具体任务。
+        for task in tasks:
+            try:
+                task.future.set_result(_commit_tasks([task])[0])
+            except Exception as exc:
+                task.future.set_exception(exc)
+        return
+    for task, result in zip(tasks, results):
+        task.future.set_result(result)
+
+
+def _writer_loop() -> None:
+    while True:
+        tasks = [_write_queue.get()]
+        while len(tasks) < _WRITER_BATCH_MAX:
+            try:
+                tasks.append(_write_queue.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _run_batch(tasks)
+        except Exception as exc:
+            tasks[0].future.set_exception(exc)
+            logger.exception("background write failed")
+
+
+def _ensure_writer_thread() -> None:
+    global _writer_thread
+    with _writer_lock:
+        if _writer_thread is None or not _writer_thread.is_alive():
+            _writer_thread = threading.Thread(
+                target=_writer_loop, name="sqlite-writer", daemon=True
+            )
+            _writer_thread.start()
+
+
+def run_background_write(fn: Callable[[Session], T]) -> T:
+    """把后台任务的一段写操作交给写线程执行并等待结果。
+
+    fn 接收写线程的会话，只做数据库读写（不要在其中调用外部服务），
+    不需要自行 commit。SQLite 下多个后台写入会合并到同一事务批量提交。
+    调用线程已持有写闸门时直接在本线程执行，避免与写线程互相等待。
+    """
+    if not SERIALIZE_WRITES or _gate.held_by_current_thread():
+        db = SessionLocal()
+        try:
+            result = fn(db)
+            db.commit()
+            return result
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    _ensure_writer_thread()
+    task = _WriteTask(fn)
+    _write_queue.put(task)
+    return task.future.result()
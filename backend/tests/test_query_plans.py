@@ -0,0 +1,170 @@
+"""热点查询的 SQLite 执行计划回归测试。
+
+在临时 SQLite 库上按模型建表，执行接口实际发出的查询，
+断言 EXPLAIN QUERY PLAN 命中 models 中为这些查询声明的索引。
+"""
+
+import sys
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.api.reports import (  # noqa: E402
+    _set_highlights,
+    get_latest_published,
+    get_playback_queue,
+    list_reports,
+)
+from app.database import Base  # noqa: E402
+from app.models import MeetingReport  # noqa: E402
+from app.utils.timezone import now_local_naive  # noqa: E402
+
+
+@pytest.fixture()
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'plans.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def db(engine):
+    session = sessionmaker(bind=engine, autoflush=False)()
+    now = now_local_naive()
+    for idx in range(3):
+        session.add(
+            MeetingReport(
+                title=f"新闻{idx}",
+                meeting_time=now - timedelta(hours=idx),
+                speaker="主持人",
+                summary_raw="会议总结",
+                script_final="口播稿",
+                status="published" if idx else "draft",
+                published_at=now - timedelta(hours=idx) if idx else None,
+                auto_play_enabled=True,
+                source_type="feishu_meeting",
+                source_meeting_id=f"meeting-{idx}",
+                source_minute_token=f"token-{idx}",
+            )
+        )
+    session.commit()
+    yield session
+    session.close()
+
+
+def _query_plans(engine, db, fn, table: str) -> list[str]:
+    """执行 fn，返回其间所有读取 table 的 SELECT 的执行计划文本。"""
+    statements: list[tuple[str, object]] = []
+
+    def _capture(_conn, _cursor, statement, parameters, _context, _executemany):
+        if statement.lstrip().upper().startswith("SELECT") and table in statement:
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _capture)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", _capture)
+    assert statements, f"未捕获到读取 {table} 的查询"
+
+    raw = db.connection().connection.driver_connection
+    plans = []
+    for statement, parameters in statements:
+        rows = raw.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+        plans.append("\n".join(str(row[-1]) for row in rows))
+    return plans
+
+
+def _assert_uses_index(plans: list[str], index_name: str) -> None:
+    assert any(index_name in plan for plan in plans), "\n---\n".join(plans)
+
+
+def test_list_reports_uses_time_index(engine, db):
+    plans = _query_plans(
+        engine,
+        db,
+        lambda: list_reports(page=1, page_size=20, status=None, cursor="", db=db),
+        "meeting_reports",
+    )
+    _assert_uses_index(plans, "ix_meeting_reports_time")
+
+
+def test_list_reports_by_status_uses_status_index(engine, db):
+    plans = _query_plans(
+        engine,
+        db,
+        lambda: list_reports(
+            page=1, page_size=20, status="published", cursor=None, db=db
+        ),
+        "meeting_reports",
+    )
+    _assert_uses_index(plans, "ix_meeting_reports_status_time")
+
+
+def test_playback_queue_uses_autoplay_index(engine, db):
+    plans = _query_plans(
+        engine,
+        db,
+        lambda: get_playback_queue(
+            include_audio=False,
+            langs=None,
+            report_id=None,
+            audio_format=None,
+            audio_mode=None,
+            current_id=None,
+            since=None,
+            db=db,
+        ),
+        "meeting_reports",
+    )
+    _assert_uses_index(plans, "ix_meeting_reports_autoplay_time")
+
+
+def test_latest_published_uses_published_index(engine, db):
+    plans = _query_plans(
+        engine, db, lambda: get_latest_published(db=db), "meeting_reports"
+    )
+    _assert_uses_index(plans, "ix_meeting_reports_status_published")
+
+
+def test_feishu_idempotency_lookups_use_indexes(engine, db):
+    # 与飞书会议导入中的幂等查询一致：先按妙记 token，再按 (来源, 会议 ID)。
+    plans = _query_plans(
+        engine,
+        db,
+        lambda: db.query(MeetingReport)
+        .filter(MeetingReport.source_minute_token == "token-1")
+        .first(),
+        "meeting_reports",
+    )
+    _assert_uses_index(plans, "ix_meeting_reports_minute_token")
+
+    plans = _query_plans(
+        engine,
+        db,
+        lambda: db.query(MeetingReport)
+        .filter(
+            MeetingReport.source_type == "feishu_meeting",
+            MeetingReport.source_meeting_id == "meeting-1",
+        )
+        .first(),
+        "meeting_reports",
+    )
+    _assert_uses_index(plans, "ix_meeting_reports_source_meeting")
+
+
+def test_highlight_lookup_uses_report_kind_seq_index(engine, db):
+    report_id = db.query(MeetingReport.id).first().id
+    plans = _query_plans(
+        engine,
+        db,
+        lambda: _set_highlights(db, report_id, "final", ["亮点一", "亮点二"]),
+        "meeting_report_highlights",
+    )
+    _assert_uses_index(plans, "ix_highlights_report_kind_seq")
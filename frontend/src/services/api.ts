@@ -49,6 +49,11 @@ export interface PlaybackQueueItem {
       render_mode?: 'text' | 'audio';
       audio_ready?: boolean;
       audio_pcm_base64?: string;
+      /** 协商得到的音频格式；为 opus/mp3 时音频在 audio_base64 中 */
+      audio_format?: AudioFormat | '';
+      audio_base64?: string;
+      /** audio_mode=ref 时返回的音频引用，按需调用 fetchAudioRef 拉取 */
+      audio_ref?: AudioRef | null;
     }
   >;
 }
@@ -87,12 +92,27 @@ export interface FeishuLiveRecordItem {
   timestamp: string;
   speaker: string;
   content: string;
+  /** 逐字稿段落序号，仅 feishu_transcript 来源有值 */
+  seq?: number | null;
+}
+
+export type AudioFormat = 'pcm' | 'opus' | 'mp3';
+
+export interface AudioRef {
+  report_id: number;
+  language_key: string;
+  audio_format: AudioFormat;
+  url: string;
+  bytes: number;
+  sha256: string;
 }
 
 export interface ReflectionItem {
   text: string;
   /** 该语言的预合成音频，后端已合成时才有值 */
   audio_pcm_base64?: string | null;
+  audio_format?: AudioFormat | null;
+  audio_base64?: string | null;
 }
 
 export interface QuestionItem {
@@ -149,16 +169,37 @@ async function request<T>(path: string, init?: RequestInit): Promise<T> {
   return resp.json() as Promise<T>;
 }
 
-export async function listReports(page = 1, pageSize = 20, status?: string) {
+export async function listReports(page = 1, pageSize = 20, status?: string, cursor?: string | null) {
   const params = new URLSearchParams();
   params.set('page', String(page));
   params.set('page_size', String(pageSize));
   if (status) params.set('status', status);
-  return request<{ items: ReportListItem[]; total: number; page: number; page_size: number }>(
+  // 传入 cursor（首页传空字符串）时走游标分页，total 为近似值。
+  if (cursor !== undefined && cursor !== null) params.set('cursor', cursor);
+  return request<{ items: ReportListItem[]; total: number; page: number; page_size: number; next_cursor?: string | null }>(
     `/api/reports?${params.toString()}`,
   );
 }
 
+export interface ReportSearchItem {
+  id: number;
+  title: string;
+  speaker: string;
+  meeting_time: string;
+  status: string;
+  language_key: string;
+  snippet: string;
+  score: number;
+}
+
+export async function searchReports(q: string, limit = 20, languageKey?: string) {
+  const params = new URLSearchParams();
+  params.set('q', q);
+  params.set('limit', String(limit));
+  if (languageKey) params.set('language_key', languageKey);
+  return request<{ query: string; total: number; items: ReportSearchItem[] }>(`/api/reports/search?${params.toString()}`);
+}
+
 export async function getReport(id: number) {
   return request<ReportDetail>(`/api/reports/${id}`);
 }
@@ -254,8 +295,8 @@ export async function translateScript(payload: { script_text: string; target_lan
   });
 }
 
-export async function synthesizeScriptAudio(payload: { script_text: string; language_key: string }) {
-  return request<{ language_key: string; audio_pcm_base64: string }>('/api/reports/synthesize-audio', {
+export async function synthesizeScriptAudio(payload: { script_text: string; language_key: string; audio_format?: string }) {
+  return request<{ language_key: string; audio_pcm_base64: string; audio_format?: AudioFormat; audio_base64?: string }>('/api/reports/synthesize-audio', {
     method: 'POST',
     body: JSON.stringify(payload),
   });
@@ -347,9 +388,14 @@ export async function updateReportTranslation(
   });
 }
 
-export async function getReportReflection(id: number, lang?: string) {
-  const params = lang ? `?lang=${encodeURIComponent(lang)}` : '';
-  return request<{ report_id: number; reflections: ReflectionItem[] }>(`/api/reports/${id}/reflection${params}`);
+export async function getReportReflection(id: number, lang?: string, audioFormats?: AudioFormat[]) {
+  const params = new URLSearchParams();
+  if (lang) params.set('lang', lang);
+  if (audioFormats?.length) params.set('audio_format', audioFormats.join(','));
+  const query = params.toString();
+  return request<{ report_id: number; reflections: ReflectionItem[] }>(
+    query ? `/api/reports/${id}/reflection?${query}` : `/api/reports/${id}/reflection`,
+  );
 }
 
 export async function getReportQuestions(id: number, options?: { lang?: string; persona?: string }) {
@@ -361,14 +407,43 @@ export async function getReportQuestions(id: number, options?: { lang?: string;
   return request<{ report_id: number; persona: string; questions: QuestionItem[] }>(path);
 }
 
-export async function getPlaybackQueue(options?: { includeAudio?: boolean; langs?: string[]; reportId?: number }) {
+export async function getPlaybackQueue(options?: {
+  includeAudio?: boolean;
+  langs?: string[];
+  reportId?: number;
+  audioFormats?: AudioFormat[];
+  audioMode?: 'inline' | 'ref';
+  currentId?: number;
+  /** 上次响应的 version；传入后只返回变动条目与 deleted_ids，full=true 时需整表替换 */
+  since?: number;
+}) {
   const params = new URLSearchParams();
   if (options?.includeAudio) params.set('include_audio', 'true');
   if (options?.langs?.length) params.set('langs', options.langs.join(','));
+  if (options?.audioFormats?.length) params.set('audio_format', options.audioFormats.join(','));
+  if (options?.audioMode) params.set('audio_mode', options.audioMode);
+  if (options?.currentId) params.set('current_id', String(options.currentId));
+  if (options?.since !== undefined) params.set('since', String(options.since));
   if (options?.reportId) params.set('report_id', String(options.reportId));
   const query = params.toString();
   const path = query ? `/api/reports/playback/queue?${query}` : '/api/reports/playback/queue';
-  return request<{ items: PlaybackQueueItem[]; total: number }>(path);
+  return request<{
+    items: PlaybackQueueItem[];
+    total: number;
+    prefetch?: AudioRef[];
+    version?: number;
+    full?: boolean;
+    deleted_ids?: number[];
+  }>(path);
+}
+
+export async function fetchAudioRef(ref: AudioRef): Promise<ArrayBuffer> {
+  // URL 带内容版本，浏览器缓存命中后不会重复下载。
+  const resp = await fetch(API_BASE ? `${API_BASE}${ref.url}` : ref.url);
+  if (!resp.ok) {
+    throw new Error(`音频拉取失败: ${resp.status}`);
+  }
+  return resp.arrayBuffer();
 }
 
 export async function getPlaybackMode() {
@@ -386,13 +461,19 @@ export async function updatePlaybackMode(payload: {
   });
 }
 
-export async function getFeishuLiveRecords(limit = 12, reportId?: number | null) {
+export async function getFeishuLiveRecords(limit = 12, reportId?: number | null, sinceSeq?: number | null) {
   const query = new URLSearchParams();
   query.set('limit', String(limit));
   if (reportId && reportId > 0) {
     query.set('report_id', String(reportId));
   }
-  return request<{ source: string; records: FeishuLiveRecordItem[] }>(`/api/playback/live-records?${query.toString()}`);
+  // 传入上次返回的 next_seq 时只拉取新增逐字稿段落。
+  if (sinceSeq !== undefined && sinceSeq !== null) {
+    query.set('since_seq', String(sinceSeq));
+  }
+  return request<{ source: string; records: FeishuLiveRecordItem[]; next_seq?: number | null }>(
+    `/api/playback/live-records?${query.toString()}`,
+  );
 }
 
 export async function getAvatarToken() {
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""JSON 序列化与响应压缩基准：按接口对比响应字节数与序列化耗时。
+
+对运行中的后端逐个拉取接口的未压缩 JSON，再在本地分别用标准库 json 与 orjson
+序列化、用 gzip / brotli 压缩，输出每个接口的字节数与耗时。
+
+用法（先启动后端）：
+  python scripts/bench-json-compression.py --base-url http://127.0.0.1:8000 --rounds 20
+
+除标准库外 orjson / brotli 均为可选，未安装的项目会跳过。
+"""
+
+import argparse
+import gzip
+import json
+import statistics
+import time
+import urllib.request
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+DEFAULT_PATHS = [
+    "/api/reports/playback/queue",
+    "/api/reports/playback/queue?include_audio=true",
+    "/api/reports?page=1&page_size=20",
+]
+
+
+def _fetch_json(url: str, timeout: float) -> object:
+    request = urllib.request.Request(url, headers={"Accept-Encoding": "identity"})
+    with urllib.request.urlopen(request, timeout=timeout) as resp:
+        return json.loads(resp.read())
+
+
+def _median_ms(fn, rounds: int) -> tuple[float, bytes]:
+    samples = []
+    output = b""
+    for _ in range(rounds):
+        started = time.perf_counter()
+        output = fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), output
+
+
+def _bench_payload(payload: object, rounds: int, gzip_level: int, brotli_quality: int) -> list[tuple[str, int, float]]:
+    rows = []
+    stdlib_ms, raw = _median_ms(
+        lambda: json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8"),
+        rounds,
+    )
+    rows.append(("json", len(raw), stdlib_ms))
+    if orjson is not None:
+        orjson_ms, raw = _median_ms(lambda: orjson.dumps(payload), rounds)
+        rows.append(("orjson", len(raw), orjson_ms))
+    gzip_ms, body = _median_ms(lambda: gzip.compress(raw, compresslevel=gzip_level), rounds)
+    rows.append((f"gzip-{gzip_level}", len(body), gzip_ms))
+    if brotli is not None:
+        br_ms, body = _median_ms(lambda: brotli.compress(raw, quality=brotli_quality), rounds)
+        rows.append((f"br-{brotli_quality}", len(body), br_ms))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="gmwAvatar JSON 序列化与压缩基准")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--gzip-level", type=int, default=5)
+    parser.add_argument("--brotli-quality", type=int, default=4)
+    parser.add_argument("--path", action="append", help="测试路径，可重复指定")
+    args = parser.parse_args()
+
+    base_url = args.base_url.rstrip("/")
+    for path in args.path or DEFAULT_PATHS:
+        try:
+            payload = _fetch_json(f"{base_url}{path}", args.timeout)
+        except Exception as exc:
+            print(f"{path}: 拉取失败 {exc}")
+            continue
+        print(path)
+        rows = _bench_payload(payload, args.rounds, args.gzip_level, args.brotli_quality)
+        baseline = rows[0][1] or 1
+        for name, size, ms in rows:
+            print(f"  {name:<10} {size:>12,d} B  {size / baseline:6.1%}  {ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""连接池压测：对运行中的后端并发请求，输出吞吐、延迟分位与连接池等待统计。
+
+用法（先启动后端，MySQL 与 SQLite 各跑一次对比）：
+  python scripts/load-test-db-pool.py --base-url http://127.0.0.1:8000 --concurrency 40 --requests 2000
+
+仅依赖标准库。连接池统计取自 /readyz 返回的 db_pool 字段。
+"""
+
+import argparse
+import json
+import statistics
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_PATHS = [
+    "/api/reports?page=1&page_size=20",
+    "/api/reports/playback/queue",
+    "/api/playback/live-records?limit=12",
+]
+
+
+def _get(url: str, timeout: float) -> tuple[int, float]:
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            resp.read()
+            status = resp.status
+    except urllib.error.HTTPError as exc:
+        status = exc.code
+    except Exception:
+        status = 0
+    return status, (time.perf_counter() - started) * 1000
+
+
+def _pool_stats(base_url: str) -> dict:
+    try:
+        with urllib.request.urlopen(f"{base_url}/readyz", timeout=30) as resp:
+            return json.loads(resp.read()).get("db_pool", {})
+    except urllib.error.HTTPError as exc:
+        return json.loads(exc.read() or b"{}").get("db_pool", {})
+    except Exception:
+        return {}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="gmwAvatar 后端连接池压测")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--concurrency", type=int, default=40)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--path", action="append", help="压测路径，可重复指定")
+    args = parser.parse_args()
+
+    base_url = args.base_url.rstrip("/")
+    paths = args.path or DEFAULT_PATHS
+    urls = [f"{base_url}{paths[i % len(paths)]}" for i in range(args.requests)]
+
+    before = _pool_stats(base_url)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        results = list(executor.map(lambda u: _get(u, args.timeout), urls))
+    elapsed = time.perf_counter() - started
+    after = _pool_stats(base_url)
+
+    latencies = sorted(ms for _, ms in results)
+    errors = sum(1 for status, _ in results if status != 200)
+    if len(latencies) > 1:
+        quantiles = statistics.quantiles(latencies, n=100)
+    else:
+        quantiles = latencies * 99
+    print(f"并发 {args.concurrency}，请求 {args.requests}，耗时 {elapsed:.2f}s")
+    print(f"吞吐 {args.requests / elapsed:.1f} req/s，失败 {errors}")
+    print(
+        f"延迟 p50 {quantiles[49]:.1f}ms / p95 {quantiles[94]:.1f}ms / "
+        f"p99 {quantiles[98]:.1f}ms / max {latencies[-1]:.1f}ms"
+    )
+    if after:
+        checkouts = after.get("checkouts", 0) - before.get("checkouts", 0)
+        print(
+            f"连接池：size {after.get('pool_size')}，本轮借出 {checkouts} 次，"
+            f"慢借出 {after.get('slow_checkouts', 0) - before.get('slow_checkouts', 0)} 次，"
+            f"超时 {after.get('timeouts', 0) - before.get('timeouts', 0)} 次，"
+            f"最大等待 {after.get('wait_max_ms')}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()